@@ -15,6 +15,9 @@ from app.models import (
     comment,
     attachment,
     notification,
+    project_task_stats,
+    organization_task_rollup,
+    project_status_snapshot,
 )
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,31 @@
+"""add_task_keyset_indexes
+
+Revision ID: 5e2b7c40d18f
+Revises: a3c91e5d7b20
+Create Date: 2026-10-16 10:03:27.518842
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2b7c40d18f'
+down_revision: Union[str, None] = 'a3c91e5d7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination: WHERE <owner> = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+    op.create_index('idx_tasks_project_created_id', 'tasks', ['project_id', 'created_at', 'id'], unique=False)
+    op.create_index('idx_tasks_assignee_created_id', 'tasks', ['assignee_id', 'created_at', 'id'], unique=False)
+    op.create_index('idx_tasks_creator_created_id', 'tasks', ['creator_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tasks_creator_created_id', table_name='tasks')
+    op.drop_index('idx_tasks_assignee_created_id', table_name='tasks')
+    op.drop_index('idx_tasks_project_created_id', table_name='tasks')
@@ -0,0 +1,34 @@
+"""add_project_status_snapshots
+
+Revision ID: 7a5d3e91c2f6
+Revises: e4f2a87c3b19
+Create Date: 2026-10-16 14:02:55.307419
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a5d3e91c2f6'
+down_revision: Union[str, None] = 'e4f2a87c3b19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('project_status_snapshots',
+    sa.Column('project_id', sa.UUID(), nullable=False),
+    sa.Column('status', postgresql.ENUM('TODO', 'IN_PROGRESS', 'DONE', name='taskstatusenum', create_type=False), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('task_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'status', 'day')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('project_status_snapshots')
@@ -0,0 +1,39 @@
+"""add_project_task_stats
+
+Revision ID: 9b4d1f6e2a37
+Revises: 5e2b7c40d18f
+Create Date: 2026-10-16 11:20:54.306179
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d1f6e2a37'
+down_revision: Union[str, None] = '5e2b7c40d18f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('project_task_stats',
+    sa.Column('project_id', sa.UUID(), nullable=False),
+    sa.Column('status', postgresql.ENUM('TODO', 'IN_PROGRESS', 'DONE', name='taskstatusenum', create_type=False), nullable=False),
+    sa.Column('priority', postgresql.ENUM('LOW', 'MEDIUM', 'HIGH', name='taskpriorityenum', create_type=False), nullable=False),
+    sa.Column('task_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('project_id', 'status', 'priority')
+    )
+    # Backfill from existing tasks
+    op.execute(
+        "INSERT INTO project_task_stats (project_id, status, priority, task_count) "
+        "SELECT project_id, status, priority, count(id) FROM tasks GROUP BY project_id, status, priority"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('project_task_stats')
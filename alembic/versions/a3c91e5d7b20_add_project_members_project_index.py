@@ -0,0 +1,27 @@
+"""add_project_members_project_index
+
+Revision ID: a3c91e5d7b20
+Revises: cfd5e70dd177
+Create Date: 2026-10-16 09:12:41.204113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5d7b20'
+down_revision: Union[str, None] = 'cfd5e70dd177'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Primary key is (user_id, project_id); membership lookups are project-first
+    op.create_index('idx_project_members_project_user', 'project_members', ['project_id', 'user_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_project_members_project_user', table_name='project_members')
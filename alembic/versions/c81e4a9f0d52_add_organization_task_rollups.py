@@ -0,0 +1,47 @@
+"""add_organization_task_rollups
+
+Revision ID: c81e4a9f0d52
+Revises: 9b4d1f6e2a37
+Create Date: 2026-10-16 12:05:13.748201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e4a9f0d52'
+down_revision: Union[str, None] = '9b4d1f6e2a37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('organization_task_rollups',
+    sa.Column('organization_id', sa.UUID(), nullable=False),
+    sa.Column('project_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('status', postgresql.ENUM('TODO', 'IN_PROGRESS', 'DONE', name='taskstatusenum', create_type=False), nullable=False),
+    sa.Column('priority', postgresql.ENUM('LOW', 'MEDIUM', 'HIGH', name='taskpriorityenum', create_type=False), nullable=False),
+    sa.Column('task_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('organization_id', 'project_id', 'day', 'status', 'priority')
+    )
+    # Deleting a project's rows during a refresh filters by project_id
+    op.create_index('idx_org_task_rollups_project_id', 'organization_task_rollups', ['project_id'], unique=False)
+    # Backfill from existing tasks
+    op.execute(
+        "INSERT INTO organization_task_rollups (organization_id, project_id, day, status, priority, task_count) "
+        "SELECT p.organization_id, t.project_id, CAST(t.created_at AS DATE), t.status, t.priority, count(t.id) "
+        "FROM tasks t JOIN projects p ON p.id = t.project_id "
+        "GROUP BY p.organization_id, t.project_id, CAST(t.created_at AS DATE), t.status, t.priority"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_org_task_rollups_project_id', table_name='organization_task_rollups')
+    op.drop_table('organization_task_rollups')
@@ -0,0 +1,30 @@
+"""add_open_task_due_date_index
+
+Revision ID: e4f2a87c3b19
+Revises: c81e4a9f0d52
+Create Date: 2026-10-16 13:21:40.162935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f2a87c3b19'
+down_revision: Union[str, None] = 'c81e4a9f0d52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Overdue lookups: WHERE project_id = ? AND due_date < ? AND status <> 'DONE'
+    op.create_index(
+        'idx_tasks_open_project_due', 'tasks', ['project_id', 'due_date'], unique=False,
+        postgresql_where=sa.text("status <> 'DONE'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tasks_open_project_due', table_name='tasks')
@@ -5,6 +5,24 @@ from pydantic import Field, validator
 class Settings(BaseSettings):
     # Database
     database_url: str = Field(..., env="database_url")
+    # Async driver URL; derived from database_url (postgresql+asyncpg) when not set
+    async_database_url: Optional[str] = Field(default=None, env="async_database_url")
+
+    # Connection pool (applied to each engine, so size workers * engines against max_connections)
+    db_pool_size: int = Field(default=5, env="db_pool_size")
+    db_max_overflow: int = Field(default=10, env="db_max_overflow")
+    db_pool_timeout: int = Field(default=30, env="db_pool_timeout")  # seconds to wait for a checkout
+    db_pool_recycle: int = Field(default=1800, env="db_pool_recycle")  # seconds, -1 disables
+    db_pool_pre_ping: bool = Field(default=True, env="db_pool_pre_ping")
+
+    # Read replicas: comma-separated URLs; empty means every read goes to the primary
+    database_replica_urls: str = Field(default="", env="database_replica_urls")
+    replica_sticky_seconds: int = Field(default=5, env="replica_sticky_seconds")  # read-your-writes window
+
+    # Authenticated principal cache (get_current_user)
+    principal_cache_ttl: int = Field(default=300, env="principal_cache_ttl")  # Redis, 5 minutes
+    principal_local_cache_ttl: int = Field(default=10, env="principal_local_cache_ttl")  # in-process LRU
+    principal_local_cache_size: int = Field(default=1024, env="principal_local_cache_size")
     
     # Redis Configuration
     redis_host: str = Field(default="redis", env="redis_host")
@@ -12,8 +30,21 @@ class Settings(BaseSettings):
     redis_db: int = Field(default=0, env="redis_db")
     redis_password: Optional[str] = Field(default=None, env="redis_password")
     notification_ttl: int = Field(default=2592002, env="notification_ttl")
+    notification_max_per_user: int = Field(default=500, env="notification_max_per_user")  # older ones are trimmed
+    notification_coalesce_window_seconds: int = Field(default=600, env="notification_coalesce_window_seconds")  # 0 disables merging
+    notification_digest_types: str = Field(default="", env="notification_digest_types")  # comma separated, sent as periodic digests
     task_cache_expiration: int = Field(default=300, env="task_cache_expiration")  # 5 minutes
     report_cache_ttl: int = Field(default=3600, env="report_cache_ttl")  # 1 hour
+    membership_cache_ttl: int = Field(default=600, env="membership_cache_ttl")  # 10 minutes
+    cache_stale_ttl: int = Field(default=60, env="cache_stale_ttl")  # serve stale while one caller refreshes
+    cache_lock_timeout_ms: int = Field(default=10000, env="cache_lock_timeout_ms")  # single-flight recompute lock
+    report_warm_delay_seconds: int = Field(default=5, env="report_warm_delay_seconds")  # quiet time after the last write
+    report_warm_concurrency: int = Field(default=4, env="report_warm_concurrency")  # projects warmed in parallel
+    notification_queue_maxlen: int = Field(default=100000, env="notification_queue_maxlen")  # approximate stream cap
+    notification_worker_max_attempts: int = Field(default=5, env="notification_worker_max_attempts")  # then dead-lettered
+    notification_worker_retry_idle_ms: int = Field(default=30000, env="notification_worker_retry_idle_ms")  # unacked entries retried after
+    notification_stream_keepalive_seconds: int = Field(default=15, env="notification_stream_keepalive_seconds")  # SSE comment when idle
+    notification_stream_queue_size: int = Field(default=100, env="notification_stream_queue_size")  # pushes buffered per connection
 
     # JWT
     secret_key: str = Field(..., env="secret_key")
@@ -30,6 +61,10 @@ class Settings(BaseSettings):
     max_file_size: int = Field(default=5242880, env="max_file_size")  # 5MB
     max_files_per_task: int = Field(default=3, env="max_files_per_task")
     upload_dir: str = Field(default="uploads", env="upload_dir")
+
+    # Analytics export (Parquet snapshots)
+    analytics_export_dir: str = Field(default="analytics_exports", env="analytics_export_dir")
+    analytics_export_lock_seconds: int = Field(default=21600, env="analytics_export_lock_seconds")  # longer than any export; frees the lock of a crashed run
     
     # Thêm validation
     @validator('secret_key')
@@ -45,6 +80,18 @@ class Settings(BaseSettings):
             raise ValueError(f'log_level must be one of {valid_levels}')
         return v.upper()
     
+    @validator('db_pool_size', 'db_pool_timeout')
+    def validate_pool_positive(cls, v):
+        if v <= 0:
+            raise ValueError('db_pool_size and db_pool_timeout must be positive')
+        return v
+
+    @validator('db_max_overflow')
+    def validate_pool_overflow(cls, v):
+        if v < 0:
+            raise ValueError('db_max_overflow cannot be negative')
+        return v
+
     @validator('max_file_size')
     def validate_file_size(cls, v):
         if v <= 0:
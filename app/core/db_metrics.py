@@ -0,0 +1,105 @@
+import time
+from threading import Lock
+from typing import Dict, Type
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds (ms) for checkout wait-time buckets, last bucket is +Inf
+CHECKOUT_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class CheckoutWaitHistogram:
+    """
+    Cumulative histogram of how long callers waited for a pooled connection
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._bucket_counts = [0] * (len(CHECKOUT_WAIT_BUCKETS_MS) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+        self._timeouts = 0
+
+    def observe(self, wait_ms: float):
+        with self._lock:
+            index = len(CHECKOUT_WAIT_BUCKETS_MS)
+            for i, bound in enumerate(CHECKOUT_WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    index = i
+                    break
+            self._bucket_counts[index] += 1
+            self._count += 1
+            self._sum_ms += wait_ms
+            self._max_ms = max(self._max_ms, wait_ms)
+
+    def record_timeout(self):
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            buckets = {}
+            cumulative = 0
+            for bound, count in zip(CHECKOUT_WAIT_BUCKETS_MS, self._bucket_counts):
+                cumulative += count
+                buckets[f"le_{bound}"] = cumulative
+            buckets["le_inf"] = cumulative + self._bucket_counts[-1]
+            return {
+                "count": self._count,
+                "sum_ms": round(self._sum_ms, 3),
+                "max_ms": round(self._max_ms, 3),
+                "avg_ms": round(self._sum_ms / self._count, 3) if self._count else 0.0,
+                "timeouts": self._timeouts,
+                "buckets": buckets,
+            }
+
+
+_histograms: Dict[str, CheckoutWaitHistogram] = {}
+
+
+def get_checkout_histogram(pool_name: str) -> CheckoutWaitHistogram:
+    if pool_name not in _histograms:
+        _histograms[pool_name] = CheckoutWaitHistogram()
+    return _histograms[pool_name]
+
+
+def instrumented_pool_class(base: Type[QueuePool], pool_name: str) -> Type[QueuePool]:
+    """
+    Build a QueuePool subclass that records checkout wait time under `pool_name`
+    """
+    histogram = get_checkout_histogram(pool_name)
+
+    class InstrumentedPool(base):
+        def _do_get(self):
+            start = time.perf_counter()
+            try:
+                connection = super()._do_get()
+            except PoolTimeoutError:
+                histogram.record_timeout()
+                raise
+            histogram.observe((time.perf_counter() - start) * 1000)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
+
+
+def get_pool_status(engine, pool_name: str) -> dict:
+    """
+    Live pool usage for an engine plus its checkout wait histogram
+    """
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout": pool.timeout(),
+        })
+    status["checkout_wait_ms"] = get_checkout_histogram(pool_name).snapshot()
+    return status
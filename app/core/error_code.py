@@ -8,6 +8,8 @@ class ErrorCode:
     ORGANIZATION_NOT_FOUND = (1005, "Organization not found")
     USER_NOT_FOUND = (1006, "User not found")
     NOT_FOUND = (1009, "Resource not found")
+    INVALID_CURSOR = (1010, "Invalid pagination cursor")
+    INVALID_DATE_RANGE = (1011, "Invalid date range")
     AUTH_FAILED = (1007, "Authentication failed")
     AUTHZ_FAILED = (1008, "Not authorized")
     UNCATEGORIZED_EXCEPTION = (1999, "Uncategorized Exception")
@@ -49,6 +51,8 @@ class ErrorCode:
     NOTIFICATION_DELETE_FAILED = (6003, "Failed to delete notification")
     NOTIFICATION_CREATE_FAILED = (6004, "Failed to create notification")
 
+    ANALYTICS_EXPORT_UNAVAILABLE = (7001, "Analytics export requires pyarrow")
+
     @staticmethod
     def get_code(error):
         return error[0]
@@ -221,4 +221,21 @@ class NotificationDeleteFailedException(DomainException):
 class NotificationCreateFailedException(DomainException):
     code = ErrorCode.get_code(ErrorCode.NOTIFICATION_CREATE_FAILED)
     message = ErrorCode.get_message(ErrorCode.NOTIFICATION_CREATE_FAILED)
-    http_status = 400
\ No newline at end of file
+    http_status = 400
+
+class InvalidCursorException(DomainException):
+    code = ErrorCode.get_code(ErrorCode.INVALID_CURSOR)
+    message = ErrorCode.get_message(ErrorCode.INVALID_CURSOR)
+    http_status = 400
+
+
+class InvalidDateRangeException(DomainException):
+    code = ErrorCode.get_code(ErrorCode.INVALID_DATE_RANGE)
+    message = ErrorCode.get_message(ErrorCode.INVALID_DATE_RANGE)
+    http_status = 400
+
+
+class AnalyticsExportUnavailableException(DomainException):
+    code = ErrorCode.get_code(ErrorCode.ANALYTICS_EXPORT_UNAVAILABLE)
+    message = ErrorCode.get_message(ErrorCode.ANALYTICS_EXPORT_UNAVAILABLE)
+    http_status = 503
\ No newline at end of file
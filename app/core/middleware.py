@@ -5,5 +5,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         print(f"Request: {request.method} {request.url}")
         response = await call_next(request)
-        print(f"Response status: {response.status_code}")
+        # Set by the DB session dependencies (app.core.request_memo)
+        db_stats = getattr(request.state, "db_stats", None)
+        if db_stats is not None:
+            response.headers["X-DB-Query-Count"] = str(db_stats.queries)
+            print(f"Response status: {response.status_code} ({db_stats.queries} DB queries)")
+        else:
+            print(f"Response status: {response.status_code}")
         return response
\ No newline at end of file
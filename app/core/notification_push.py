@@ -0,0 +1,89 @@
+import asyncio
+from typing import Dict, Optional, Set
+
+import redis
+
+from app.config import settings
+from app.database import async_redis_client
+from app.schemas.redis.notification_redis import NotificationRedis
+
+_RECONNECT_DELAY = 1.0
+
+
+class NotificationHub:
+    """
+    Fans notifications published by the create script out to the streams
+    connected to this worker process.
+
+    One pub/sub connection per process carries every connected user: a
+    user's channel is subscribed when their first stream opens and
+    unsubscribed when their last one closes, so Redis only sends the
+    process messages it has a listener for.
+    """
+
+    def __init__(self, client=async_redis_client):
+        self._client = client
+        self._pubsub = None
+        self._reader: Optional[asyncio.Task] = None
+        self._queues: Dict[str, Set[asyncio.Queue]] = {}
+
+    async def subscribe(self, user_id: str) -> asyncio.Queue:
+        """Queue receiving the user's new notifications (JSON strings)"""
+        queue = asyncio.Queue(maxsize=settings.notification_stream_queue_size)
+        listeners = self._queues.setdefault(user_id, set())
+        listeners.add(queue)
+        if len(listeners) == 1:
+            if self._pubsub is None:
+                self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await self._pubsub.subscribe(NotificationRedis.create_user_channel(user_id))
+            except redis.RedisError:
+                self._queues.pop(user_id, None)
+                raise
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read())
+        return queue
+
+    async def unsubscribe(self, user_id: str, queue: asyncio.Queue):
+        listeners = self._queues.get(user_id)
+        if not listeners:
+            return
+        listeners.discard(queue)
+        if listeners:
+            return
+        del self._queues[user_id]
+        try:
+            await self._pubsub.unsubscribe(NotificationRedis.create_user_channel(user_id))
+        except redis.RedisError:
+            # Messages for the channel are dropped until it is re-subscribed
+            pass
+
+    def dispatch(self, channel: str, data: str):
+        user_id = channel.rsplit(":", 1)[-1]
+        for queue in self._queues.get(user_id, ()):
+            try:
+                queue.put_nowait(data)
+            except asyncio.QueueFull:
+                # Slow client: it misses this push and catches up from /notifications/my
+                pass
+
+    async def _read(self):
+        while self._queues:
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except redis.RedisError:
+                # The connection re-subscribes its channels when it reconnects
+                await asyncio.sleep(_RECONNECT_DELAY)
+                continue
+            if message and message["type"] == "message":
+                self.dispatch(message["channel"], message["data"])
+
+    async def close(self):
+        if self._reader is not None:
+            self._reader.cancel()
+        if self._pubsub is not None:
+            await self._pubsub.close()
+        self._queues.clear()
+
+
+notification_hub = NotificationHub()
@@ -0,0 +1,50 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+
+from app.core.exceptions import InvalidCursorException
+
+# Keyset pagination over (created_at, id), newest first. The cursor is an
+# opaque base64 token of the last row of the previous page.
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(row_id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorException()
+
+
+def keyset_order(model):
+    """ORDER BY matching the (…, created_at, id) indexes"""
+    return (model.created_at.desc(), model.id.desc())
+
+
+def keyset_filter(model, cursor: str):
+    """Rows strictly after the cursor in keyset_order"""
+    created_at, row_id = decode_cursor(cursor)
+    return tuple_(model.created_at, model.id) < tuple_(created_at, row_id)
+
+
+def split_page(rows: Sequence, limit: int) -> Tuple[List, Optional[str]]:
+    """
+    Rows were fetched with limit + 1; the extra row only tells whether
+    another page exists.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,153 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+
+import redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.config import settings
+from app.database import redis_client, async_redis_client
+from app.models.user import User
+from app.schemas.response.user_response import UserResponse
+
+
+class _LocalLRU:
+    """
+    Small thread-safe LRU with per-entry TTL, kept per worker process
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self._lock = Lock()
+        self._entries = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def get(self, key: str) -> Optional[UserResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: UserResponse):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_local_cache = _LocalLRU(settings.principal_local_cache_size, settings.principal_local_cache_ttl)
+
+
+def _principal_key(user_id) -> str:
+    return f"principal:{user_id}"
+
+
+def get_cached_principal(user_id) -> Optional[UserResponse]:
+    """
+    Authenticated user from the local LRU, then Redis. None on miss.
+    """
+    key = _principal_key(user_id)
+    principal = _local_cache.get(key)
+    if principal is not None:
+        return principal
+
+    try:
+        cached = redis_client.get(key)
+    except redis.RedisError:
+        return None
+    if not cached:
+        return None
+
+    principal = UserResponse.model_validate_json(cached)
+    _local_cache.set(key, principal)
+    return principal
+
+
+async def get_cached_principal_async(user_id) -> Optional[UserResponse]:
+    """Async variant of get_cached_principal"""
+    key = _principal_key(user_id)
+    principal = _local_cache.get(key)
+    if principal is not None:
+        return principal
+
+    try:
+        cached = await async_redis_client.get(key)
+    except redis.RedisError:
+        return None
+    if not cached:
+        return None
+
+    principal = UserResponse.model_validate_json(cached)
+    _local_cache.set(key, principal)
+    return principal
+
+
+def cache_principal(principal: UserResponse):
+    key = _principal_key(principal.id)
+    _local_cache.set(key, principal)
+    try:
+        redis_client.setex(key, settings.principal_cache_ttl, principal.model_dump_json())
+    except redis.RedisError:
+        pass
+
+
+async def cache_principal_async(principal: UserResponse):
+    key = _principal_key(principal.id)
+    _local_cache.set(key, principal)
+    try:
+        await async_redis_client.setex(key, settings.principal_cache_ttl, principal.model_dump_json())
+    except redis.RedisError:
+        pass
+
+
+def invalidate_principal(user_id):
+    """
+    Drop a cached principal (role/organization/profile changed or user deleted).
+    Other worker processes keep their local copy for at most principal_local_cache_ttl.
+    """
+    key = _principal_key(user_id)
+    _local_cache.delete(key)
+    try:
+        redis_client.delete(key)
+    except redis.RedisError:
+        pass
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _queue_principal_invalidation(mapper, connection, target):
+    # Invalidate only once the change is committed, otherwise a concurrent
+    # request could re-cache the old row before the commit lands
+    session = object_session(target)
+    if session is None:
+        invalidate_principal(target.id)
+        return
+    session.info.setdefault("stale_principals", set()).add(str(target.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_stale_principals(session):
+    for user_id in session.info.pop("stale_principals", ()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale_principals(session):
+    session.info.pop("stale_principals", None)
@@ -0,0 +1,75 @@
+from typing import Any, Callable, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class RequestDBStats:
+    """
+    ORM statements executed by all sessions of one request
+    """
+
+    def __init__(self):
+        self.queries = 0
+
+
+def bind_request_memo(db, request) -> None:
+    """
+    Share the request's entity memo and query stats with a session.
+    Every session of the request (primary, replica, async) points at the same
+    request.state objects, so an entity loaded by a dependency is reused by the
+    service without another query.
+    """
+    state = request.state
+    if not isinstance(getattr(state, "entity_memo", None), dict):
+        state.entity_memo = {}
+        state.db_stats = RequestDBStats()
+    db.info["entity_memo"] = state.entity_memo
+    db.info["db_stats"] = state.db_stats
+
+
+def _memo(db) -> Optional[dict]:
+    # Sessions created outside a request (scripts, workers) have no memo
+    info = getattr(db, "info", None)
+    if not isinstance(info, dict):
+        return None
+    return info.get("entity_memo")
+
+
+def memo_get(db, key: Hashable, loader: Callable[[], Any]) -> Any:
+    """
+    Return the memoized entity for `key`, loading it once per request.
+    Misses (None) are memoized too so a missing row is not queried again.
+    """
+    memo = _memo(db)
+    if memo is None:
+        return loader()
+    if key not in memo:
+        memo[key] = loader()
+    return memo[key]
+
+
+async def memo_get_async(db, key: Hashable, loader: Callable[[], Any]) -> Any:
+    """Async variant of memo_get, `loader` returns an awaitable"""
+    memo = _memo(db)
+    if memo is None:
+        return await loader()
+    if key not in memo:
+        memo[key] = await loader()
+    return memo[key]
+
+
+def memo_discard(db, *keys: Hashable) -> None:
+    """Forget memoized entities after they are deleted or membership changes"""
+    memo = _memo(db)
+    if memo is None:
+        return
+    for key in keys:
+        memo.pop(key, None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _count_orm_statement(orm_execute_state):
+    stats = orm_execute_state.session.info.get("db_stats")
+    if stats is not None:
+        stats.queries += 1
@@ -0,0 +1,272 @@
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import redis
+
+from app.config import settings
+
+# Single-flight cache fill with stale-while-revalidate.
+#
+# Entries are Redis hashes of string fields plus a soft expiry. Past the soft
+# expiry an entry is still served for cache_stale_ttl to every caller except the
+# one that wins the Redis lock, which recomputes it and gets the fresh value. On
+# a miss, callers in the same process share one in-flight computation and
+# callers in other processes wait for the lock holder to fill the key, so each
+# key is recomputed once. Redis errors never fail a read: the caller computes.
+
+Fields = Dict[str, str]
+
+_STALE_AT = "_stale_at"
+_WAIT_STEP = 0.05
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_inflight: Dict[str, Future] = {}
+_inflight_guard = threading.Lock()
+_inflight_async: Dict[str, asyncio.Future] = {}
+
+
+def _lock_key(key: str) -> str:
+    return f"{key}:lock"
+
+
+def _parse(entry: Optional[dict]) -> Tuple[Optional[Fields], bool]:
+    """(fields, is_stale); fields is None on a miss"""
+    if not entry or _STALE_AT not in entry:
+        return None, True
+    fields = {name: value for name, value in entry.items() if name != _STALE_AT}
+    return fields, float(entry[_STALE_AT]) <= time.time()
+
+
+def _entry(fields: Fields, ttl: int) -> dict:
+    return {**fields, _STALE_AT: time.time() + ttl}
+
+
+def _lock_token() -> str:
+    return uuid.uuid4().hex
+
+
+def _acquire(client, key: str) -> Optional[str]:
+    """Lock token, or None when another caller holds the lock"""
+    token = _lock_token()
+    if client.set(_lock_key(key), token, nx=True, px=settings.cache_lock_timeout_ms):
+        return token
+    return None
+
+
+def _release(client, key: str, token: str):
+    try:
+        client.eval(_RELEASE_LOCK_SCRIPT, 1, _lock_key(key), token)
+    except redis.RedisError:
+        # The lock expires after cache_lock_timeout_ms
+        pass
+
+
+async def _acquire_async(client, key: str) -> Optional[str]:
+    token = _lock_token()
+    if await client.set(_lock_key(key), token, nx=True, px=settings.cache_lock_timeout_ms):
+        return token
+    return None
+
+
+async def _release_async(client, key: str, token: str):
+    try:
+        await client.eval(_RELEASE_LOCK_SCRIPT, 1, _lock_key(key), token)
+    except redis.RedisError:
+        pass
+
+
+def get_or_compute(client, key: str, compute: Callable[[], Fields], ttl: int) -> Fields:
+    """
+    Cached fields of `key`, computing them at most once at a time for the key.
+    `compute` must return plain strings (results are shared between callers).
+    """
+    try:
+        fields, stale = _parse(client.hgetall(key))
+    except redis.RedisError:
+        return compute()
+
+    if fields is not None:
+        if stale:
+            refreshed = _refresh_if_lock_free(client, key, compute, ttl)
+            return fields if refreshed is None else refreshed
+        return fields
+
+    with _inflight_guard:
+        future = _inflight.get(key)
+        is_leader = future is None
+        if is_leader:
+            future = _inflight[key] = Future()
+
+    if not is_leader:
+        try:
+            return future.result(timeout=settings.cache_lock_timeout_ms / 1000)
+        except FutureTimeoutError:
+            # The leader is still computing: don't keep the request waiting on it
+            return compute()
+
+    try:
+        fields = _fill(client, key, compute, ttl)
+        future.set_result(fields)
+        return fields
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _inflight_guard:
+            _inflight.pop(key, None)
+
+
+def _refresh_if_lock_free(client, key: str, compute: Callable[[], Fields], ttl: int) -> Optional[Fields]:
+    """Fresh fields if this caller won the lock and recomputed them, else None"""
+    try:
+        token = _acquire(client, key)
+    except redis.RedisError:
+        return None
+    if token is None:
+        return None
+    try:
+        fields = compute()
+        _store(client, key, fields, ttl)
+        return fields
+    finally:
+        _release(client, key, token)
+
+
+def _fill(client, key: str, compute: Callable[[], Fields], ttl: int) -> Fields:
+    try:
+        token = _acquire(client, key)
+    except redis.RedisError:
+        return compute()
+    if token is not None:
+        try:
+            fields = compute()
+            _store(client, key, fields, ttl)
+            return fields
+        finally:
+            _release(client, key, token)
+
+    # Another process is computing: wait for its result, then give up and compute
+    deadline = time.monotonic() + settings.cache_lock_timeout_ms / 1000
+    try:
+        while time.monotonic() < deadline:
+            time.sleep(_WAIT_STEP)
+            fields, _ = _parse(client.hgetall(key))
+            if fields is not None:
+                return fields
+            if not client.exists(_lock_key(key)):
+                break
+    except redis.RedisError:
+        return compute()
+    fields = compute()
+    _store(client, key, fields, ttl)
+    return fields
+
+
+def _store(client, key: str, fields: Fields, ttl: int):
+    try:
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.hset(key, mapping=_entry(fields, ttl))
+        pipe.expire(key, ttl + settings.cache_stale_ttl)
+        pipe.execute()
+    except redis.RedisError:
+        # Served uncached; the next caller computes again
+        pass
+
+
+async def get_or_compute_async(
+    client, key: str, compute: Callable[[], Awaitable[Fields]], ttl: int
+) -> Fields:
+    """Async variant of get_or_compute (redis.asyncio client, async compute)"""
+    try:
+        fields, stale = _parse(await client.hgetall(key))
+    except redis.RedisError:
+        return await compute()
+
+    if fields is not None:
+        if stale:
+            refreshed = await _refresh_if_lock_free_async(client, key, compute, ttl)
+            return fields if refreshed is None else refreshed
+        return fields
+
+    future = _inflight_async.get(key)
+    if future is not None:
+        return await asyncio.shield(future)
+
+    future = _inflight_async[key] = asyncio.get_running_loop().create_future()
+    try:
+        fields = await _fill_async(client, key, compute, ttl)
+        future.set_result(fields)
+        return fields
+    except BaseException as exc:
+        future.set_exception(exc)
+        # Followers re-raise it; mark it retrieved for the leader
+        future.exception()
+        raise
+    finally:
+        _inflight_async.pop(key, None)
+
+
+async def _refresh_if_lock_free_async(client, key: str, compute, ttl: int) -> Optional[Fields]:
+    try:
+        token = await _acquire_async(client, key)
+    except redis.RedisError:
+        return None
+    if token is None:
+        return None
+    try:
+        fields = await compute()
+        await _store_async(client, key, fields, ttl)
+        return fields
+    finally:
+        await _release_async(client, key, token)
+
+
+async def _fill_async(client, key: str, compute, ttl: int) -> Fields:
+    try:
+        token = await _acquire_async(client, key)
+    except redis.RedisError:
+        return await compute()
+    if token is not None:
+        try:
+            fields = await compute()
+            await _store_async(client, key, fields, ttl)
+            return fields
+        finally:
+            await _release_async(client, key, token)
+
+    deadline = time.monotonic() + settings.cache_lock_timeout_ms / 1000
+    try:
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_WAIT_STEP)
+            fields, _ = _parse(await client.hgetall(key))
+            if fields is not None:
+                return fields
+            if not await client.exists(_lock_key(key)):
+                break
+    except redis.RedisError:
+        return await compute()
+    fields = await compute()
+    await _store_async(client, key, fields, ttl)
+    return fields
+
+
+async def _store_async(client, key: str, fields: Fields, ttl: int):
+    try:
+        pipe = client.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.hset(key, mapping=_entry(fields, ttl))
+        pipe.expire(key, ttl + settings.cache_stale_ttl)
+        await pipe.execute()
+    except redis.RedisError:
+        pass
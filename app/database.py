@@ -1,26 +1,215 @@
-from sqlalchemy import create_engine
+import itertools
+from typing import Optional
+
+from fastapi import Depends, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool, NullPool
 from app.config import settings
+from app.core.db_metrics import instrumented_pool_class
+from app.core.exceptions import AuthenticationFailedException
+from app.core.request_memo import bind_request_memo
+from app.core.security import decode_access_token
 import redis
+import redis.asyncio as aioredis
+
+# Shared pool settings, tuned via Settings
+POOL_OPTIONS = {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout,
+    "pool_recycle": settings.db_pool_recycle,
+    "pool_pre_ping": settings.db_pool_pre_ping,
+}
+
 # Create database engine
-engine = create_engine(settings.database_url)
+engine = create_engine(
+    settings.database_url,
+    poolclass=instrumented_pool_class(QueuePool, "primary"),
+    **POOL_OPTIONS
+)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _to_async_url(url: str) -> str:
+    """Switch a sync postgres URL to the asyncpg driver"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("postgresql+psycopg2://"):
+        return url.replace("postgresql+psycopg2://", "postgresql+asyncpg://", 1)
+    return url
+
+
+# Async engine + session factory for `async def` routes
+async_engine = create_async_engine(
+    settings.async_database_url or _to_async_url(settings.database_url),
+    poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, "primary_async"),
+    **POOL_OPTIONS
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Read replicas (optional) for read-only request scopes
+REPLICA_URLS = [url.strip() for url in settings.database_replica_urls.split(",") if url.strip()]
+
+replica_engines = [
+    create_engine(url, poolclass=instrumented_pool_class(QueuePool, f"replica_{i}"), **POOL_OPTIONS)
+    for i, url in enumerate(REPLICA_URLS)
+]
+ReplicaSessionLocals = [
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    for replica_engine in replica_engines
+]
+
+async_replica_engines = [
+    create_async_engine(
+        _to_async_url(url),
+        poolclass=instrumented_pool_class(AsyncAdaptedQueuePool, f"replica_{i}_async"),
+        **POOL_OPTIONS
+    )
+    for i, url in enumerate(REPLICA_URLS)
+]
+AsyncReplicaSessionLocals = [
+    async_sessionmaker(bind=replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    for replica_engine in async_replica_engines
+]
+
+_replica_counter = itertools.count()
+
+# Analytics exports hold a connection for the whole dump, so they get their own
+# unpooled engine (replica first) instead of a slot in the request pools
+export_engine = create_engine(REPLICA_URLS[0] if REPLICA_URLS else settings.database_url, poolclass=NullPool)
+ExportSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=export_engine)
+
 # Create base class for models
 Base = declarative_base()
 
 
-def get_db():
+def get_db(request: Request):
     """Dependency to get database session"""
     db = SessionLocal()
+    # Remember who is writing so a commit can pin their reads to the primary
+    db.info["user_id"] = _get_request_user_id(request)
+    bind_request_memo(db, request)
     try:
         yield db
     finally:
         db.close()
 
+
+async def get_async_db(request: Request):
+    """Dependency to get async database session"""
+    async with AsyncSessionLocal() as db:
+        bind_request_memo(db, request)
+        yield db
+
+
+def get_read_db(request: Request, db=Depends(get_db)):
+    """
+    Dependency to get a read-only database session.
+    Uses a replica unless none are configured or the user wrote recently (read-your-writes).
+    On the primary it is the request's get_db session, so a request never holds
+    two connections of the same pool.
+    """
+    replica_factory = _replica_session_factory(request)
+    if replica_factory is None:
+        yield db
+        return
+    replica_db = replica_factory()
+    bind_request_memo(replica_db, request)
+    try:
+        yield replica_db
+    finally:
+        replica_db.close()
+
+
+def open_read_session(request: Request):
+    """
+    A read session (same routing as get_read_db) owned and closed by the caller,
+    for work that outlives the request's dependencies, e.g. a streamed body
+    """
+    db = (_replica_session_factory(request) or SessionLocal)()
+    bind_request_memo(db, request)
+    return db
+
+
+def _replica_session_factory(request: Request):
+    # None when the request must read the primary
+    user_id = _get_request_user_id(request)
+    if not ReplicaSessionLocals or (user_id and has_recent_write(user_id)):
+        return None
+    return ReplicaSessionLocals[next(_replica_counter) % len(ReplicaSessionLocals)]
+
+
+async def get_async_read_db(request: Request, db=Depends(get_async_db)):
+    """Async variant of get_read_db"""
+    user_id = _get_request_user_id(request)
+    if not AsyncReplicaSessionLocals or (user_id and await has_recent_write_async(user_id)):
+        yield db
+        return
+    session_factory = AsyncReplicaSessionLocals[next(_replica_counter) % len(AsyncReplicaSessionLocals)]
+    async with session_factory() as replica_db:
+        bind_request_memo(replica_db, request)
+        yield replica_db
+
+
+def _get_request_user_id(request: Request) -> Optional[str]:
+    """User id (JWT subject) of the request, decoded without touching the database"""
+    authorization = request.headers.get("Authorization", "")
+    if not authorization.startswith("Bearer "):
+        return None
+    try:
+        payload = decode_access_token(authorization[len("Bearer "):])
+    except AuthenticationFailedException:
+        return None
+    return payload.get("sub") if payload else None
+
+
+def _sticky_key(user_id: str) -> str:
+    return f"db:sticky:{user_id}"
+
+
+def mark_recent_write(user_id: str):
+    """Pin the user's reads to the primary for replica_sticky_seconds"""
+    try:
+        redis_client.setex(_sticky_key(user_id), settings.replica_sticky_seconds, 1)
+    except redis.RedisError:
+        pass
+
+
+def has_recent_write(user_id: str) -> bool:
+    try:
+        return bool(redis_client.exists(_sticky_key(user_id)))
+    except redis.RedisError:
+        # Can't tell, so stay on the primary
+        return True
+
+
+async def has_recent_write_async(user_id: str) -> bool:
+    try:
+        return bool(await async_redis_client.exists(_sticky_key(user_id)))
+    except redis.RedisError:
+        return True
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _track_session_writes(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _stick_writer_to_primary(session):
+    if session.info.pop("has_writes", False) and session.info.get("user_id"):
+        mark_recent_write(session.info["user_id"])
+
 # Redis client for caching
 redis_client = redis.Redis(
     host=settings.redis_host,
@@ -29,3 +218,12 @@ redis_client = redis.Redis(
     password=settings.redis_password,
     decode_responses=True
 )
+
+# Async Redis client for `async def` code paths (does not block the event loop)
+async_redis_client = aioredis.Redis(
+    host=settings.redis_host,
+    port=settings.redis_port,
+    db=settings.redis_db,
+    password=settings.redis_password,
+    decode_responses=True
+)
@@ -1,13 +1,20 @@
 from fastapi import Depends
 from jose import JWTError
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from fastapi.security import OAuth2PasswordBearer
 
 from app.core.security import decode_access_token
 from app.core.exceptions import AuthenticationFailedException
-from app.database import get_db
-from app.services.user_service import get_user_by_id
+from app.core.principal_cache import (
+    get_cached_principal,
+    get_cached_principal_async,
+    cache_principal,
+    cache_principal_async,
+)
+from app.database import get_db, get_async_db, get_read_db, get_async_read_db
+from app.services.user_service import get_user_by_id, get_user_by_id_async
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
@@ -20,6 +27,67 @@ def get_current_user(
     """
     Lấy user hiện tại từ JWT token
     """
+    user_id = _get_user_id_from_token(token)
+
+    user = get_cached_principal(user_id)
+    if user is not None:
+        return user
+
+    user = get_user_by_id(db, user_id)
+    if user is None:
+        raise AuthenticationFailedException("User not found")
+
+    cache_principal(user)
+    return user
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Lấy user hiện tại từ JWT token (async session, cho các route `async def`)
+    """
+    user_id = _get_user_id_from_token(token)
+
+    user = await get_cached_principal_async(user_id)
+    if user is not None:
+        return user
+
+    user = await get_user_by_id_async(db, user_id)
+    if user is None:
+        raise AuthenticationFailedException("User not found")
+
+    await cache_principal_async(user)
+    return user
+
+
+# Read-only routes: the user is loaded through the route's read session, so the
+# whole request stays on one connection (a replica when one is selected)
+def get_current_user_read(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_read_db),
+):
+    """
+    Lấy user hiện tại từ JWT token (read session)
+    """
+    return get_current_user(token, db)
+
+
+async def get_current_user_read_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Lấy user hiện tại từ JWT token (async read session)
+    """
+    return await get_current_user_async(token, db)
+
+
+def _get_user_id_from_token(token: str) -> UUID:
+    """
+    Decode JWT và lấy user id (subject)
+    """
     if not token:
         raise AuthenticationFailedException("Token missing")
 
@@ -28,17 +96,14 @@ def get_current_user(
 
     try:
         payload = decode_access_token(token)
+        if payload is None:
+            raise AuthenticationFailedException("Invalid token")
         user_id = payload.get("sub")
         if user_id is None:
             raise AuthenticationFailedException("Invalid token: no subject")
-
-        user = get_user_by_id(db, UUID(user_id))
-        if user is None:
-            raise AuthenticationFailedException("User not found")
-
-        return user
+        return UUID(user_id)
 
     except AuthenticationFailedException:
         raise
-    except JWTError:
+    except (JWTError, ValueError):
         raise AuthenticationFailedException("Invalid token")
@@ -7,7 +7,7 @@ from app.core.exceptions import (
     NotFoundException,
     UserNotInOrganizationException
 )
-from app.dependencies.auth import get_current_user
+from app.dependencies.auth import get_current_user, get_current_user_read
 from app.database import get_db
 from app.services.user_service import get_user_by_id
 
@@ -23,6 +23,18 @@ def require_organization_member(org_id: UUID, current_user=Depends(get_current_u
         raise AuthorizationFailedException("Access restricted to your organization")
     return current_user
 
+def require_organization_manager(org_id: UUID, current_user=Depends(get_current_user)):
+    """Yêu cầu admin/manager của tổ chức"""
+    if current_user.organization_id != org_id:
+        raise AuthorizationFailedException("Access restricted to your organization")
+    if current_user.role not in ("admin", "manager"):
+        raise AuthorizationFailedException("Only Admin and Manager can view organization reports")
+    return current_user
+
+def require_organization_manager_read(org_id: UUID, current_user=Depends(get_current_user_read)):
+    """Yêu cầu admin/manager của tổ chức (read session)"""
+    return require_organization_manager(org_id, current_user)
+
 def verify_same_organization(
     user_id: UUID,
     db: Session = Depends(get_db),
@@ -1,17 +1,23 @@
 from uuid import UUID
 from fastapi import Depends, Path
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import (
     NotFoundException,
     AuthorizationFailedException,
     ProjectNotFoundException,
 )
-from app.dependencies.auth import get_current_user
-from app.database import get_db
+from app.dependencies.auth import (
+    get_current_user,
+    get_current_user_async,
+    get_current_user_read,
+    get_current_user_read_async,
+)
+from app.database import get_db, get_async_db, get_read_db, get_async_read_db
 from app.repositories.project import get_project_by_id as repo_get_project
 from app.repositories.project_member import is_project_member
-from app.services.project_service import get_projects_by_id
+from app.services.project_service import get_projects_by_id, get_projects_by_id_async
 from app.services import project_member_service
 
 def require_project_admin(
@@ -96,3 +102,54 @@ def require_project_task_access(
         raise AuthorizationFailedException("You are not a member of this project")
 
     return current_user, project
+
+async def require_project_task_access_async(
+    project_id: UUID = Path(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """
+    Dependency for project task operations (async session)
+    """
+    project = await get_projects_by_id_async(db, project_id)
+    if not project:
+        raise ProjectNotFoundException()
+
+    if current_user.role == "admin":
+        return current_user, project
+
+    if not await project_member_service.check_project_access_permission_async(db, project_id, current_user.id):
+        raise AuthorizationFailedException("You are not a member of this project")
+
+    return current_user, project
+
+# Read-only routes: same checks on the route's read session
+def require_project_management_permission_read(
+    project_id: UUID = Path(...),
+    db: Session = Depends(get_read_db),
+    current_user=Depends(get_current_user_read),
+):
+    """
+    Require admin or manager permission for project management (read session)
+    """
+    return require_project_management_permission(project_id, db, current_user)
+
+def require_project_task_access_read(
+    project_id: UUID = Path(...),
+    db: Session = Depends(get_read_db),
+    current_user=Depends(get_current_user_read),
+):
+    """
+    Dependency for project task reads (read session)
+    """
+    return require_project_task_access(project_id, db, current_user)
+
+async def require_project_task_access_read_async(
+    project_id: UUID = Path(...),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user=Depends(get_current_user_read_async),
+):
+    """
+    Dependency for project task reads (async read session)
+    """
+    return await require_project_task_access_async(project_id, db, current_user)
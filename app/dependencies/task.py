@@ -1,14 +1,20 @@
 from uuid import UUID
 from fastapi import Depends, Path
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import (
     AuthorizationFailedException,
     TaskNotFoundException,
     TaskAccessDeniedException,
 )
-from app.dependencies.auth import get_current_user
-from app.database import get_db
+from app.dependencies.auth import (
+    get_current_user,
+    get_current_user_async,
+    get_current_user_read,
+    get_current_user_read_async,
+)
+from app.database import get_db, get_async_db, get_read_db, get_async_read_db
 from app.services import task_service, project_member_service
 from app.services.task_service import get_task_by_id
 
@@ -31,6 +37,45 @@ def require_task_access(
 
     return current_user, task
 
+async def require_task_access_async(
+    task_id: UUID = Path(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """
+    Ensure user has access to task (async session)
+    """
+    task = await task_service.get_task_by_id_async(db, task_id)
+    if not task:
+        raise TaskNotFoundException("Task not found")
+    if current_user.role == "admin":
+        return current_user, task
+
+    if not await project_member_service.check_project_access_permission_async(db, task.project_id, current_user.id):
+        raise TaskAccessDeniedException("You are not a member of this project")
+
+    return current_user, task
+
+def require_task_access_read(
+    task_id: UUID = Path(...),
+    db: Session = Depends(get_read_db),
+    current_user=Depends(get_current_user_read),
+):
+    """
+    Ensure user has access to task (read session, for read-only routes)
+    """
+    return require_task_access(task_id, db, current_user)
+
+async def require_task_access_read_async(
+    task_id: UUID = Path(...),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user=Depends(get_current_user_read_async),
+):
+    """
+    Ensure user has access to task (async read session, for read-only routes)
+    """
+    return await require_task_access_async(task_id, db, current_user)
+
 def require_task_access_manager(
     task_id: UUID = Path(...),
     db: Session = Depends(get_db),
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.utils import get_openapi
@@ -9,6 +9,7 @@ from app.core.handdlers import global_exception_handler,validation_exception_han
 from fastapi.exceptions import RequestValidationError
 from app.core.exceptions import DomainException
 from sqlalchemy.exc import IntegrityError
+from app.dependencies.role import require_admin
 
 from app.routers import (
     auth,
@@ -109,6 +110,22 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+
+@app.get("/internal/db-pool", include_in_schema=False, dependencies=[Depends(require_admin)])
+async def db_pool_metrics():
+    """Connection pool usage and checkout wait histograms (admin only, also blocked at nginx)"""
+    from app.database import engine, async_engine, replica_engines, async_replica_engines
+    from app.core.db_metrics import get_pool_status
+    pools = {
+        "primary": get_pool_status(engine, "primary"),
+        "primary_async": get_pool_status(async_engine, "primary_async"),
+    }
+    for i, replica_engine in enumerate(replica_engines):
+        pools[f"replica_{i}"] = get_pool_status(replica_engine, f"replica_{i}")
+    for i, replica_engine in enumerate(async_replica_engines):
+        pools[f"replica_{i}_async"] = get_pool_status(replica_engine, f"replica_{i}_async")
+    return pools
+
 @app.on_event("startup")
 def startup_event():
     try:
@@ -116,4 +133,14 @@ def startup_event():
         redis_client.ping()
         print("✅ Redis connected successfully")
     except Exception as e:
-        print(f"❌ Redis connection failed: {e}")
\ No newline at end of file
+        print(f"❌ Redis connection failed: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    from app.database import async_engine, async_replica_engines, async_redis_client
+    from app.core.notification_push import notification_hub
+    await notification_hub.close()
+    await async_engine.dispose()
+    for replica_engine in async_replica_engines:
+        await replica_engine.dispose()
+    await async_redis_client.close()
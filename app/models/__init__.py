@@ -6,3 +6,6 @@ from .task import Task
 from .comment import Comment
 from .attachment import Attachment
 from .notification import Notification
+from .project_task_stats import project_task_stats
+from .organization_task_rollup import organization_task_rollups
+from .project_status_snapshot import project_status_snapshots
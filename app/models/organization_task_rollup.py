@@ -0,0 +1,18 @@
+from sqlalchemy import Table, Column, ForeignKey, Integer, Date, Enum, Index
+from app.database import Base
+from app.models.task import TaskStatusEnum, TaskPriorityEnum
+
+# Task counts per organization/project/creation day/status/priority, rebuilt
+# per dirty project by the rollup worker (app.repositories.org_rollup).
+# The primary key leads with organization_id, so an org summary is one range scan.
+organization_task_rollups = Table(
+    "organization_task_rollups",
+    Base.metadata,
+    Column("organization_id", ForeignKey("organizations.id", ondelete="CASCADE"), primary_key=True),
+    Column("project_id", ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("day", Date, primary_key=True),
+    Column("status", Enum(TaskStatusEnum, name="taskstatusenum", create_type=False), primary_key=True),
+    Column("priority", Enum(TaskPriorityEnum, name="taskpriorityenum", create_type=False), primary_key=True),
+    Column("task_count", Integer, nullable=False, default=0),
+    Index("idx_org_task_rollups_project_id", "project_id"),
+)
@@ -1,9 +1,10 @@
-from sqlalchemy import Table, Column, ForeignKey
+from sqlalchemy import Table, Column, ForeignKey, Index
 from app.database import Base
 
 project_members = Table(
     "project_members",
     Base.metadata,
     Column("user_id", ForeignKey("users.id"), primary_key=True),
-    Column("project_id", ForeignKey("projects.id"), primary_key=True)
+    Column("project_id", ForeignKey("projects.id"), primary_key=True),
+    Index("idx_project_members_project_user", "project_id", "user_id", unique=True)
 )
@@ -0,0 +1,15 @@
+from sqlalchemy import Table, Column, ForeignKey, Integer, Date, Enum
+from app.database import Base
+from app.models.task import TaskStatusEnum
+
+# Daily task count per (project, status), written only on days the count
+# changed (app.repositories.burndown). A day without a row carries the
+# previous value forward.
+project_status_snapshots = Table(
+    "project_status_snapshots",
+    Base.metadata,
+    Column("project_id", ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("status", Enum(TaskStatusEnum, name="taskstatusenum", create_type=False), primary_key=True),
+    Column("day", Date, primary_key=True),
+    Column("task_count", Integer, nullable=False),
+)
@@ -0,0 +1,14 @@
+from sqlalchemy import Table, Column, ForeignKey, Integer, Enum
+from app.database import Base
+from app.models.task import TaskStatusEnum, TaskPriorityEnum
+
+# Task counts per (project, status, priority), maintained in the same
+# transaction as task writes (app.repositories.project_task_stats)
+project_task_stats = Table(
+    "project_task_stats",
+    Base.metadata,
+    Column("project_id", ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+    Column("status", Enum(TaskStatusEnum, name="taskstatusenum", create_type=False), primary_key=True),
+    Column("priority", Enum(TaskPriorityEnum, name="taskpriorityenum", create_type=False), primary_key=True),
+    Column("task_count", Integer, nullable=False, default=0),
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Enum, Index, DateTime
+from sqlalchemy import Column, String, Text, ForeignKey, Enum, Index, DateTime, text
 from sqlalchemy.orm import relationship
 from app.models.baseModel import BaseModel
 import enum
@@ -35,5 +35,11 @@ class Task(BaseModel):
 
     __table_args__ = (
         Index('idx_tasks_status_project_id', 'status', 'project_id'),
+        # Keyset pagination (app.core.pagination)
+        Index('idx_tasks_project_created_id', 'project_id', 'created_at', 'id'),
+        Index('idx_tasks_assignee_created_id', 'assignee_id', 'created_at', 'id'),
+        Index('idx_tasks_creator_created_id', 'creator_id', 'created_at', 'id'),
+        # Overdue lookups only ever read open tasks
+        Index('idx_tasks_open_project_due', 'project_id', 'due_date', postgresql_where=text("status <> 'DONE'")),
     )
     
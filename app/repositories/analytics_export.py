@@ -0,0 +1,120 @@
+import json
+from typing import Callable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Row, Select, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import redis_client
+from app.models.attachment import Attachment
+from app.models.comment import Comment
+from app.models.organization import Organization
+from app.models.project import Project
+from app.models.project_member import project_members
+from app.models.task import Task
+
+# Snapshots requested through the API, run by scripts/analytics_export_worker.py
+ANALYTICS_SNAPSHOT_QUEUE_KEY = "analytics:snapshot_jobs"
+# Held for the whole export, so the worker and the CLI never run two at once
+ANALYTICS_SNAPSHOT_LOCK_KEY = "analytics:snapshot_lock"
+
+# KEYS: organization's pending job, queue
+# ARGV: snapshot dir, job json, ttl
+# Returns the directory of the organization's job still waiting, or queues this one
+_ENQUEUE_SCRIPT = """
+local pending = redis.call('GET', KEYS[1])
+if pending then
+    return pending
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+redis.call('LPUSH', KEYS[2], ARGV[2])
+return ARGV[1]
+"""
+
+
+def _tasks(organization_id: UUID) -> Select:
+    return select(
+        Task.id, Task.project_id, Task.title, Task.description, Task.status, Task.priority,
+        Task.due_date, Task.assignee_id, Task.creator_id, Task.created_at, Task.updated_at
+    ).join(Project, Project.id == Task.project_id).where(Project.organization_id == organization_id)
+
+
+def _comments(organization_id: UUID) -> Select:
+    return select(
+        Comment.id, Comment.task_id, Comment.author_id, Comment.content, Comment.created_at, Comment.updated_at
+    ).join(Task, Task.id == Comment.task_id).join(
+        Project, Project.id == Task.project_id
+    ).where(Project.organization_id == organization_id)
+
+
+def _attachments(organization_id: UUID) -> Select:
+    return select(
+        Attachment.id, Attachment.task_id, Attachment.author_id, Attachment.file_name,
+        Attachment.file_url, Attachment.created_at, Attachment.updated_at
+    ).join(Task, Task.id == Attachment.task_id).join(
+        Project, Project.id == Task.project_id
+    ).where(Project.organization_id == organization_id)
+
+
+def _project_members(organization_id: UUID) -> Select:
+    return select(
+        project_members.c.project_id, project_members.c.user_id
+    ).join(Project, Project.id == project_members.c.project_id).where(Project.organization_id == organization_id)
+
+
+# Exported tables and the query returning one organization's rows
+EXPORT_QUERIES: Dict[str, Callable[[UUID], Select]] = {
+    "tasks": _tasks,
+    "comments": _comments,
+    "attachments": _attachments,
+    "project_members": _project_members,
+}
+
+
+def get_organization_ids(db: Session) -> List[UUID]:
+    return list(db.execute(select(Organization.id).order_by(Organization.id)).scalars())
+
+
+def iter_export_batches(
+    db: Session, table: str, organization_id: UUID, batch_size: int = 10000
+) -> Iterator[List[Row]]:
+    """
+    Rows of one exported table for an organization, `batch_size` at a time
+    from a server-side cursor
+    """
+    stmt = EXPORT_QUERIES[table](organization_id).execution_options(yield_per=batch_size)
+    yield from db.execute(stmt).partitions()
+
+
+def _pending_key(organization_id) -> str:
+    return f"analytics:snapshot_pending:{organization_id}"
+
+
+def enqueue_snapshot_job(organization_id: UUID, snapshot_dir: str) -> str:
+    """
+    Queue a snapshot of one organization and return the directory it is written
+    to. Requests made while the organization's job still waits share that job.
+    """
+    job = json.dumps({"organization_id": str(organization_id), "snapshot_dir": snapshot_dir})
+    return redis_client.eval(
+        _ENQUEUE_SCRIPT, 2,
+        _pending_key(organization_id), ANALYTICS_SNAPSHOT_QUEUE_KEY,
+        snapshot_dir, job, settings.analytics_export_lock_seconds
+    )
+
+
+def pop_snapshot_job(timeout: int) -> Optional[Dict[str, str]]:
+    """Next queued job, waiting up to `timeout` seconds"""
+    item = redis_client.brpop(ANALYTICS_SNAPSHOT_QUEUE_KEY, timeout=timeout)
+    if not item:
+        return None
+    job = json.loads(item[1])
+    # Requests from now on get a new snapshot
+    redis_client.delete(_pending_key(job["organization_id"]))
+    return job
+
+
+def snapshot_lock():
+    """Lock taken around every export; waits while another one runs"""
+    return redis_client.lock(ANALYTICS_SNAPSHOT_LOCK_KEY, timeout=settings.analytics_export_lock_seconds, sleep=1)
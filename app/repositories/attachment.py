@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 from app.models.attachment import Attachment
+from app.core.request_memo import memo_get, memo_discard
 
 def create_attachment(db: Session, file_name: str, file_url: str, task_id: UUID, author_id: UUID) -> Attachment:
     attachment = Attachment(file_name=file_name, file_url=file_url, task_id=task_id, author_id=author_id)
@@ -14,7 +15,10 @@ def get_attachments_by_task(db: Session, task_id: UUID) -> List[Attachment]:
     return db.query(Attachment).filter(Attachment.task_id == task_id).all()
 
 def get_attachment_by_id(db: Session, attachment_id: UUID) -> Optional[Attachment]:
-    return db.query(Attachment).filter(Attachment.id == attachment_id).first()
+    return memo_get(
+        db, ("attachment", attachment_id),
+        lambda: db.query(Attachment).filter(Attachment.id == attachment_id).first()
+    )
 
 def delete_attachment(db: Session, attachment_id: UUID) -> bool:
     attachment = db.query(Attachment).filter(Attachment.id == attachment_id).first()
@@ -22,6 +26,7 @@ def delete_attachment(db: Session, attachment_id: UUID) -> bool:
         return False
     db.delete(attachment)
     db.commit()
+    memo_discard(db, ("attachment", attachment_id))
     return True
 
 def count_attachments_by_task(db: Session, task_id: UUID) -> int:
@@ -0,0 +1,111 @@
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.project_status_snapshot import project_status_snapshots
+from app.models.project_task_stats import project_task_stats
+from app.models.task import TaskStatusEnum
+
+_INSERT_CHUNK = 1000
+
+
+def take_status_snapshots(db: Session, day: Optional[date] = None) -> int:
+    """
+    Record today's per-project status counts, writing a row only where the
+    count differs from the last recorded one. Returns the number of rows written.
+    """
+    day = day or date.today()
+    # Current counts come from the maintained counters, not from tasks
+    current = db.execute(
+        select(
+            project_task_stats.c.project_id,
+            project_task_stats.c.status,
+            func.sum(project_task_stats.c.task_count)
+        ).group_by(project_task_stats.c.project_id, project_task_stats.c.status)
+    ).all()
+    current_counts = {(project_id, _value(status)): count for project_id, status, count in current}
+    latest_counts = {
+        (project_id, _value(status)): count
+        for project_id, status, count in db.execute(_latest_counts(day)).all()
+    }
+
+    rows = []
+    for project_id, status in current_counts.keys() | latest_counts.keys():
+        count = current_counts.get((project_id, status), 0)
+        # A never-recorded status counts as 0
+        if latest_counts.get((project_id, status), 0) != count:
+            rows.append({
+                "project_id": project_id, "status": TaskStatusEnum(status), "day": day, "task_count": count
+            })
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        stmt = pg_insert(project_status_snapshots).values(rows[start:start + _INSERT_CHUNK])
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=["project_id", "status", "day"],
+            set_={"task_count": stmt.excluded.task_count}
+        ))
+    db.commit()
+    return len(rows)
+
+
+def get_project_burndown(db: Session, project_id: UUID, start: date, end: date) -> List[Dict]:
+    """
+    Status counts of a project for each day in [start, end], from the count
+    in effect on `start` plus the changes recorded inside the range
+    """
+    counts = {status.value: 0 for status in TaskStatusEnum}
+    for _, status, count in db.execute(_latest_counts(start, project_id)).all():
+        counts[_value(status)] = count
+
+    changes: Dict[date, Dict[str, int]] = {}
+    for day, status, count in db.execute(
+        select(
+            project_status_snapshots.c.day,
+            project_status_snapshots.c.status,
+            project_status_snapshots.c.task_count
+        ).where(
+            project_status_snapshots.c.project_id == project_id,
+            project_status_snapshots.c.day > start,
+            project_status_snapshots.c.day <= end
+        )
+    ).all():
+        changes.setdefault(day, {})[_value(status)] = count
+
+    points = []
+    for offset in range((end - start).days + 1):
+        day = start + timedelta(days=offset)
+        counts.update(changes.get(day, {}))
+        points.append({
+            "day": day,
+            "status_counts": dict(counts),
+            "remaining": counts[TaskStatusEnum.TODO.value] + counts[TaskStatusEnum.IN_PROGRESS.value],
+            "total": sum(counts.values())
+        })
+    return points
+
+
+def _latest_counts(day: date, project_id: Optional[UUID] = None):
+    """Last recorded count per (project, status) on or before `day`"""
+    query = select(
+        project_status_snapshots.c.project_id,
+        project_status_snapshots.c.status,
+        project_status_snapshots.c.task_count
+    ).where(
+        project_status_snapshots.c.day <= day
+    ).distinct(
+        project_status_snapshots.c.project_id, project_status_snapshots.c.status
+    ).order_by(
+        project_status_snapshots.c.project_id,
+        project_status_snapshots.c.status,
+        project_status_snapshots.c.day.desc()
+    )
+    if project_id is not None:
+        query = query.where(project_status_snapshots.c.project_id == project_id)
+    return query
+
+
+def _value(member) -> str:
+    return member.value if hasattr(member, "value") else member
@@ -1,8 +1,9 @@
 import redis
 import json
+import time
 from uuid import uuid4
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timezone
 
 from app.config import settings
 from app.schemas.redis.notification_redis import NotificationRedis
@@ -16,10 +17,113 @@ redis_client = redis.Redis(
     decode_responses=True
 )
 
+# Storage: per user, one hash of id -> compact entry, a list of ids newest
+# first capped at notification_max_per_user, and the unread set. Entries are
+# positional JSON arrays without the id, user id or field names (see _encode);
+# the user's keys share one TTL refreshed on every write and entries older than
+# notification_ttl are skipped on read. Deleting removes the id from the list
+# too (an LREM bounded by the cap), so pages never come back short.
+#
+# Unread state lives in a per-user sorted set scored by each notification's
+# expiry, so entries past their TTL stop counting without any cleanup. The set
+# is the source of truth for is_read: marking read never rewrites notifications,
+# and bulk changes are one set operation however many notifications there are.
+
+# Coalescing: a notification with a related id opens a window of
+# notification_coalesce_window_seconds for its (user, type, related id) group.
+# Later ones in the window update that entry in place (latest message, count
+# + 1, back to the top and unread) instead of adding entries. The ids merged
+# into a group are kept next to it for the window plus the worker's retry
+# span, so a replayed queue event is not counted twice.
+
+# KEYS: entries hash, user list, unread set[, group, group merged ids]
+# ARGV: ttl, entry, id, expires at, now, push channel, notification json, max per user[, window, merged ids ttl]
+# Returns {1 created | 2 merged | 0 already written, stored id, count}.
+# Writing an id that already exists is a no-op, so queued events can be retried
+_CREATE_SCRIPT = """
+if KEYS[5] and redis.call('SISMEMBER', KEYS[5], ARGV[3]) == 1 then
+    return {0, ARGV[3], 0}
+end
+local target = KEYS[4] and redis.call('GET', KEYS[4])
+if target == ARGV[3] then
+    return {0, target, 0}
+end
+local current = target and redis.call('HGET', KEYS[1], target)
+if current then
+    local entry = cjson.decode(ARGV[2])
+    entry[6] = (cjson.decode(current)[6] or 1) + 1
+    redis.call('HSET', KEYS[1], target, cjson.encode(entry))
+    redis.call('SADD', KEYS[5], ARGV[3])
+    redis.call('EXPIRE', KEYS[5], ARGV[10])
+    redis.call('LREM', KEYS[2], 1, target)
+    redis.call('LPUSH', KEYS[2], target)
+    redis.call('ZADD', KEYS[3], ARGV[4], target)
+    for _, key in ipairs({KEYS[1], KEYS[2], KEYS[3]}) do
+        redis.call('EXPIRE', key, ARGV[1])
+    end
+    local push = cjson.decode(ARGV[7])
+    push['id'] = target
+    push['count'] = entry[6]
+    redis.call('PUBLISH', ARGV[6], cjson.encode(push))
+    return {2, target, entry[6]}
+end
+if redis.call('HSETNX', KEYS[1], ARGV[3], ARGV[2]) == 0 then
+    return {0, ARGV[3], 0}
+end
+if KEYS[4] then
+    redis.call('SET', KEYS[4], ARGV[3], 'EX', ARGV[9])
+end
+redis.call('LPUSH', KEYS[2], ARGV[3])
+for _, id in ipairs(redis.call('LRANGE', KEYS[2], ARGV[8], -1)) do
+    redis.call('HDEL', KEYS[1], id)
+    redis.call('ZREM', KEYS[3], id)
+end
+redis.call('LTRIM', KEYS[2], 0, ARGV[8] - 1)
+redis.call('ZREMRANGEBYSCORE', KEYS[3], '-inf', ARGV[5])
+redis.call('ZADD', KEYS[3], ARGV[4], ARGV[3])
+for _, key in ipairs({KEYS[1], KEYS[2], KEYS[3]}) do
+    redis.call('EXPIRE', key, ARGV[1])
+end
+redis.call('PUBLISH', ARGV[6], ARGV[7])
+return {1, ARGV[3], 1}
+"""
+
+# KEYS: entries hash, unread set
+# ARGV: id
+_MARK_READ_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('ZREM', KEYS[2], ARGV[1])
+return 1
+"""
+
+# KEYS: unread set, entries hash
+# ARGV: now, type
+_MARK_TYPE_READ_SCRIPT = """
+local marked = 0
+for _, id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], '(' .. ARGV[1], '+inf')) do
+    local data = redis.call('HGET', KEYS[2], id)
+    if data and cjson.decode(data)[3] == ARGV[2] then
+        redis.call('ZREM', KEYS[1], id)
+        marked = marked + 1
+    end
+end
+return marked
+"""
+
+# KEYS: entries hash, unread set, user list
+# ARGV: id
+_DELETE_SCRIPT = """
+redis.call('ZREM', KEYS[2], ARGV[1])
+redis.call('LREM', KEYS[3], 1, ARGV[1])
+return redis.call('HDEL', KEYS[1], ARGV[1])
+"""
+
 
 def create_notification(user_id: str, title: str, message: str, 
                       type_: str, related_id: Optional[str] = None) -> NotificationRedis:
-    """Create a new notification in Redis"""
+    """Create a new notification in Redis (or merge it into its group's, see _CREATE_SCRIPT)"""
     notification_id = str(uuid4())
     notification = NotificationRedis(
         id=notification_id,
@@ -31,77 +135,380 @@ def create_notification(user_id: str, title: str, message: str,
         created_at=datetime.utcnow()
     )
     
-    # Store notification data
-    key = NotificationRedis.create_key(user_id, notification_id)
-    redis_client.setex(key, settings.notification_ttl, notification.json())
-    
-    # Add to user's notification list
-    user_key = NotificationRedis.create_user_notifications_key(user_id)
-    redis_client.lpush(user_key, notification_id)
-    redis_client.expire(user_key, settings.notification_ttl)
+    # Store notification data, add it to the user's list and unread set
+    _, stored_id, count = redis_client.eval(*_create_args(notification))
+    notification.id = stored_id
+    notification.count = count
     
     return notification
 
+def _create_args(notification: NotificationRedis) -> tuple:
+    now = time.time()
+    keys = [
+        NotificationRedis.create_user_entries_key(notification.user_id),
+        NotificationRedis.create_user_notifications_key(notification.user_id),
+        NotificationRedis.create_user_unread_key(notification.user_id),
+    ]
+    args = [
+        settings.notification_ttl, _encode(notification), notification.id,
+        now + settings.notification_ttl, now,
+        NotificationRedis.create_user_channel(notification.user_id), notification.json(),
+        settings.notification_max_per_user
+    ]
+    if notification.related_id and settings.notification_coalesce_window_seconds > 0:
+        group_key = NotificationRedis.create_group_key(notification.user_id, notification.type, notification.related_id)
+        keys.extend([group_key, group_key + ":merged"])
+        # Queued events are replayed for up to max_attempts retry periods
+        retry_span = settings.notification_worker_max_attempts * settings.notification_worker_retry_idle_ms // 1000
+        args.extend([settings.notification_coalesce_window_seconds,
+                     settings.notification_coalesce_window_seconds + retry_span])
+    return (_CREATE_SCRIPT, len(keys), *keys, *args)
+
+def _encode(notification: NotificationRedis) -> str:
+    """[title, message, type, related_id, created_at epoch, count]"""
+    created_at = notification.created_at.replace(tzinfo=timezone.utc).timestamp()
+    return json.dumps(
+        [notification.title, notification.message, notification.type, notification.related_id,
+         round(created_at, 3), notification.count],
+        separators=(",", ":"), ensure_ascii=False
+    )
+
+def _decode(user_id: str, notification_id: str, data: str,
+            unread_score: Optional[float], now: float) -> Optional[NotificationRedis]:
+    """The notification, or None once older than notification_ttl"""
+    title, message, type_, related_id, created_at, *rest = json.loads(data)
+    if created_at + settings.notification_ttl <= now:
+        return None
+    return NotificationRedis(
+        id=notification_id,
+        user_id=user_id,
+        title=title,
+        message=message,
+        type=type_,
+        related_id=related_id,
+        is_read=unread_score is None,
+        count=rest[0] if rest else 1,
+        created_at=datetime.utcfromtimestamp(created_at)
+    )
+
 def get_user_notifications(user_id: str, skip: int = 0, limit: int = 50) -> List[NotificationRedis]:
-    """Get user's notifications with pagination"""
+    """Get user's notifications with pagination (two round trips: LRANGE, then HMGET + ZMSCORE)"""
     user_key = NotificationRedis.create_user_notifications_key(user_id)
     notification_ids = redis_client.lrange(user_key, skip, skip + limit - 1)
+    if not notification_ids:
+        return []
     
-    notifications = []
-    for nid in notification_ids:
-        key = NotificationRedis.create_key(user_id, nid)
-        data = redis_client.get(key)
-        if data:
-            notification_data = json.loads(data)
-            notifications.append(NotificationRedis(**notification_data))
-    
-    return notifications
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hmget(NotificationRedis.create_user_entries_key(user_id), notification_ids)
+    pipe.zmscore(NotificationRedis.create_user_unread_key(user_id), notification_ids)
+    data, unread_scores = pipe.execute()
+    # Ids without an entry come back as None, expired entries decode to None
+    now = time.time()
+    notifications = [
+        _decode(user_id, nid, entry, score, now)
+        for nid, entry, score in zip(notification_ids, data, unread_scores) if entry
+    ]
+    return [notification for notification in notifications if notification]
 
 def get_notification(user_id: str, notification_id: str) -> Optional[NotificationRedis]:
     """Get a specific notification"""
-    key = NotificationRedis.create_key(user_id, notification_id)
-    data = redis_client.get(key)
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.hget(NotificationRedis.create_user_entries_key(user_id), notification_id)
+    pipe.zscore(NotificationRedis.create_user_unread_key(user_id), notification_id)
+    data, unread_score = pipe.execute()
     if data:
-        notification_data = json.loads(data)
-        return NotificationRedis(**notification_data)
+        return _decode(user_id, notification_id, data, unread_score, time.time())
     return None
 
 def mark_as_read(user_id: str, notification_id: str) -> bool:
     """Mark notification as read"""
-    key = NotificationRedis.create_key(user_id, notification_id)
-    data = redis_client.get(key)
-    if data:
-        notification_data = json.loads(data)
-        notification_data['is_read'] = True
-        redis_client.setex(key, settings.notification_ttl, json.dumps(notification_data))
-        return True
-    return False
+    marked = redis_client.eval(
+        _MARK_READ_SCRIPT, 2,
+        NotificationRedis.create_user_entries_key(user_id),
+        NotificationRedis.create_user_unread_key(user_id),
+        notification_id
+    )
+    return marked == 1
 
 def mark_all_as_read(user_id: str) -> int:
-    """Mark all user's notifications as read"""
-    user_key = NotificationRedis.create_user_notifications_key(user_id)
-    notification_ids = redis_client.lrange(user_key, 0, -1)
-    
-    updated_count = 0
-    for nid in notification_ids:
-        if mark_as_read(user_id, nid):
-            updated_count += 1
-    
+    """Mark all user's notifications as read (one round trip: ZCOUNT + DEL in MULTI)"""
+    unread_key = NotificationRedis.create_user_unread_key(user_id)
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.zcount(unread_key, f"({time.time()}", "+inf")
+    pipe.delete(unread_key)
+    updated_count, _ = pipe.execute()
     return updated_count
 
+def mark_many_as_read(user_id: str, notification_ids: List[str]) -> int:
+    """Mark the given notifications as read in one round trip, return how many were unread"""
+    if not notification_ids:
+        return 0
+    unread_key = NotificationRedis.create_user_unread_key(user_id)
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.zmscore(unread_key, notification_ids)
+    pipe.zrem(unread_key, *notification_ids)
+    scores, _ = pipe.execute()
+    now = time.time()
+    return sum(1 for score in scores if score is not None and score > now)
+
+
+def mark_type_as_read(user_id: str, type_: str) -> int:
+    """Mark all unread notifications of one type as read (one script call)"""
+    return redis_client.eval(
+        _MARK_TYPE_READ_SCRIPT, 2,
+        NotificationRedis.create_user_unread_key(user_id),
+        NotificationRedis.create_user_entries_key(user_id),
+        time.time(), type_
+    )
+
 def delete_notification(user_id: str, notification_id: str) -> bool:
-    """Delete a notification"""
-    key = NotificationRedis.create_key(user_id, notification_id)
-    user_key = NotificationRedis.create_user_notifications_key(user_id)
-    
-    # Remove from user's list
-    redis_client.lrem(user_key, 0, notification_id)
-    
-    # Delete notification data
-    deleted = redis_client.delete(key)
-    return deleted > 0
+    """Delete a notification (LREM walks at most notification_max_per_user ids)"""
+    deleted = redis_client.eval(
+        _DELETE_SCRIPT, 3,
+        NotificationRedis.create_user_entries_key(user_id),
+        NotificationRedis.create_user_unread_key(user_id),
+        NotificationRedis.create_user_notifications_key(user_id),
+        notification_id
+    )
+    return bool(deleted)
 
 def get_unread_count(user_id: str) -> int:
-    """Get count of unread notifications"""
-    notifications = get_user_notifications(user_id, 0, 1000)  # Get all
-    return sum(1 for n in notifications if not n.is_read)
\ No newline at end of file
+    """Get count of unread notifications (one ZCOUNT over entries not yet expired)"""
+    unread_key = NotificationRedis.create_user_unread_key(user_id)
+    return redis_client.zcount(unread_key, f"({time.time()}", "+inf")
+
+
+def migrate_user_notifications(user_id: str) -> int:
+    """
+    Move a user's notifications from the legacy one-key-per-notification layout
+    (notification:{user}:{id}) into the entries hash, keeping unread state and
+    order, then delete the legacy keys. Safe to re-run and to run while new
+    notifications arrive. Returns how many notifications the user has after.
+    """
+    user_key = NotificationRedis.create_user_notifications_key(user_id)
+    entries_key = NotificationRedis.create_user_entries_key(user_id)
+    unread_key = NotificationRedis.create_user_unread_key(user_id)
+
+    with redis_client.pipeline() as pipe:
+        while True:
+            try:
+                # Retry if a notification is written, read or deleted meanwhile
+                pipe.watch(user_key, unread_key, entries_key)
+                ids = pipe.lrange(user_key, 0, -1)
+                if not ids:
+                    return 0
+                legacy_keys = [NotificationRedis.create_key(user_id, nid) for nid in ids]
+                reads = redis_client.pipeline(transaction=False)
+                reads.exists(unread_key)
+                reads.zmscore(unread_key, ids)
+                reads.hmget(entries_key, ids)
+                reads.mget(legacy_keys)
+                for key in legacy_keys:
+                    reads.ttl(key)
+                had_unread_set, unread_scores, current, legacy, *ttls = reads.execute()
+
+                now = time.time()
+                kept, entries, unread = [], {}, {}
+                for nid, score, entry, data, ttl in zip(ids, unread_scores, current, legacy, ttls):
+                    if entry:
+                        kept.append(nid)
+                    elif data and ttl > 0:
+                        stored = json.loads(data)
+                        entries[nid] = _encode(NotificationRedis(**stored))
+                        kept.append(nid)
+                        # Data written before the unread set kept is_read in the JSON
+                        if not had_unread_set and not stored.get("is_read"):
+                            score = now + ttl
+                    else:
+                        continue
+                    if score is not None:
+                        unread[nid] = score
+                kept = kept[:settings.notification_max_per_user]
+                unread = {nid: unread[nid] for nid in kept if nid in unread}
+
+                pipe.multi()
+                if entries:
+                    pipe.hset(entries_key, mapping=entries)
+                dropped = set(ids).difference(kept)
+                if dropped:
+                    pipe.hdel(entries_key, *dropped)
+                pipe.delete(user_key, unread_key, *legacy_keys)
+                if kept:
+                    pipe.rpush(user_key, *kept)
+                if unread:
+                    pipe.zadd(unread_key, unread)
+                for key in (entries_key, user_key, unread_key):
+                    pipe.expire(key, settings.notification_ttl)
+                pipe.execute()
+                return len(kept)
+            except redis.WatchError:
+                continue
+
+
+# Outbox: request handlers append one stream entry per notification and return;
+# the worker (scripts/notification_worker.py) reads the stream through a consumer
+# group and writes notifications in batches. Entries are acknowledged only once
+# written, so a crashed or failing write stays pending and is claimed again.
+NOTIFICATION_QUEUE_KEY = "notifications:outbox"
+NOTIFICATION_QUEUE_GROUP = "notification-writers"
+# Entries that kept failing, kept for inspection
+NOTIFICATION_DEAD_LETTER_KEY = "notifications:outbox:dead"
+
+def enqueue_notification(user_id: str, title: str, message: str,
+                         type_: str, related_id: Optional[str] = None) -> Optional[str]:
+    """
+    Queue a notification for the worker (one XADD), return its id. Types in
+    notification_digest_types are counted for the user's next digest instead
+    (None is returned).
+    """
+    if type_ in _digest_types():
+        add_to_digest(user_id, type_)
+        return None
+    notification_id = str(uuid4())
+    fields = {
+        "id": notification_id,
+        "user_id": user_id,
+        "title": title,
+        "message": message,
+        "type": type_,
+        "created_at": datetime.utcnow().isoformat()
+    }
+    if related_id:
+        fields["related_id"] = related_id
+    redis_client.xadd(
+        NOTIFICATION_QUEUE_KEY, fields,
+        maxlen=settings.notification_queue_maxlen, approximate=True
+    )
+    return notification_id
+
+def _digest_types() -> set:
+    return {type_.strip() for type_ in settings.notification_digest_types.split(",") if type_.strip()}
+
+def ensure_notification_group():
+    """Create the consumer group (and stream) if missing"""
+    try:
+        redis_client.xgroup_create(NOTIFICATION_QUEUE_KEY, NOTIFICATION_QUEUE_GROUP, id="0", mkstream=True)
+    except redis.ResponseError as e:
+        if "BUSYGROUP" not in str(e):
+            raise
+
+def read_notification_events(consumer: str, count: int, block_ms: int) -> List[Tuple[str, Dict[str, str]]]:
+    """New queue entries for this consumer, waiting up to block_ms for some"""
+    response = redis_client.xreadgroup(
+        NOTIFICATION_QUEUE_GROUP, consumer, {NOTIFICATION_QUEUE_KEY: ">"},
+        count=count, block=block_ms
+    )
+    return response[0][1] if response else []
+
+def claim_stale_notification_events(consumer: str, count: int) -> List[Tuple[str, Dict[str, str]]]:
+    """
+    Take over entries left unacknowledged for notification_worker_retry_idle_ms
+    (failed writes, dead consumers). Entries delivered max_attempts times go to
+    the dead-letter stream instead.
+    """
+    pending = redis_client.xpending_range(
+        NOTIFICATION_QUEUE_KEY, NOTIFICATION_QUEUE_GROUP, "-", "+", count,
+        idle=settings.notification_worker_retry_idle_ms
+    )
+    if not pending:
+        return []
+    exhausted = {
+        p["message_id"] for p in pending
+        if p["times_delivered"] >= settings.notification_worker_max_attempts
+    }
+    claimed = redis_client.xclaim(
+        NOTIFICATION_QUEUE_KEY, NOTIFICATION_QUEUE_GROUP, consumer,
+        settings.notification_worker_retry_idle_ms, [p["message_id"] for p in pending]
+    )
+
+    events, dead = [], []
+    for entry_id, fields in claimed:
+        (dead if entry_id in exhausted else events).append((entry_id, fields))
+    _dead_letter(dead)
+    return events
+
+def _dead_letter(events: List[Tuple[str, Dict[str, str]]]):
+    """Move entries to the dead-letter stream and acknowledge them"""
+    if not events:
+        return
+    pipe = redis_client.pipeline(transaction=True)
+    for entry_id, fields in events:
+        pipe.xadd(NOTIFICATION_DEAD_LETTER_KEY, {**fields, "entry_id": entry_id},
+                  maxlen=settings.notification_queue_maxlen, approximate=True)
+    pipe.xack(NOTIFICATION_QUEUE_KEY, NOTIFICATION_QUEUE_GROUP, *[entry_id for entry_id, _ in events])
+    pipe.execute()
+
+def write_notification_events(events: List[Tuple[str, Dict[str, str]]]) -> int:
+    """
+    Write a batch of queued notifications in one round trip and acknowledge the
+    ones written; failed entries stay pending for a retry and malformed ones
+    go straight to the dead-letter stream. Returns how many were written.
+    """
+    valid, malformed = [], []
+    for entry_id, fields in events:
+        try:
+            valid.append((entry_id, _create_args(NotificationRedis(**fields))))
+        except (ValueError, TypeError):
+            # Would fail on every retry, and must not hold up the rest of the batch
+            malformed.append((entry_id, fields))
+    _dead_letter(malformed)
+    if not valid:
+        return 0
+    pipe = redis_client.pipeline(transaction=False)
+    for _, args in valid:
+        pipe.eval(*args)
+    results = pipe.execute(raise_on_error=False)
+
+    written = [
+        entry_id for (entry_id, _), result in zip(valid, results)
+        if not isinstance(result, Exception)
+    ]
+    if written:
+        redis_client.xack(NOTIFICATION_QUEUE_KEY, NOTIFICATION_QUEUE_GROUP, *written)
+    return len(written)
+
+
+
+# Digests: notifications of the digest types only bump a per-user counter; the
+# digest job (scripts/notification_digest.py) periodically turns each user's
+# counters into one notification.
+NOTIFICATION_DIGEST_PENDING_KEY = "notifications:digest_pending"
+DIGEST_NOTIFICATION_TYPE = "digest"
+
+def add_to_digest(user_id: str, type_: str):
+    """Count a notification towards the user's next digest (one round trip)"""
+    digest_key = NotificationRedis.create_user_digest_key(user_id)
+    pipe = redis_client.pipeline(transaction=True)
+    pipe.hincrby(digest_key, type_, 1)
+    pipe.expire(digest_key, settings.notification_ttl)
+    pipe.sadd(NOTIFICATION_DIGEST_PENDING_KEY, user_id)
+    pipe.execute()
+
+def flush_notification_digests(batch_size: int = 1000) -> int:
+    """
+    Create the digest notification of a batch of users with pending counts,
+    return how many were sent. Call until it returns 0 to drain.
+    """
+    user_ids = redis_client.spop(NOTIFICATION_DIGEST_PENDING_KEY, batch_size) or []
+    if not user_ids:
+        return 0
+    pipe = redis_client.pipeline(transaction=True)
+    for user_id in user_ids:
+        digest_key = NotificationRedis.create_user_digest_key(user_id)
+        pipe.hgetall(digest_key)
+        pipe.delete(digest_key)
+    results = pipe.execute()
+
+    sent = 0
+    for user_id, counts in zip(user_ids, results[0::2]):
+        if not counts:
+            continue
+        counts = {type_: int(count) for type_, count in counts.items()}
+        summary = ", ".join(f"{count} {type_}" for type_, count in sorted(counts.items()))
+        create_notification(
+            user_id, "Notification digest",
+            f"{sum(counts.values())} new notifications: {summary}",
+            DIGEST_NOTIFICATION_TYPE
+        )
+        sent += 1
+    return sent
@@ -0,0 +1,184 @@
+from datetime import date, timedelta
+from typing import Dict, Optional
+from uuid import UUID
+
+import redis
+from sqlalchemy import Date, case, cast, delete, event, func, insert, select, tuple_
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import get_history
+
+from app.database import redis_client
+from app.models.organization_task_rollup import organization_task_rollups
+from app.models.project import Project
+from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
+
+# Projects whose tasks changed since the rollup worker last ran: project id ->
+# change counter, so a project changed again during its refresh stays dirty
+ROLLUP_DIRTY_KEY = "rollup:dirty_projects"
+
+# KEYS: dirty hash
+# ARGV: project id, counter seen by the refresh, ...
+_ACK_SCRIPT = """
+local done = 0
+for i = 1, #ARGV, 2 do
+    if redis.call('HGET', KEYS[1], ARGV[i]) == ARGV[i + 1] then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+        done = done + 1
+    end
+end
+return done
+"""
+
+_ROLLUP_COLUMNS = ["organization_id", "project_id", "day", "status", "priority", "task_count"]
+
+# Advisory locks (two-key form, apart from the task stats locks): refreshes take
+# the table lock shared and their project lock exclusive, the full rebuild takes
+# the table lock exclusive
+_ROLLUP_LOCK_SPACE = func.hashtext("organization_task_rollups")
+_ALL_ROLLUPS_LOCK_ID = 0
+
+
+def get_organization_summary(db: Session, organization_id: UUID, days: int = 30) -> Dict:
+    """
+    Organization task summary, read only from the rollup table
+    (one range scan on its primary key, independent of task volume).
+    Summed in SQL with grouping sets, so the rows returned grow with projects
+    and days shown, not with the organization's history.
+    """
+    rollup = organization_task_rollups.c
+    since = date.today() - timedelta(days=days - 1)
+    recent_day = case((rollup.day >= since, rollup.day))
+    rows = db.execute(
+        select(rollup.project_id, rollup.status, rollup.priority, recent_day, func.sum(rollup.task_count))
+        .where(rollup.organization_id == organization_id)
+        .group_by(func.grouping_sets(
+            tuple_(rollup.project_id, rollup.status), tuple_(rollup.priority), tuple_(recent_day)
+        ))
+    ).all()
+
+    status_counts = {status.value: 0 for status in TaskStatusEnum}
+    priority_counts = {priority.value: 0 for priority in TaskPriorityEnum}
+    projects: Dict[str, Dict[str, int]] = {}
+    created_per_day = {str(since + timedelta(days=i)): 0 for i in range(days)}
+
+    # Each row belongs to one grouping set, the other columns are NULL
+    for project_id, status, priority, day, task_count in rows:
+        if project_id is not None:
+            status = _value(status)
+            status_counts[status] += task_count
+            project_counts = projects.setdefault(
+                str(project_id), {member.value: 0 for member in TaskStatusEnum}
+            )
+            project_counts[status] += task_count
+        elif priority is not None:
+            priority_counts[_value(priority)] += task_count
+        elif day is not None:
+            created_per_day[str(day)] = task_count
+
+    return {
+        "organization_id": str(organization_id),
+        "total_tasks": sum(status_counts.values()),
+        "status_counts": status_counts,
+        "priority_counts": priority_counts,
+        "projects": [
+            {"project_id": project_id, "total": sum(counts.values()), "status_counts": counts}
+            for project_id, counts in projects.items()
+        ],
+        "created_per_day": created_per_day
+    }
+
+
+def _rollup_source(project_id: Optional[UUID] = None):
+    day = cast(Task.created_at, Date)
+    query = select(
+        Project.organization_id, Task.project_id, day, Task.status, Task.priority, func.count(Task.id)
+    ).join(Project, Project.id == Task.project_id).group_by(
+        Project.organization_id, Task.project_id, day, Task.status, Task.priority
+    )
+    if project_id is not None:
+        query = query.where(Task.project_id == project_id)
+    return query
+
+
+def refresh_project_rollup(db: Session, project_id: UUID):
+    """Recompute the rollup rows of one project (caller commits)"""
+    # Wait for a full rebuild, and for another worker refreshing the same project
+    db.execute(select(
+        func.pg_advisory_xact_lock_shared(_ROLLUP_LOCK_SPACE, _ALL_ROLLUPS_LOCK_ID),
+        func.pg_advisory_xact_lock(_ROLLUP_LOCK_SPACE, func.hashtext(str(project_id)))
+    ))
+    db.execute(delete(organization_task_rollups).where(organization_task_rollups.c.project_id == project_id))
+    db.execute(insert(organization_task_rollups).from_select(_ROLLUP_COLUMNS, _rollup_source(project_id)))
+
+
+def refresh_dirty_rollups(db: Session, batch_size: int = 100) -> int:
+    """
+    Refresh a batch of dirty projects and return how many were refreshed.
+    Projects leave the dirty hash only once their refresh is committed (and
+    only if unchanged since), so a failure or crash just retries them.
+    """
+    dirty = redis_client.hrandfield(ROLLUP_DIRTY_KEY, batch_size, withvalues=True) or []
+    project_ids = dirty[::2]
+    if not project_ids:
+        return 0
+    try:
+        # Same lock order in every worker
+        for project_id in sorted(project_ids):
+            refresh_project_rollup(db, UUID(project_id))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    redis_client.eval(_ACK_SCRIPT, 1, ROLLUP_DIRTY_KEY, *dirty)
+    return len(project_ids)
+
+
+def rebuild_all_rollups(db: Session) -> int:
+    """Recompute the whole rollup table, e.g. after a lost dirty set"""
+    db.execute(select(func.pg_advisory_xact_lock(_ROLLUP_LOCK_SPACE, _ALL_ROLLUPS_LOCK_ID)))
+    db.execute(delete(organization_task_rollups))
+    result = db.execute(insert(organization_task_rollups).from_select(_ROLLUP_COLUMNS, _rollup_source()))
+    db.commit()
+    return result.rowcount
+
+
+def mark_rollup_dirty(*project_ids):
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for project_id in project_ids:
+            pipe.hincrby(ROLLUP_DIRTY_KEY, str(project_id), 1)
+        pipe.execute()
+    except redis.RedisError:
+        # The rollup worker's periodic full rebuild (--full-interval) catches up
+        pass
+
+
+def _value(member) -> str:
+    return member.value if hasattr(member, "value") else member
+
+
+@event.listens_for(Task, "after_insert")
+@event.listens_for(Task, "after_delete")
+@event.listens_for(Task, "after_update")
+def _queue_rollup_refresh(mapper, connection, target):
+    project_ids = {target.project_id}
+    project_history = get_history(target, "project_id")
+    project_ids.update(project_history.deleted)
+    # Mark only once the change is committed
+    session = object_session(target)
+    if session is None:
+        mark_rollup_dirty(*project_ids)
+        return
+    session.info.setdefault("rollup_dirty_projects", set()).update(project_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _flush_dirty_rollups(session):
+    project_ids = session.info.pop("rollup_dirty_projects", None)
+    if project_ids:
+        mark_rollup_dirty(*project_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_dirty_rollups(session):
+    session.info.pop("rollup_dirty_projects", None)
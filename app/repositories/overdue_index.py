@@ -0,0 +1,166 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import UUID
+
+import redis
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session, object_session
+from sqlalchemy.orm.attributes import get_history
+
+from app.database import SessionLocal, redis_client
+from app.models.task import Task, TaskStatusEnum
+
+# Per-project sorted set of open tasks (status != done) with a due date, scored
+# by due date. Overdue tasks are the range (-inf, now), so the listing is always
+# current without caching whole results. The marker member (score +inf) tells a
+# complete set from one that was only touched by writes after an expiry.
+_BUILT_MARKER = "_built"
+# Rebuilt from the database at least daily to repair any drift
+_INDEX_TTL = 24 * 3600
+
+
+def overdue_index_key(project_id: UUID) -> str:
+    return f"tasks:project:{project_id}:open_due"
+
+
+def _score(due_date: datetime) -> float:
+    # due_date is stored as naive UTC
+    if due_date.tzinfo is None:
+        due_date = due_date.replace(tzinfo=timezone.utc)
+    return due_date.timestamp()
+
+
+def _is_open(status, due_date) -> bool:
+    return due_date is not None and status not in (TaskStatusEnum.DONE, TaskStatusEnum.DONE.value)
+
+
+def _open_tasks_with_due_date(db: Session, project_id: UUID):
+    # Served by idx_tasks_open_project_due (partial index on open tasks)
+    return db.execute(
+        select(Task.id, Task.due_date).where(
+            Task.project_id == project_id,
+            Task.status != TaskStatusEnum.DONE,
+            Task.due_date.isnot(None)
+        )
+    ).all()
+
+
+def get_overdue_task_ids(db: Session, project_id: UUID, now: Optional[datetime] = None) -> List[str]:
+    """
+    Ids of open tasks of a project whose due date is before `now`, earliest
+    due first. Rebuilds the project's index from the database when missing.
+    """
+    now = now or datetime.utcnow()
+    key = overdue_index_key(project_id)
+    try:
+        pipe = redis_client.pipeline()
+        pipe.zscore(key, _BUILT_MARKER)
+        pipe.zrangebyscore(key, "-inf", f"({_score(now)}")
+        built, task_ids = pipe.execute()
+        if built is not None:
+            return task_ids
+        rebuild = True
+    except redis.RedisError:
+        rebuild = False
+
+    if rebuild:
+        # From the primary: a lagging replica could miss tasks whose index
+        # entries were already written after their commit
+        primary = SessionLocal()
+        try:
+            rows = _open_tasks_with_due_date(primary, project_id)
+        finally:
+            primary.close()
+        _rebuild_index(key, rows)
+    else:
+        rows = _open_tasks_with_due_date(db, project_id)
+    overdue = sorted((due_date, str(task_id)) for task_id, due_date in rows if due_date < now)
+    return [task_id for _, task_id in overdue]
+
+
+def _rebuild_index(key: str, rows):
+    """
+    Add the rows to a set that has no marker (expired, or only touched by writes
+    since). Entries already there come from commits at least as recent as the
+    rows, so they are kept as they are (NX) rather than replaced; a task closed
+    after the rows were read is re-added but filtered by the listing's re-check.
+    """
+    mapping = {str(task_id): _score(due_date) for task_id, due_date in rows}
+    mapping[_BUILT_MARKER] = float("inf")
+    try:
+        pipe = redis_client.pipeline(transaction=True)
+        pipe.zadd(key, mapping, nx=True)
+        pipe.expire(key, _INDEX_TTL)
+        pipe.execute()
+    except redis.RedisError:
+        pass
+
+
+def _apply_changes(changes):
+    """changes: (project_id, task_id, due score or None to remove)"""
+    try:
+        pipe = redis_client.pipeline()
+        for project_id, task_id, score in changes:
+            key = overdue_index_key(project_id)
+            if score is None:
+                pipe.zrem(key, task_id)
+            else:
+                pipe.zadd(key, {task_id: score})
+        pipe.execute()
+    except redis.RedisError:
+        # Listings re-check status and due date; the daily rebuild catches up
+        pass
+
+
+def _previous(target, attr: str):
+    history = get_history(target, attr)
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, attr)
+
+
+def _queue(target, changes):
+    session = object_session(target)
+    if session is None:
+        _apply_changes(changes)
+        return
+    session.info.setdefault("overdue_index_changes", []).extend(changes)
+
+
+@event.listens_for(Task, "after_insert")
+def _index_inserted_task(mapper, connection, target):
+    if _is_open(target.status, target.due_date):
+        _queue(target, [(target.project_id, str(target.id), _score(target.due_date))])
+
+
+@event.listens_for(Task, "after_delete")
+def _unindex_deleted_task(mapper, connection, target):
+    _queue(target, [(target.project_id, str(target.id), None)])
+
+
+@event.listens_for(Task, "after_update")
+def _reindex_updated_task(mapper, connection, target):
+    if not any(get_history(target, attr).has_changes() for attr in ("project_id", "status", "due_date")):
+        return
+    old_project_id = _previous(target, "project_id")
+    changes = []
+    if old_project_id != target.project_id:
+        changes.append((old_project_id, str(target.id), None))
+    if _is_open(target.status, target.due_date):
+        changes.append((target.project_id, str(target.id), _score(target.due_date)))
+    else:
+        changes.append((target.project_id, str(target.id), None))
+    _queue(target, changes)
+
+
+# Applied only once the task change is committed
+@event.listens_for(Session, "after_commit")
+def _flush_index_changes(session):
+    changes = session.info.pop("overdue_index_changes", None)
+    if changes:
+        _apply_changes(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_index_changes(session):
+    session.info.pop("overdue_index_changes", None)
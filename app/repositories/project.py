@@ -1,7 +1,11 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from uuid import UUID
 from app.models.project import Project
+from app.repositories.project_member import invalidate_members_cache
+from app.core.request_memo import memo_get, memo_get_async, memo_discard
 
 
 def create_project(db: Session, name: str, description: str, organization_id: UUID) -> Project:
@@ -20,9 +24,19 @@ def get_project_by_name_and_org(db: Session, name: str, organization_id: UUID) -
     ).first()
 
 def get_project_by_id(db: Session, project_id: UUID) -> Optional[Project]:
-    """Get a project by ID"""
-    return db.query(Project).filter(Project.id == project_id).first()
+    """Get a project by ID (loaded once per request)"""
+    return memo_get(
+        db, ("project", project_id),
+        lambda: db.query(Project).filter(Project.id == project_id).first()
+    )
 
+async def get_project_by_id_async(db: AsyncSession, project_id: UUID) -> Optional[Project]:
+    """Get a project by ID (async session, loaded once per request)"""
+    async def load():
+        result = await db.execute(select(Project).where(Project.id == project_id))
+        return result.scalars().first()
+
+    return await memo_get_async(db, ("project_async", project_id), load)
 
 
 
@@ -49,6 +63,8 @@ def delete_project(db: Session, project_id: UUID) -> bool:
     if project:
         db.delete(project)
         db.commit()
+        memo_discard(db, ("project", project_id), ("project_async", project_id))
+        invalidate_members_cache(project_id)
         return True
     return False
 
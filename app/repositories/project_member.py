@@ -1,9 +1,59 @@
+from sqlalchemy import select, exists
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from uuid import UUID
+import redis
 from app.models.project import Project
+from app.models.project_member import project_members
 from app.models.user import User
-
+from app.config import settings
+from app.database import redis_client, async_redis_client
+from app.core.request_memo import memo_get, memo_get_async, memo_discard
+
+# Members of a project are cached as a Redis set of user ids. The sentinel
+# member marks the set as loaded, so an empty project still has a key.
+MEMBERS_CACHE_SENTINEL = "*"
+
+# Replace the cached set only if no add/remove happened since the caller read
+# the version, so a slow warm-up can't overwrite a newer membership change.
+_WARM_MEMBERS_SCRIPT = """
+local current = redis.call('GET', KEYS[2]) or ''
+if current ~= ARGV[1] then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+for i = 3, #ARGV do
+    redis.call('SADD', KEYS[1], ARGV[i])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# Bump the version and patch the set in place when it is loaded
+_CHANGE_MEMBER_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    if ARGV[1] == 'add' then
+        redis.call('SADD', KEYS[1], ARGV[2])
+    else
+        redis.call('SREM', KEYS[1], ARGV[2])
+    end
+end
+return 1
+"""
+
+_warm_members = redis_client.register_script(_WARM_MEMBERS_SCRIPT)
+_warm_members_async = async_redis_client.register_script(_WARM_MEMBERS_SCRIPT)
+_change_member = redis_client.register_script(_CHANGE_MEMBER_SCRIPT)
+
+
+def _members_cache_key(project_id: UUID) -> str:
+    return f"project_members:{project_id}"
+
+def _members_version_key(project_id: UUID) -> str:
+    return f"project_members:{project_id}:version"
 
 
 def add_project_member(db: Session, project_id: UUID, user_id: UUID) -> User:
@@ -17,6 +67,8 @@ def add_project_member(db: Session, project_id: UUID, user_id: UUID) -> User:
     # Thêm user vào project qua relationship
     project.users.append(user)
     db.commit()
+    memo_discard(db, ("member", project_id, user_id))
+    _update_members_cache(project_id, user_id, "add")
     db.refresh(user)
     return user
 
@@ -32,6 +84,8 @@ def remove_project_member(db: Session, project_id: UUID, user_id: UUID) -> bool:
     if user in project.users:
         project.users.remove(user)
         db.commit()
+        memo_discard(db, ("member", project_id, user_id))
+        _update_members_cache(project_id, user_id, "rem")
         return True
     return False
 
@@ -89,8 +143,98 @@ def get_user_project_role(db: Session, project_id: UUID, user_id: UUID) -> Optio
     return None
 
 def is_project_member(db: Session, project_id: UUID, user_id: UUID) -> bool:
-    """Check if a user is a member of a project"""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
-        return False
-    return any(user.id == user_id for user in project.users)
+    """
+    Check if a user is a member of a project.
+    One SMISMEMBER on the cached member set; indexed EXISTS on project_members on a cache miss.
+    The answer is memoized for the rest of the request.
+    """
+    return memo_get(
+        db, ("member", project_id, user_id),
+        lambda: _is_project_member_cached(db, project_id, user_id)
+    )
+
+async def is_project_member_async(db: AsyncSession, project_id: UUID, user_id: UUID) -> bool:
+    """Check if a user is a member of a project (async session)"""
+    return await memo_get_async(
+        db, ("member", project_id, user_id),
+        lambda: _is_project_member_cached_async(db, project_id, user_id)
+    )
+
+def _is_project_member_cached(db: Session, project_id: UUID, user_id: UUID) -> bool:
+    key = _members_cache_key(project_id)
+    try:
+        is_member, loaded = redis_client.smismember(key, [str(user_id), MEMBERS_CACHE_SENTINEL])
+        if loaded:
+            return bool(is_member)
+        version = redis_client.get(_members_version_key(project_id)) or ""
+    except redis.RedisError:
+        return _is_project_member_db(db, project_id, user_id)
+
+    is_member = _is_project_member_db(db, project_id, user_id)
+    member_ids = db.query(project_members.c.user_id).filter(
+        project_members.c.project_id == project_id
+    ).all()
+    try:
+        _warm_members(
+            keys=[key, _members_version_key(project_id)],
+            args=[version, settings.membership_cache_ttl, MEMBERS_CACHE_SENTINEL]
+                 + [str(member_id) for (member_id,) in member_ids]
+        )
+    except redis.RedisError:
+        pass
+    return is_member
+
+async def _is_project_member_cached_async(db: AsyncSession, project_id: UUID, user_id: UUID) -> bool:
+    key = _members_cache_key(project_id)
+    try:
+        is_member, loaded = await async_redis_client.smismember(key, [str(user_id), MEMBERS_CACHE_SENTINEL])
+        if loaded:
+            return bool(is_member)
+        version = await async_redis_client.get(_members_version_key(project_id)) or ""
+    except redis.RedisError:
+        return await _is_project_member_db_async(db, project_id, user_id)
+
+    is_member = await _is_project_member_db_async(db, project_id, user_id)
+    result = await db.execute(
+        select(project_members.c.user_id).where(project_members.c.project_id == project_id)
+    )
+    try:
+        await _warm_members_async(
+            keys=[key, _members_version_key(project_id)],
+            args=[version, settings.membership_cache_ttl, MEMBERS_CACHE_SENTINEL]
+                 + [str(member_id) for member_id in result.scalars().all()]
+        )
+    except redis.RedisError:
+        pass
+    return is_member
+
+def _membership_exists_clause(project_id: UUID, user_id: UUID):
+    # Served by idx_project_members_project_user
+    return exists().where(
+        project_members.c.project_id == project_id,
+        project_members.c.user_id == user_id
+    )
+
+def _is_project_member_db(db: Session, project_id: UUID, user_id: UUID) -> bool:
+    return bool(db.query(_membership_exists_clause(project_id, user_id)).scalar())
+
+async def _is_project_member_db_async(db: AsyncSession, project_id: UUID, user_id: UUID) -> bool:
+    result = await db.execute(select(_membership_exists_clause(project_id, user_id)))
+    return bool(result.scalar())
+
+def _update_members_cache(project_id: UUID, user_id: UUID, operation: str):
+    """Apply an add/remove to the cached member set (call after the DB commit)"""
+    try:
+        _change_member(
+            keys=[_members_cache_key(project_id), _members_version_key(project_id)],
+            args=[operation, str(user_id), settings.membership_cache_ttl * 2]
+        )
+    except redis.RedisError:
+        pass
+
+def invalidate_members_cache(project_id: UUID):
+    """Drop the cached member set of a project (e.g. project deleted)"""
+    try:
+        redis_client.delete(_members_cache_key(project_id), _members_version_key(project_id))
+    except redis.RedisError:
+        pass
@@ -0,0 +1,127 @@
+from typing import Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+
+from app.models.project_task_stats import project_task_stats
+from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
+
+
+def get_project_task_stats(db: Session, project_id: UUID) -> Dict[str, Dict[str, int]]:
+    """
+    Task counts of a project by status and by priority, read from the
+    maintained counters (at most 9 rows, primary key lookup).
+    """
+    rows = db.execute(
+        select(
+            project_task_stats.c.status,
+            project_task_stats.c.priority,
+            project_task_stats.c.task_count
+        ).where(project_task_stats.c.project_id == project_id)
+    ).all()
+
+    by_status = {status.value: 0 for status in TaskStatusEnum}
+    by_priority = {priority.value: 0 for priority in TaskPriorityEnum}
+    for status, priority, task_count in rows:
+        by_status[_value(status)] += task_count
+        by_priority[_value(priority)] += task_count
+    return {
+        "status": by_status,
+        "priority": by_priority,
+        "total": sum(by_status.values())
+    }
+
+
+def reconcile_project_task_stats(db: Session, project_id: Optional[UUID] = None) -> int:
+    """
+    Rebuild the counters from the tasks table (one project, or all when
+    project_id is None) and return the number of rows written. Repairs any
+    drift, e.g. from writes that bypassed the ORM.
+    """
+    group = select(
+        Task.project_id, Task.status, Task.priority, func.count(Task.id)
+    ).group_by(Task.project_id, Task.status, Task.priority)
+    clear = delete(project_task_stats)
+    if project_id is not None:
+        # Wait for in-flight task writes of the project, block new ones until commit
+        db.execute(select(func.pg_advisory_xact_lock(_lock_id(project_id))))
+        group = group.where(Task.project_id == project_id)
+        clear = clear.where(project_task_stats.c.project_id == project_id)
+    else:
+        db.execute(select(func.pg_advisory_xact_lock(_ALL_PROJECTS_LOCK_ID)))
+
+    db.execute(clear)
+    result = db.execute(
+        insert(project_task_stats).from_select(
+            ["project_id", "status", "priority", "task_count"], group
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+# Advisory locks: task writers take the project lock (and the global one) shared,
+# reconciliation takes it exclusive
+_ALL_PROJECTS_LOCK_ID = 0
+
+
+def _lock_id(project_id: UUID):
+    return func.hashtext(str(project_id))
+
+
+def _value(member) -> str:
+    return member.value if hasattr(member, "value") else member
+
+
+def _apply_delta(connection, project_id: UUID, status, priority, delta: int):
+    stmt = pg_insert(project_task_stats).values(
+        project_id=project_id, status=status, priority=priority, task_count=delta
+    )
+    connection.execute(stmt.on_conflict_do_update(
+        index_elements=["project_id", "status", "priority"],
+        set_={"task_count": project_task_stats.c.task_count + stmt.excluded.task_count}
+    ))
+
+
+def _lock_shared(connection, project_id: UUID):
+    connection.execute(select(
+        func.pg_advisory_xact_lock_shared(_ALL_PROJECTS_LOCK_ID),
+        func.pg_advisory_xact_lock_shared(_lock_id(project_id))
+    ))
+
+
+def _previous(target, attr: str):
+    history = get_history(target, attr)
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, attr)
+
+
+# The counters change in the same transaction as the task row (flush-time
+# mapper events run on the flushing connection)
+@event.listens_for(Task, "after_insert")
+def _count_inserted_task(mapper, connection, target):
+    _lock_shared(connection, target.project_id)
+    _apply_delta(connection, target.project_id, target.status, target.priority, 1)
+
+
+@event.listens_for(Task, "after_delete")
+def _count_deleted_task(mapper, connection, target):
+    _lock_shared(connection, target.project_id)
+    _apply_delta(connection, target.project_id, target.status, target.priority, -1)
+
+
+@event.listens_for(Task, "after_update")
+def _count_updated_task(mapper, connection, target):
+    old = tuple(_previous(target, attr) for attr in ("project_id", "status", "priority"))
+    new = (target.project_id, target.status, target.priority)
+    if tuple(map(_value, old)) == tuple(map(_value, new)):
+        return
+    _lock_shared(connection, old[0])
+    _apply_delta(connection, *old, -1)
+    if new[0] != old[0]:
+        _lock_shared(connection, new[0])
+    _apply_delta(connection, *new, 1)
@@ -1,58 +1,50 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_
 from typing import Dict, List
 from uuid import UUID
 from datetime import datetime
 import json
+import time
 
-from app.models.task import Task
+from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
 from app.database import redis_client
 from app.config import settings
+from app.core.single_flight import get_or_compute
+from app.repositories.overdue_index import get_overdue_task_ids
+from app.repositories.project_task_stats import get_project_task_stats
 
 def get_project_task_count_by_status(db: Session, project_id: UUID)-> Dict[str,int]:
     """
-    Get count of tasks by status for a given project
+    Get count of tasks by status for a given project (maintained counters, no GROUP BY)
     """
-    cache_key= f"report:project:{project_id}:task_count_by_status"
-    
-    cached= redis_client.get(cache_key)
-    if cached:
-        return json.loads(cached)
-    
-    status_counts = db.query(
-        Task.status,
-        func.count(Task.id).label('count')
-    ).filter(
-        Task.project_id == project_id
-    ).group_by(Task.status).all()
-
-    result = {status: count for status, count in status_counts}
+    by_status = get_project_task_stats(db, project_id)["status"]
+    # Same shape as the former GROUP BY: present statuses plus zero defaults
+    result = {status: count for status, count in by_status.items() if count}
 
     all_statuses = ['todo', 'in_progress', 'done']
     for status in all_statuses:
         if status not in result:
             result[status] = 0
 
-    redis_client.setex(cache_key, settings.report_cache_ttl, json.dumps(result))
     return result
 
 def get_overdue_tasks_in_project(db: Session, project_id: UUID)->List[Dict]:
     """
-    get overdue tasks in a project
+    get overdue tasks in a project, earliest due first
+    (range query on the project's overdue index, then a primary key lookup)
     """
-    cache_key = f"report:project:{project_id}:overdue_tasks"
-
-    cached = redis_client.get(cache_key)
-    if cached:
-        return json.loads(cached)
-    
-    overdue_tasks = db.query(Task).options(
-        joinedload(Task.assignee)  # Nếu cần load user info
-    ).filter(
+    now = datetime.utcnow()
+    task_ids = get_overdue_task_ids(db, project_id, now)
+    if not task_ids:
+        return []
+
+    # Re-checked here so an index entry lagging behind a commit is never listed
+    overdue_tasks = db.query(Task).filter(
+        Task.id.in_(task_ids),
         Task.project_id == project_id,
-        Task.due_date < datetime.utcnow(),
-        Task.status != 'done'
-    ).all()
+        Task.due_date < now,
+        Task.status != TaskStatusEnum.DONE
+    ).order_by(Task.due_date, Task.id).all()
 
     result =[]
     for task in overdue_tasks:
@@ -64,21 +56,117 @@ def get_overdue_tasks_in_project(db: Session, project_id: UUID)->List[Dict]:
             "priority": task.priority,
             "due_date": task.due_date.isoformat() if task.due_date else None,
             "assignee_id": str(task.assignee_id) if task.assignee_id else None,
-            "days_overdue": (datetime.utcnow() - task.due_date).days if task.due_date else 0
+            "days_overdue": (now - task.due_date).days
         })
 
-    redis_client.setex(cache_key, settings.report_cache_ttl, json.dumps(result))
-
     return result
 
+UNASSIGNED = "unassigned"
+
+# GROUPING(status, priority, assignee_id) bitmask: a bit is set for each column
+# rolled up in that grouping set (status is the high bit)
+_BY_STATUS, _BY_PRIORITY, _BY_ASSIGNEE, _BY_STATUS_ASSIGNEE = 0b011, 0b101, 0b110, 0b010
+
+def get_project_workload(db: Session, project_id: UUID) -> Dict:
+    """
+    Task counts of a project by status, priority, assignee and (status, assignee),
+    from one GROUPING SETS query and cached as one object
+    """
+    cache_key = f"report:project:{project_id}:workload"
+    cached = get_or_compute(
+        redis_client, cache_key,
+        lambda: {"data": json.dumps(_compute_workload(db, project_id))},
+        settings.report_cache_ttl
+    )
+    return json.loads(cached["data"])
+
+def _compute_workload(db: Session, project_id: UUID) -> Dict:
+    rows = db.execute(
+        select(
+            func.grouping(Task.status, Task.priority, Task.assignee_id),
+            Task.status,
+            Task.priority,
+            Task.assignee_id,
+            func.count(Task.id)
+        ).where(
+            Task.project_id == project_id
+        ).group_by(
+            func.grouping_sets(
+                tuple_(Task.status),
+                tuple_(Task.priority),
+                tuple_(Task.assignee_id),
+                tuple_(Task.status, Task.assignee_id)
+            )
+        )
+    ).all()
+
+    by_status = {status.value: 0 for status in TaskStatusEnum}
+    by_priority = {priority.value: 0 for priority in TaskPriorityEnum}
+    by_assignee: Dict[str, int] = {}
+    by_status_and_assignee: Dict[str, Dict[str, int]] = {}
+    for grouping, status, priority, assignee_id, task_count in rows:
+        # NULL assignee_id inside a set that groups by it means unassigned
+        assignee = str(assignee_id) if assignee_id else UNASSIGNED
+        if grouping == _BY_STATUS:
+            by_status[_value(status)] = task_count
+        elif grouping == _BY_PRIORITY:
+            by_priority[_value(priority)] = task_count
+        elif grouping == _BY_ASSIGNEE:
+            by_assignee[assignee] = task_count
+        elif grouping == _BY_STATUS_ASSIGNEE:
+            by_status_and_assignee.setdefault(
+                assignee, {member.value: 0 for member in TaskStatusEnum}
+            )[_value(status)] = task_count
+
+    return {
+        "project_id": str(project_id),
+        "total_tasks": sum(by_status.values()),
+        "by_status": by_status,
+        "by_priority": by_priority,
+        "by_assignee": by_assignee,
+        "by_status_and_assignee": by_status_and_assignee
+    }
+
+def _value(member) -> str:
+    return member.value if hasattr(member, "value") else member
+
 def invalidate_project_report_cache(project_id: UUID):
     """
     Invalidate the report cache for a specific project
     """
     patterns = [
-        f"report:project:{project_id}:task_count_by_status",
+        f"report:project:{project_id}:workload",
+        # Overdue listings are no longer cached; drops entries of older releases
         f"report:project:{project_id}:overdue_tasks"
     ]
 
     for pattern in patterns:
         redis_client.delete(pattern)
+    schedule_report_warmup(project_id)
+
+# Projects whose report cache should be recomputed, scored by when
+REPORT_WARM_QUEUE_KEY = "report:warm_queue"
+
+def schedule_report_warmup(project_id: UUID):
+    """
+    Queue the project for scripts/warm_report_cache.py. Every write pushes the
+    time back, so a burst of edits is warmed once, after it settles.
+    """
+    redis_client.zadd(REPORT_WARM_QUEUE_KEY, {str(project_id): time.time() + settings.report_warm_delay_seconds})
+
+def claim_due_warmups(limit: int = 100) -> List[str]:
+    """
+    Take up to `limit` projects whose warm-up time has passed off the queue.
+    ZREM succeeds for one caller only, so concurrent warmers never share a project.
+    """
+    due = redis_client.zrangebyscore(REPORT_WARM_QUEUE_KEY, "-inf", time.time(), start=0, num=limit)
+    if not due:
+        return []
+    pipe = redis_client.pipeline()
+    for project_id in due:
+        pipe.zrem(REPORT_WARM_QUEUE_KEY, project_id)
+    return [project_id for project_id, removed in zip(due, pipe.execute()) if removed]
+
+def warm_project_reports(db: Session, project_id: UUID):
+    """Recompute the cached reports of a project (a no-op for keys already refilled)"""
+    get_project_workload(db, project_id)
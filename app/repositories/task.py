@@ -1,6 +1,7 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
-from typing import List, Optional, Dict, Any
+from sqlalchemy.orm import Session, joinedload, aliased
+from sqlalchemy import and_, or_, select, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable, Iterator
 from uuid import UUID
 from datetime import datetime
 import json
@@ -10,7 +11,11 @@ from app.models.project import Project
 from app.core.exceptions import TaskNotFoundException
 from app.repositories.project_member import is_project_member
 from app.config import settings
-from app.database import redis_client
+from app.database import redis_client, async_redis_client
+from app.core.request_memo import memo_get, memo_get_async, memo_discard
+from app.core.pagination import keyset_order, keyset_filter
+from app.core.single_flight import get_or_compute_async
+from app.repositories.project_task_stats import get_project_task_stats
 
 def get_tasks_with_cache(
     db: Session,
@@ -19,10 +24,19 @@ def get_tasks_with_cache(
     status: Optional[str] = None,
     priority: Optional[str] = None,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    keyset: bool = False,
+    cursor: Optional[str] = None
 ) -> List[Task]:
+    """
+    Tasks ordered by (created_at, id) desc. With keyset=True pages by `cursor`
+    instead of `skip` (see app.core.pagination).
+    """
     #created cache base on filters
-    cache_key = _generate_tasks_cache_key(project_id,assignee_id,status, priority, skip, limit)
+    generation = get_tasks_generation(project_id)
+    cache_key = _generate_tasks_cache_key(
+        project_id, assignee_id, status, priority, skip, limit, keyset, cursor, generation
+    )
 
     #try to get from cache first
     cached_data = redis_client.get(cache_key)
@@ -48,8 +62,14 @@ def get_tasks_with_cache(
         query = query.filter(Task.status == status)
     if priority:
         query = query.filter(Task.priority == priority)
+    query = query.order_by(*keyset_order(Task))
+    if keyset:
+        if cursor:
+            query = query.filter(keyset_filter(Task, cursor))
+    else:
+        query = query.offset(skip)
     
-    tasks = query.offset(skip).limit(limit).all()
+    tasks = query.limit(limit).all()
 
     # Cache task IDs
     task_ids= [str(task.id) for task in tasks]
@@ -57,13 +77,75 @@ def get_tasks_with_cache(
 
     return tasks
 
+async def get_tasks_with_cache_async(
+    db: AsyncSession,
+    project_id: Optional[UUID] = None,
+    assignee_id: Optional[UUID] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    keyset: bool = False,
+    cursor: Optional[str] = None,
+    cache_ids: bool = True
+) -> List[Task]:
+    """
+    Async variant of get_tasks_with_cache, shares the same cache keys.
+    cache_ids=False skips the id-list cache (for callers caching their own result).
+    """
+    cached_data = None
+    if cache_ids:
+        generation = await get_tasks_generation_async(project_id)
+        cache_key = _generate_tasks_cache_key(
+            project_id, assignee_id, status, priority, skip, limit, keyset, cursor, generation
+        )
+        cached_data = await async_redis_client.get(cache_key)
+    if cached_data:
+        task_ids = json.loads(cached_data)
+        if task_ids:
+            stmt = (
+                select(Task)
+                .options(joinedload(Task.creator), joinedload(Task.assignee))
+                .where(Task.id.in_(task_ids))
+            )
+            tasks = (await db.execute(stmt)).scalars().all()
+            task_dict = {str(task.id): task for task in tasks}
+            return [task_dict[task_id] for task_id in task_ids if task_id in task_dict]
+
+    stmt = select(Task).options(joinedload(Task.creator), joinedload(Task.assignee))
+    if project_id:
+        stmt = stmt.where(Task.project_id == project_id)
+    if assignee_id:
+        stmt = stmt.where(Task.assignee_id == assignee_id)
+    if status:
+        stmt = stmt.where(Task.status == status)
+    if priority:
+        stmt = stmt.where(Task.priority == priority)
+    stmt = stmt.order_by(*keyset_order(Task))
+    if keyset:
+        if cursor:
+            stmt = stmt.where(keyset_filter(Task, cursor))
+    else:
+        stmt = stmt.offset(skip)
+
+    tasks = (await db.execute(stmt.limit(limit))).scalars().all()
+
+    if cache_ids:
+        task_ids = [str(task.id) for task in tasks]
+        await async_redis_client.setex(cache_key, settings.task_cache_expiration, json.dumps(task_ids))
+
+    return list(tasks)
+
 def _generate_tasks_cache_key(
         project_id: Optional[UUID],
         assignee_id: Optional[UUID],
         status: Optional[str],
         priority: Optional[str],
         skip: int,
-        limit: int
+        limit: int,
+        keyset: bool = False,
+        cursor: Optional[str] = None,
+        generation: str = "0"
 ) -> str:
     key_parts = ["tasks"]
 
@@ -71,6 +153,8 @@ def _generate_tasks_cache_key(
         key_parts.append(f"project:{project_id}")
     else:
         key_parts.append("all")
+    # Bumping the generation orphans every key of the namespace (see invalidate_task_cache)
+    key_parts.append(f"gen:{generation}")
     filters = []
     if assignee_id:
         filters.append(f"assignee:{assignee_id}")
@@ -82,28 +166,59 @@ def _generate_tasks_cache_key(
     if filters:
         key_parts.append("filters:" + "|".join(filters))
     
-    key_parts.extend([f"skip:{skip}", f"limit:{limit}"])
+    if keyset:
+        key_parts.extend([f"after:{cursor or 'start'}", f"limit:{limit}"])
+    else:
+        key_parts.extend([f"skip:{skip}", f"limit:{limit}"])
     
     return ":".join(key_parts)
 
+def _tasks_generation_key(project_id: Optional[UUID]) -> str:
+    if project_id:
+        return f"tasks:project:{project_id}:gen"
+    return "tasks:all:gen"
+
+def get_tasks_generation(project_id: Optional[UUID]) -> str:
+    return redis_client.get(_tasks_generation_key(project_id)) or "0"
+
+async def get_tasks_generation_async(project_id: Optional[UUID]) -> str:
+    return await async_redis_client.get(_tasks_generation_key(project_id)) or "0"
+
+def task_list_payload_key(*key_args, **key_kwargs) -> str:
+    """Key of a serialized list response, same filters and generation as _generate_tasks_cache_key"""
+    return _generate_tasks_cache_key(*key_args, **key_kwargs) + ":payload"
+
+async def get_or_compute_task_list_payload_async(
+    cache_key: str, compute: Callable[[], Awaitable[Tuple[int, str]]]
+) -> Tuple[int, str]:
+    """
+    (item count, JSON payload) of a list response. Concurrent misses of the
+    same key share one `compute` (see app.core.single_flight).
+    """
+    async def compute_fields():
+        count, payload = await compute()
+        return {"count": str(count), "payload": payload}
+
+    fields = await get_or_compute_async(
+        async_redis_client, cache_key, compute_fields, settings.task_cache_expiration
+    )
+    return int(fields["count"]), fields["payload"]
+
 def invalidate_task_cache(
     project_id: Optional[UUID] = None,
     task_id: Optional[UUID] = None
 ):
-
-    pattern ="task:*"
+    """
+    Invalidate task list caches by bumping the generation counters, O(1) per write.
+    Keys of the old generation are never read again and expire via task_cache_expiration.
+    Lists are cached per project, so task_id needs no key of its own.
+    """
+    pipe = redis_client.pipeline(transaction=False)
     if project_id:
-        pattern = f"tasks:project:{project_id}:*"
-    elif task_id:
-        pattern = f"tasks:projects:*:*"
-
-    cursor = 0
-    while True:
-        cursor, keys = redis_client.scan(cursor=cursor, match=pattern, count=100)
-        if keys:
-            redis_client.delete(*keys)
-        if cursor == 0:
-            break
+        pipe.incr(_tasks_generation_key(project_id))
+    # Unscoped lists may contain tasks of any project
+    pipe.incr(_tasks_generation_key(None))
+    pipe.execute()
 
 
 def create_task(
@@ -138,12 +253,28 @@ def create_task(
     return task
 
 def get_task_by_id(db: Session, task_id: UUID) -> Optional[Task]:
-    """Get task by ID with relationships"""
-    return db.query(Task).options(
+    """Get task by ID with relationships (loaded once per request)"""
+    return memo_get(db, ("task", task_id), lambda: db.query(Task).options(
         joinedload(Task.creator),
         joinedload(Task.assignee),
         joinedload(Task.project)
-    ).filter(Task.id == task_id).first()
+    ).filter(Task.id == task_id).first())
+
+async def get_task_by_id_async(db: AsyncSession, task_id: UUID) -> Optional[Task]:
+    """Get task by ID with relationships (async session, loaded once per request)"""
+    # creator/assignee organization are read by UserResponse, so load them eagerly too
+    stmt = select(Task).options(
+        joinedload(Task.creator).joinedload(User.organization),
+        joinedload(Task.assignee).joinedload(User.organization),
+        joinedload(Task.project)
+    ).where(Task.id == task_id)
+
+    async def load():
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    # Separate key: async-loaded rows must not be handed to sync sessions (and vice versa)
+    return await memo_get_async(db, ("task_async", task_id), load)
 
 def get_tasks_by_project(
     db: Session, 
@@ -167,32 +298,12 @@ def get_tasks_by_project(
     if priority:
         query = query.filter(Task.priority == priority)
     
-    return query.offset(skip).limit(limit).all()
+    return query.order_by(*keyset_order(Task)).offset(skip).limit(limit).all()
 
 def _get_project_task_statistics(db: Session, project_id: UUID) -> dict:
-    """Get task statistics for a project"""
-    from sqlalchemy import func
-    from app.models.task import Task
-    
-    stats = db.query(
-        Task.status,
-        func.count(Task.id).label('count')
-    ).filter(
-        Task.project_id == project_id
-    ).group_by(Task.status).all()
-    
-    result = {
-        "total": 0,
-        "todo": 0,
-        "in-progress": 0,
-        "done": 0
-    }
-    
-    for stat in stats:
-        result[stat.status] = stat.count
-        result["total"] += stat.count
-    
-    return result
+    """Get task statistics for a project (maintained counters)"""
+    stats = get_project_task_stats(db, project_id)
+    return {"total": stats["total"], **stats["status"]}
 
 def update_task(db: Session, task_id: UUID, task_data: Dict[str, Any]) -> Optional[Task]:
     """Update task with provided data"""
@@ -217,6 +328,7 @@ def delete_task(db: Session, task_id: UUID) -> bool:
     
     db.delete(task)
     db.commit()
+    memo_discard(db, ("task", task_id), ("task_async", task_id))
     invalidate_task_cache(project_id=task.project_id, task_id=task.id)
     return True
 
@@ -229,14 +341,18 @@ def assign_task(db: Session, task_id: UUID, assignee_id: UUID) -> Optional[Task]
     task.assignee_id = assignee_id
     db.commit()
     db.refresh(task)
+    # Lists are filtered and rendered by assignee
+    invalidate_task_cache(project_id=task.project_id, task_id=task.id)
     return task
 
 def get_tasks_by_assignee(
     db: Session, 
     assignee_id: UUID,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> List[Task]:
-    """Get tasks assigned to a specific user"""
+    """Get tasks assigned to a specific user, newest first (keyset page when limit is set)"""
     query = db.query(Task).options(
         joinedload(Task.creator),
         joinedload(Task.project)
@@ -245,10 +361,16 @@ def get_tasks_by_assignee(
     if status:
         query = query.filter(Task.status == status)
     
-    return query.all()
-def get_tasks_by_creator(db: Session, creator_id: UUID, status: str = None) -> List[Task]:
+    return _keyset_page(query, limit, cursor)
+def get_tasks_by_creator(
+    db: Session,
+    creator_id: UUID,
+    status: str = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> List[Task]:
     """
-    Get all tasks created by a specific user
+    Get all tasks created by a specific user (keyset page when limit is set)
     """
     query = db.query(Task).options(
         joinedload(Task.creator),
@@ -260,11 +382,47 @@ def get_tasks_by_creator(db: Session, creator_id: UUID, status: str = None) -> L
     if status:
         query = query.filter(Task.status == status)
     
-    # Order by created_at desc (newest first)
-    query = query.order_by(Task.created_at.desc())
-    
+    return _keyset_page(query, limit, cursor)
+
+def _keyset_page(query, limit: Optional[int], cursor: Optional[str]) -> List[Task]:
+    # Order by created_at desc (newest first), id breaks ties
+    query = query.order_by(*keyset_order(Task))
+    if cursor:
+        query = query.filter(keyset_filter(Task, cursor))
+    if limit is not None:
+        query = query.limit(limit)
     return query.all()
 
+def stream_project_task_rows(db: Session, project_id: UUID, batch_size: int = 1000) -> Iterator[Row]:
+    """
+    Rows of every task in a project with assignee and creator names, fetched
+    through a server-side cursor `batch_size` rows at a time (no ORM objects)
+    """
+    assignee = aliased(User)
+    creator = aliased(User)
+    stmt = select(
+        Task.id,
+        Task.title,
+        Task.description,
+        Task.status,
+        Task.priority,
+        Task.due_date,
+        Task.assignee_id,
+        assignee.name.label("assignee_name"),
+        Task.creator_id,
+        creator.name.label("creator_name"),
+        Task.created_at,
+        Task.updated_at
+    ).outerjoin(
+        assignee, assignee.id == Task.assignee_id
+    ).join(
+        creator, creator.id == Task.creator_id
+    ).where(
+        Task.project_id == project_id
+    ).order_by(*keyset_order(Task)).execution_options(yield_per=batch_size)
+
+    yield from db.execute(stmt)
+
 def check_user_access_to_task(db: Session, task_id: UUID, user_id: UUID) -> bool:
     """Check if user has access to task (member of project)"""
     task = db.query(Task).filter(Task.id == task_id).first()
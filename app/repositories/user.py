@@ -1,4 +1,6 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from app.models.user import User
 from uuid import UUID
 
@@ -16,4 +18,10 @@ def get_user_by_id(db: Session, user_id: UUID):
     return db.query(User).filter(User.id == user_id).first()
 
 def get_all_users(db: Session):
-    return db.query(User).all()
\ No newline at end of file
+    return db.query(User).all()
+
+async def get_user_by_id_async(db: AsyncSession, user_id: UUID):
+    # organization is eager-loaded: UserResponse reads it and lazy loads are not allowed in async sessions
+    stmt = select(User).options(joinedload(User.organization)).where(User.id == user_id)
+    result = await db.execute(stmt)
+    return result.scalars().first()
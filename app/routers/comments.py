@@ -7,9 +7,9 @@ from app.schemas.request.comment_request import CommentCreateRequest, CommentUpd
 from app.schemas.response.comment_response import CommentListResponse, CommentResponse
 from app.schemas.response.api_response import APIResponse
 from app.dependencies.auth import get_current_user
-from app.dependencies.task import require_task_access
+from app.dependencies.task import require_task_access, require_task_access_read
 from app.dependencies.comment import require_comment_access, require_comment_edit_access, require_comment_delete_access
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.services import comment_service
 
 comments_router = APIRouter(prefix="/comments", tags=["Comments"])
@@ -60,8 +60,8 @@ def get_task_comments(
     task_id: UUID,
     skip: int = Query(0, ge=0, description="Number of comments to skip"),
     limit: int = Query(100, ge=1, le=100, description="Number of comments to return"),
-    task_access = Depends(require_task_access),  # User must have task access
-    db: Session = Depends(get_db)
+    task_access = Depends(require_task_access_read),  # User must have task access
+    db: Session = Depends(get_read_db)
 ):
     """
     Get all comments for a specific task
@@ -1,14 +1,26 @@
-from fastapi import APIRouter, Depends, Query, Path
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Query, Path, Body
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from typing import List
 
+from app.config import settings
+from app.core.notification_push import notification_hub
+from app.database import get_async_db
+
 from app.schemas.response.api_response import APIResponse
 from app.schemas.response.notification_response import NotificationResponse
-from app.dependencies.auth import get_current_user
+from app.schemas.request.notification_request import NotificationMarkReadRequest
+from app.dependencies.auth import get_current_user, get_current_user_async
 from app.services.notification_service import (
     get_user_notifications,
     get_notification,
     mark_as_read,
     mark_all_as_read,
+    mark_notifications_as_read,
     delete_notification,
     get_unread_count
 )
@@ -38,6 +50,67 @@ def get_my_notifications(
         result=result
     )
 
+@notifications_router.get(
+    "/unread-count",
+    response_model=APIResponse[dict]
+)
+def get_unread_notifications_count(
+    current_user = Depends(get_current_user)
+):
+    """
+    Get count of unread notifications
+    """
+    count = get_unread_count(current_user.id)
+    
+    return APIResponse(
+        code=200,
+        message="Unread count retrieved",
+        result={"unread_count": count}
+    )
+
+@notifications_router.get("/stream")
+async def stream_notifications(
+    current_user = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Server-Sent Events stream of the current user's notifications
+
+    Sends the unread count on connect, then one `notification` event per new
+    notification, so clients no longer poll /my and /unread-count.
+    """
+    # The stream can stay open for hours: don't hold a database connection
+    await db.close()
+    user_id = str(current_user.id)
+
+    async def events():
+        queue = await notification_hub.subscribe(user_id)
+        try:
+            # Counted only once subscribed, so no notification falls in between
+            # (one created meanwhile is counted and pushed: the count is absolute)
+            unread_count = await run_in_threadpool(get_unread_count, current_user.id)
+            yield _sse_event("unread_count", json.dumps({"unread_count": unread_count}))
+            while True:
+                try:
+                    data = await asyncio.wait_for(
+                        queue.get(), timeout=settings.notification_stream_keepalive_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse_event("notification", data)
+        finally:
+            await notification_hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
 @notifications_router.get(
     "/{notification_id}",
     response_model=APIResponse[NotificationResponse]
@@ -100,44 +173,48 @@ def mark_all_notifications_as_read(
         result={"updated_count": updated_count}
     )
 
-@notifications_router.delete(
-    "/{notification_id}",
+@notifications_router.put(
+    "/read",
     response_model=APIResponse[dict]
 )
-def delete_notification_endpoint(
-    notification_id: str = Path(..., description="Notification ID"),
+def mark_notifications_read(
+    request: NotificationMarkReadRequest = Body(...),
     current_user = Depends(get_current_user)
 ):
     """
-    Delete a notification
-    """
-    success = delete_notification(current_user.id, notification_id)
+    Mark notifications as read in bulk
     
-    if not success:
-        raise NotificationNotFoundException()
+    Marks the listed ids, or every unread notification of `type`, or all
+    notifications when neither is given. One Redis round trip either way.
+    """
+    updated_count = mark_notifications_as_read(current_user.id, request.ids, request.type)
     
     return APIResponse(
         code=200,
-        message="Notification deleted successfully",
-        result={"success": True, "notification_id": notification_id}
+        message=f"Marked {updated_count} notifications as read",
+        result={"updated_count": updated_count}
     )
 
-@notifications_router.get(
-    "/unread-count",
+@notifications_router.delete(
+    "/{notification_id}",
     response_model=APIResponse[dict]
 )
-def get_unread_notifications_count(
+def delete_notification_endpoint(
+    notification_id: str = Path(..., description="Notification ID"),
     current_user = Depends(get_current_user)
 ):
     """
-    Get count of unread notifications
+    Delete a notification
     """
-    count = get_unread_count(current_user.id)
+    success = delete_notification(current_user.id, notification_id)
+    
+    if not success:
+        raise NotificationNotFoundException()
     
     return APIResponse(
         code=200,
-        message="Unread count retrieved",
-        result={"unread_count": count}
+        message="Notification deleted successfully",
+        result={"success": True, "notification_id": notification_id}
     )
 
 router = APIRouter()
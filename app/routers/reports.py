@@ -1,19 +1,31 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query, status
 from uuid import UUID
+from datetime import date
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from app.schemas.response.api_response import APIResponse
 from app.schemas.response.report_response import (
     TaskCountByStatusResponse,
-    OverdueTasksResponse
+    OverdueTasksResponse,
+    WorkloadReportResponse,
+    BurndownResponse,
+    AnalyticsSnapshotResponse,
+    OrganizationSummaryResponse
 )
-from app.dependencies.project import require_project_management_permission
+from app.dependencies.project import require_project_management_permission_read
+from app.dependencies.organization import require_organization_manager_read
 from app.dependencies.auth import get_current_user
+from app.dependencies.role import require_admin
 from app.services.report_service import (
     get_project_task_count_by_status,
-    get_overdue_tasks_in_project
+    get_overdue_tasks_in_project,
+    get_project_workload,
+    get_project_burndown,
+    get_organization_summary
 )
-from app.database import get_db
+from app.services.analytics_export_service import start_analytics_snapshot
+from app.database import get_read_db
 
 reports_router = APIRouter(prefix="/reports", tags=["Reports"])
 
@@ -24,8 +36,8 @@ reports_router = APIRouter(prefix="/reports", tags=["Reports"])
 )
 def get_task_count_by_status(
     project_id: UUID = Path(..., description="Project ID"),
-    db: Session = Depends(get_db),
-    current_user = Depends(require_project_management_permission)
+    db: Session = Depends(get_read_db),
+    current_user = Depends(require_project_management_permission_read)
 ):
     """
     Get per-project task count by status
@@ -46,8 +58,8 @@ def get_task_count_by_status(
 )
 def get_overdue_tasks(
     project_id: UUID = Path(..., description="Project ID"),
-    db: Session = Depends(get_db),
-    current_user = Depends(require_project_management_permission)
+    db: Session = Depends(get_read_db),
+    current_user = Depends(require_project_management_permission_read)
 ):
     """
     Get overdue tasks in a project
@@ -62,6 +74,103 @@ def get_overdue_tasks(
         result=report
     )
 
+@reports_router.get(
+    "/projects/{project_id}/workload",
+    response_model=APIResponse[WorkloadReportResponse]
+)
+def get_workload(
+    project_id: UUID = Path(..., description="Project ID"),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(require_project_management_permission_read)
+):
+    """
+    Get project workload
+    
+    Task counts by status, by priority, by assignee and by (status, assignee)
+    in a single report, for manager dashboards
+    """
+    report = get_project_workload(db, project_id)
+    
+    return APIResponse(
+        code=200,
+        message="Workload report retrieved successfully",
+        result=report
+    )
+
+@reports_router.get(
+    "/projects/{project_id}/burndown",
+    response_model=APIResponse[BurndownResponse]
+)
+def get_burndown(
+    project_id: UUID = Path(..., description="Project ID"),
+    from_date: Optional[date] = Query(None, alias="from", description="First day (default: 29 days before to)"),
+    to_date: Optional[date] = Query(None, alias="to", description="Last day (default: today)"),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(require_project_management_permission_read)
+):
+    """
+    Get project burndown
+    
+    Status counts for each day of the range, from the daily snapshots taken
+    by scripts/snapshot_burndown.py (at most 366 days)
+    """
+    report = get_project_burndown(db, project_id, from_date, to_date)
+    
+    return APIResponse(
+        code=200,
+        message="Burndown retrieved successfully",
+        result=report
+    )
+
+@reports_router.get(
+    "/organizations/{org_id}/summary",
+    response_model=APIResponse[OrganizationSummaryResponse]
+)
+def get_organization_task_summary(
+    org_id: UUID = Path(..., description="Organization ID"),
+    days: int = Query(30, ge=1, le=366, description="Days of created-per-day history"),
+    db: Session = Depends(get_read_db),
+    current_user = Depends(require_organization_manager_read)
+):
+    """
+    Get organization-wide task summary
+    
+    Totals by status and priority, per-project status counts and tasks created per day.
+    Served from the rollup table refreshed by scripts/refresh_org_rollups.py,
+    so it can lag task writes by the worker interval.
+    """
+    report = get_organization_summary(db, org_id, days)
+    
+    return APIResponse(
+        code=200,
+        message="Organization summary retrieved successfully",
+        result=report
+    )
+
+
+@reports_router.post(
+    "/analytics-snapshots",
+    response_model=APIResponse[AnalyticsSnapshotResponse],
+    status_code=status.HTTP_202_ACCEPTED
+)
+def create_analytics_snapshot(
+    current_user = Depends(require_admin)
+):
+    """
+    Queue a Parquet snapshot of your organization's tasks, comments, attachments and project members
+    
+    Run by scripts/analytics_export_worker.py, one export at a time, and written
+    under analytics_export_dir. Requests made while your organization's snapshot
+    is still queued return that snapshot. Exports of every organization are
+    CLI only (scripts/export_analytics.py).
+    """
+    report = start_analytics_snapshot(current_user.organization_id)
+    
+    return APIResponse(
+        code=202,
+        message="Analytics snapshot queued",
+        result=report
+    )
 
 
 
@@ -1,17 +1,29 @@
-from fastapi import APIRouter, Depends, Query, Path, Body, status
+from functools import partial
+from fastapi import APIRouter, Depends, Query, Path, Body, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from uuid import UUID
 
-from app.database import get_db
-from app.dependencies.auth import get_current_user
-from app.dependencies.task import  require_task_access,  require_task_access_manager, require_task_access_update_status
-from app.dependencies.project import require_project_task_access
+from app.database import get_db, get_read_db, get_async_read_db, open_read_session
+from app.dependencies.auth import get_current_user, get_current_user_read
+from app.dependencies.task import require_task_access_read_async, require_task_access_manager, require_task_access_update_status
+from app.dependencies.project import (
+    require_project_task_access,
+    require_project_task_access_read,
+    require_project_task_access_read_async,
+)
 from app.schemas.request.task_request import TaskCreateRequest, TaskUpdateRequest, TaskAssignRequest
-from app.schemas.response.task_response import TaskResponse, TaskListResponse
-from app.schemas.response.api_response import APIResponse
+from app.schemas.response.task_response import TaskResponse, TaskListResponse, TaskListPageResponse
+from app.schemas.response.api_response import APIResponse, raw_api_response
 from app.services import task_service
 
+# Cursor mode returns a TaskListPageResponse (items + next_cursor) instead of a plain list
+TaskListResult = Union[List[TaskListResponse], TaskListPageResponse]
+PAGINATE_QUERY = Query("offset", pattern="^(offset|cursor)$", description="offset (skip/limit) or cursor (keyset, returns next_cursor)")
+CURSOR_QUERY = Query(None, description="next_cursor from the previous page (implies paginate=cursor)")
+
 # Tạo router cho project tasks và individual tasks
 project_tasks_router = APIRouter(prefix="/projects", tags=["Project Tasks"])
 tasks_router = APIRouter(prefix="/tasks", tags=["Tasks"])
@@ -60,18 +72,20 @@ def create_task_in_project(
 
 @project_tasks_router.get(
     "/{project_id}/tasks",
-    response_model=APIResponse[List[TaskListResponse]],
+    response_model=APIResponse[TaskListResult],
     summary="List project tasks"
 )
-def get_project_tasks(
+async def get_project_tasks(
     project_id: UUID = Path(..., description="Project ID"),
     status: Optional[str] = Query(None, description="Filter by task status (todo, in-progress, done)"),
     assignee_id: Optional[UUID] = Query(None, description="Filter by assignee ID"),
     priority: Optional[str] = Query(None, description="Filter by priority (low, medium, high, urgent)"),
     skip: int = Query(0, ge=0, description="Number of tasks to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of tasks to return"),
-    project_access=Depends(require_project_task_access),
-    db: Session = Depends(get_db)
+    paginate: str = PAGINATE_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    project_access=Depends(require_project_task_access_read_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get all tasks in a project with optional filtering.
@@ -81,12 +95,16 @@ def get_project_tasks(
     - assignee_id: UUID of assigned user
     - priority: low, medium, high, urgent
     
+    **Pagination:**
+    - paginate=cursor pages by (created_at, id), pass next_cursor back as cursor
+    
     **Access Control:**
     - User must be a member of the project
     """
     current_user, project = project_access
-    
-    tasks = task_service.get_project_tasks(
+
+    # Served from the cached serialized payload when possible
+    count, payload = await task_service.get_project_tasks_payload_async(
         db=db,
         project_id=project_id,
         user_id=current_user.id,
@@ -94,13 +112,45 @@ def get_project_tasks(
         assignee_id=assignee_id,
         priority=priority,
         skip=skip,
-        limit=limit
+        limit=limit,
+        keyset=paginate == "cursor" or cursor is not None,
+        cursor=cursor
     )
     
-    return APIResponse(
+    return raw_api_response(
         code=200,
-        message=f"Retrieved {len(tasks)} tasks from project",
-        result=tasks
+        message=f"Retrieved {count} tasks from project",
+        result_json=payload
+    )
+
+@project_tasks_router.get(
+    "/{project_id}/tasks/export",
+    response_class=StreamingResponse,
+    summary="Export project tasks"
+)
+def export_project_tasks(
+    request: Request,
+    project_id: UUID = Path(..., description="Project ID"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson (one JSON object per line) or csv"),
+    project_access=Depends(require_project_task_access_read),
+    db: Session = Depends(get_read_db)
+):
+    """
+    Export every task in a project, including assignee and creator names.
+    
+    The body is streamed from a server-side cursor, so large projects are
+    never loaded into memory at once.
+    
+    **Access Control:**
+    - User must be a member of the project
+    """
+    # Whether yield dependencies outlive the body depends on the FastAPI version,
+    # so the stream opens its own session; release this one's connection first
+    db.close()
+    return StreamingResponse(
+        task_service.stream_project_tasks_export(partial(open_read_session, request), project_id, format),
+        media_type=task_service.EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-tasks.{format}"'}
     )
 
 # ==================== INDIVIDUAL TASK ENDPOINTS ====================
@@ -110,9 +160,9 @@ def get_project_tasks(
     response_model=APIResponse[TaskResponse],
     summary="Get task details"
 )
-def get_task(
-    task_access=Depends(require_task_access),
-    db: Session = Depends(get_db)
+async def get_task(
+    task_access=Depends(require_task_access_read_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get detailed information about a specific task.
@@ -128,7 +178,7 @@ def get_task(
     """
     current_user, task = task_access
     
-    result = task_service.get_task_details(
+    result = await task_service.get_task_details_async(
         db=db,
         task_id=task.id,
         user_id=current_user.id
@@ -349,13 +399,16 @@ def update_task_status(
 
 @tasks_router.get(
     "/my/my-tasks",
-    response_model=APIResponse[List[TaskListResponse]],
+    response_model=APIResponse[TaskListResult],
     summary="Get my assigned tasks"
 )
 def get_my_tasks(
     status: Optional[str] = Query(None, description="Filter by status (todo, in-progress, done)"),
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    paginate: str = PAGINATE_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: int = Query(100, ge=1, le=1000, description="Page size (cursor mode)"),
+    current_user=Depends(get_current_user_read),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get all tasks assigned to the current user across all projects.
@@ -366,7 +419,19 @@ def get_my_tasks(
     **Filters:**
     - status: todo, in-progress, done
     """
-   
+    if paginate == "cursor" or cursor is not None:
+        page = task_service.get_tasks_by_assignee_page(
+            db=db,
+            assignee_id=current_user.id,
+            status=status,
+            limit=limit,
+            cursor=cursor
+        )
+        return APIResponse(
+            code=200,
+            message=f"Retrieved {len(page.items)} assigned tasks",
+            result=page
+        )
     
     tasks = task_service.get_tasks_by_assignee(
         db=db,
@@ -384,13 +449,16 @@ def get_my_tasks(
 
 @tasks_router.get(
     "/my/created-by-me",
-    response_model=APIResponse[List[TaskListResponse]],
+    response_model=APIResponse[TaskListResult],
     summary="Get tasks created by me"
 )
 def get_my_created_tasks(
     status: Optional[str] = Query(None, description="Filter by status"),
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    paginate: str = PAGINATE_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    limit: int = Query(100, ge=1, le=1000, description="Page size (cursor mode)"),
+    current_user=Depends(get_current_user_read),
+    db: Session = Depends(get_read_db)
 ):
     """
     Get all tasks created by the current user.
@@ -398,7 +466,19 @@ def get_my_created_tasks(
     **Access Control:**
     - Shows only tasks created by the authenticated user
     """
-
+    if paginate == "cursor" or cursor is not None:
+        page = task_service.get_tasks_by_creator_page(
+            db=db,
+            creator_id=current_user.id,
+            status=status,
+            limit=limit,
+            cursor=cursor
+        )
+        return APIResponse(
+            code=200,
+            message=f"Retrieved {len(page.items)} created tasks",
+            result=page
+        )
     
     tasks = task_service.get_tasks_by_creator(
         db=db,
@@ -11,12 +11,39 @@ class NotificationRedis(BaseModel):
     type: str
     related_id: Optional[str] = None
     is_read: bool = False
+    count: int = 1
     created_at: datetime
     
     @classmethod
     def create_key(cls, user_id: UUID, notification_id: str) -> str:
+        # Legacy one-key-per-notification layout, read only by the storage migration
         return f"notification:{user_id}:{notification_id}"
     
+    @classmethod
+    def create_user_entries_key(cls, user_id: UUID) -> str:
+        # Hash of notification id -> compact entry
+        return f"user_notification_entries:{user_id}"
+    
     @classmethod
     def create_user_notifications_key(cls, user_id: UUID) -> str:
-        return f"user_notifications:{user_id}"
\ No newline at end of file
+        return f"user_notifications:{user_id}"
+    
+    @classmethod
+    def create_user_unread_key(cls, user_id: UUID) -> str:
+        # Sorted set of unread notification ids, scored by their expiry time
+        return f"user_notifications_unread:{user_id}"
+    
+    @classmethod
+    def create_user_channel(cls, user_id: UUID) -> str:
+        # Pub/sub channel new notifications are pushed on
+        return f"notifications:push:{user_id}"
+    
+    @classmethod
+    def create_group_key(cls, user_id: UUID, type_: str, related_id: str) -> str:
+        # Id of the notification that same-type notifications about related_id merge into
+        return f"user_notification_group:{user_id}:{type_}:{related_id}"
+    
+    @classmethod
+    def create_user_digest_key(cls, user_id: UUID) -> str:
+        # Hash of type -> count of notifications waiting for the next digest
+        return f"user_notification_digest:{user_id}"
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class NotificationMarkReadRequest(BaseModel):
+    """Request schema for marking notifications as read in bulk"""
+    ids: Optional[List[str]] = Field(None, max_length=1000, description="Notification IDs to mark as read")
+    type: Optional[str] = Field(None, description="Mark every unread notification of this type")
+    
+    class Config:
+        schema_extra = {
+            "example": {
+                "ids": ["3f1c2a5e-8d7b-4e0f-9a61-2b4c6d8e0f13", "7a9e1b3c-5d2f-4a8e-b6c0-1d3f5a7b9c2e"]
+            }
+        }
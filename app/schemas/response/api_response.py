@@ -1,4 +1,6 @@
+import json
 from typing import Any, Generic, Optional, TypeVar
+from fastapi import Response
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -6,4 +8,13 @@ T = TypeVar("T")
 class APIResponse(BaseModel, Generic[T]):
     code: int
     message: str
-    result: Optional[T] = None
\ No newline at end of file
+    result: Optional[T] = None
+
+
+def raw_api_response(code: int, message: str, result_json: str) -> Response:
+    """
+    APIResponse envelope around a result that is already serialized JSON,
+    skips response_model validation/serialization.
+    """
+    body = f'{{"code":{code},"message":{json.dumps(message)},"result":{result_json}}}'
+    return Response(content=body, media_type="application/json", status_code=200)
\ No newline at end of file
@@ -11,6 +11,7 @@ class NotificationResponse(BaseModel):
     type: str
     related_id: Optional[str] = None
     is_read: bool = False
+    count: int = 1  # notifications merged into this one
     created_at: datetime
     
     class Config:
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import Dict, List, Any
+from datetime import date
 
 class TaskCountByStatusResponse(BaseModel):
     project_id: str
@@ -8,4 +9,42 @@ class TaskCountByStatusResponse(BaseModel):
 class OverdueTasksResponse(BaseModel):
     project_id: str
     overdue_tasks: List[Dict[str, Any]]
-    total_overdue: int
\ No newline at end of file
+    total_overdue: int
+
+class WorkloadReportResponse(BaseModel):
+    project_id: str
+    total_tasks: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+    by_assignee: Dict[str, int]  # {"<user id>" | "unassigned": count}
+    by_status_and_assignee: Dict[str, Dict[str, int]]  # {"<user id>": {"todo": 2, ...}}
+
+class BurndownPoint(BaseModel):
+    day: date
+    status_counts: Dict[str, int]
+    remaining: int  # todo + in-progress
+    total: int
+
+class BurndownResponse(BaseModel):
+    project_id: str
+    from_date: date
+    to_date: date
+    points: List[BurndownPoint]
+
+
+class AnalyticsSnapshotResponse(BaseModel):
+    snapshot_dir: str  # <snapshot_dir>/<table>/organization_id=<id>/part-0.parquet
+
+
+class ProjectRollupSummary(BaseModel):
+    project_id: str
+    total: int
+    status_counts: Dict[str, int]
+
+class OrganizationSummaryResponse(BaseModel):
+    organization_id: str
+    total_tasks: int
+    status_counts: Dict[str, int]
+    priority_counts: Dict[str, int]
+    projects: List[ProjectRollupSummary]
+    created_per_day: Dict[str, int]  # {"2024-01-31": 4}, tasks created per day
\ No newline at end of file
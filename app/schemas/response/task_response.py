@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 from app.schemas.response.user_response import UserResponse
@@ -36,4 +36,10 @@ class TaskListResponse(BaseModel):
     creator_name: str
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class TaskListPageResponse(BaseModel):
+    items: List[TaskListResponse]
+    # Opaque cursor for the next page, None on the last page
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -0,0 +1,140 @@
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.exceptions import AnalyticsExportUnavailableException
+from app.database import ExportSessionLocal
+from app.repositories.analytics_export import (
+    EXPORT_QUERIES,
+    enqueue_snapshot_job,
+    get_organization_ids,
+    iter_export_batches,
+    pop_snapshot_job,
+    snapshot_lock,
+)
+from app.schemas.response.report_response import AnalyticsSnapshotResponse
+
+# Column types of the exported tables: ids and enums are written as strings
+_STRING, _TIMESTAMP, _TIMESTAMP_TZ = "string", "timestamp", "timestamp_tz"
+EXPORT_SCHEMAS = {
+    "tasks": [
+        ("id", _STRING), ("project_id", _STRING), ("title", _STRING), ("description", _STRING),
+        ("status", _STRING), ("priority", _STRING), ("due_date", _TIMESTAMP), ("assignee_id", _STRING),
+        ("creator_id", _STRING), ("created_at", _TIMESTAMP_TZ), ("updated_at", _TIMESTAMP_TZ),
+    ],
+    "comments": [
+        ("id", _STRING), ("task_id", _STRING), ("author_id", _STRING), ("content", _STRING),
+        ("created_at", _TIMESTAMP_TZ), ("updated_at", _TIMESTAMP_TZ),
+    ],
+    "attachments": [
+        ("id", _STRING), ("task_id", _STRING), ("author_id", _STRING), ("file_name", _STRING),
+        ("file_url", _STRING), ("created_at", _TIMESTAMP_TZ), ("updated_at", _TIMESTAMP_TZ),
+    ],
+    "project_members": [("project_id", _STRING), ("user_id", _STRING)],
+}
+
+
+def _load_pyarrow():
+    # Optional dependency, only needed by the analytics export
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise AnalyticsExportUnavailableException()
+    return pyarrow, pyarrow.parquet
+
+
+def _arrow_schema(pa, table: str):
+    types = {_STRING: pa.string(), _TIMESTAMP: pa.timestamp("us"), _TIMESTAMP_TZ: pa.timestamp("us", tz="UTC")}
+    return pa.schema([(name, types[kind]) for name, kind in EXPORT_SCHEMAS[table]])
+
+
+def _to_columns(table: str, rows) -> Dict[str, List]:
+    """Rows of one batch as column lists, ids and enums as strings"""
+    columns = {name: [] for name, _ in EXPORT_SCHEMAS[table]}
+    for row in rows:
+        for (name, _), value in zip(EXPORT_SCHEMAS[table], row):
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, UUID):
+                value = str(value)
+            columns[name].append(value)
+    return columns
+
+
+def new_snapshot_dir(base_dir: str) -> str:
+    return str(Path(base_dir) / datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"))
+
+
+def export_analytics_snapshot(
+    db: Session,
+    output_dir: str,
+    organization_ids: Optional[List[UUID]] = None,
+    batch_size: int = 10000
+) -> Dict[str, int]:
+    """
+    Write tasks, comments, attachments and project members as Parquet files
+    partitioned by organization (<output_dir>/<table>/organization_id=<id>/part-0.parquet).
+    Each batch of the cursor becomes one row group, so memory stays bounded.
+    Returns the number of rows written per table.
+    """
+    pa, pq = _load_pyarrow()
+    written = {table: 0 for table in EXPORT_QUERIES}
+    for organization_id in organization_ids or get_organization_ids(db):
+        for table in EXPORT_QUERIES:
+            schema = _arrow_schema(pa, table)
+            path = Path(output_dir) / table / f"organization_id={organization_id}" / "part-0.parquet"
+            writer = None
+            try:
+                for rows in iter_export_batches(db, table, organization_id, batch_size):
+                    if writer is None:
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        writer = pq.ParquetWriter(str(path), schema)
+                    writer.write_table(pa.Table.from_pydict(_to_columns(table, rows), schema=schema))
+                    written[table] += len(rows)
+            finally:
+                if writer is not None:
+                    writer.close()
+    return written
+
+
+def run_analytics_snapshot(
+    output_dir: str, organization_ids: Optional[List[UUID]] = None, batch_size: int = 10000
+) -> Dict[str, int]:
+    """
+    Export on the unpooled export engine (a read replica when one is configured),
+    so a long dump never holds an API pool connection. Waits for a running
+    export first (scripts/export_analytics.py is the CLI equivalent)
+    """
+    with snapshot_lock():
+        db = ExportSessionLocal()
+        try:
+            return export_analytics_snapshot(db, output_dir, organization_ids, batch_size)
+        finally:
+            db.close()
+
+
+def start_analytics_snapshot(organization_id: UUID) -> AnalyticsSnapshotResponse:
+    """
+    Queue a snapshot of one organization for the export worker and return where it is written
+    """
+    _load_pyarrow()
+    snapshot_dir = enqueue_snapshot_job(organization_id, new_snapshot_dir(settings.analytics_export_dir))
+    return AnalyticsSnapshotResponse(snapshot_dir=snapshot_dir)
+
+
+def process_snapshot_jobs(timeout: int = 5) -> Optional[str]:
+    """
+    Run the next queued snapshot, waiting up to `timeout` seconds for one,
+    and return its directory
+    """
+    job = pop_snapshot_job(timeout)
+    if job is None:
+        return None
+    run_analytics_snapshot(job["snapshot_dir"], [UUID(job["organization_id"])])
+    return job["snapshot_dir"]
@@ -9,8 +9,14 @@ from app.repositories.notification import (
     get_notification as repo_get_notification,
     mark_as_read as repo_mark_as_read,
     mark_all_as_read as repo_mark_all_as_read,
+    mark_many_as_read as repo_mark_many_as_read,
+    mark_type_as_read as repo_mark_type_as_read,
     delete_notification as repo_delete_notification,
-    get_unread_count as repo_get_unread_count
+    get_unread_count as repo_get_unread_count,
+    enqueue_notification as repo_enqueue_notification,
+    claim_stale_notification_events as repo_claim_stale_notification_events,
+    read_notification_events as repo_read_notification_events,
+    write_notification_events as repo_write_notification_events
 )   
 from app.schemas.response.notification_response import NotificationResponse
 
@@ -28,9 +34,29 @@ def create_notification(user_id: UUID, title: str, message: str,
         type=notification.type,
         related_id=notification.related_id,
         is_read=notification.is_read,
+        count=notification.count,
         created_at=notification.created_at
     )
 
+def enqueue_notification(user_id: Optional[UUID], title: str, message: str,
+                         type_: str, related_id: Optional[UUID] = None) -> Optional[str]:
+    """Queue a notification for the background worker; no-op without a recipient"""
+    if user_id is None:
+        return None
+    return repo_enqueue_notification(
+        str(user_id), title, message, type_, str(related_id) if related_id else None
+    )
+
+def process_notification_queue(consumer: str, batch_size: int = 100, block_ms: int = 5000) -> int:
+    """
+    One worker step: retry stale entries first, otherwise wait for new ones,
+    then write the batch. Returns the number of notifications written.
+    """
+    events = repo_claim_stale_notification_events(consumer, batch_size)
+    if not events:
+        events = repo_read_notification_events(consumer, batch_size, block_ms)
+    return repo_write_notification_events(events)
+
 def get_user_notifications(user_id: UUID, skip: int = 0, limit: int = 50) -> List[NotificationResponse]:
     """Get user's notifications"""
     notifications = repo_get_user_notifications(str(user_id), skip, limit)
@@ -43,6 +69,7 @@ def get_user_notifications(user_id: UUID, skip: int = 0, limit: int = 50) -> Lis
             type=n.type,
             related_id=n.related_id,
             is_read=n.is_read,
+            count=n.count,
             created_at=n.created_at
         ) for n in notifications
     ]
@@ -59,6 +86,7 @@ def get_notification(user_id: UUID, notification_id: str) -> Optional[Notificati
             type=notification.type,
             related_id=notification.related_id,
             is_read=notification.is_read,
+            count=notification.count,
             created_at=notification.created_at
         )
     return None
@@ -71,6 +99,17 @@ def mark_all_as_read(user_id: UUID) -> int:
     """Mark all notifications as read"""
     return repo_mark_all_as_read(str(user_id))
 
+def mark_notifications_as_read(
+    user_id: UUID, notification_ids: Optional[List[str]] = None, type_: Optional[str] = None
+) -> int:
+    """Mark the given notifications, all of one type, or (neither given) all as read"""
+    if notification_ids is not None:
+        # An empty selection marks nothing (not everything)
+        return repo_mark_many_as_read(str(user_id), notification_ids)
+    if type_ is not None:
+        return repo_mark_type_as_read(str(user_id), type_)
+    return repo_mark_all_as_read(str(user_id))
+
 def delete_notification(user_id: UUID, notification_id: str) -> bool:
     """Delete notification"""
     return repo_delete_notification(str(user_id), notification_id)
@@ -1,5 +1,6 @@
 # app/services/project_member_service.py
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from uuid import UUID
 from app.repositories.project_member import (
@@ -7,7 +8,7 @@ from app.repositories.project_member import (
     remove_project_member as repo_remove_project_member,
     get_project_members as repo_get_project_members,
     is_project_member as repo_is_project_member,
-    
+    is_project_member_async as repo_is_project_member_async,
 )
 from app.repositories.project_member import get_project_members_basic as repo_get_project_members_basic
 from app.schemas.response.project_response import ProjectMemberResponse, ProjectMembersListResponse
@@ -85,4 +86,14 @@ def check_project_access_permission(
     Kiểm tra user có quyền access project không
     """
     from app.repositories.project_member import is_project_member
-    return is_project_member(db, project_id, user_id)
\ No newline at end of file
+    return is_project_member(db, project_id, user_id)
+
+async def check_project_access_permission_async(
+    db: AsyncSession,
+    project_id: UUID,
+    user_id: UUID
+) -> bool:
+    """
+    Kiểm tra user có quyền access project không (async session)
+    """
+    return await repo_is_project_member_async(db, project_id, user_id)
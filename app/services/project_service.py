@@ -1,9 +1,11 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from uuid import UUID
 from app.repositories.project import (
     create_project as repo_create_project,
     get_project_by_id as repo_get_project_by_id,
+    get_project_by_id_async as repo_get_project_by_id_async,
     get_projects_by_organization as repo_get_projects_by_organization,
     update_project as repo_update_project,
     delete_project as repo_delete_project
@@ -38,6 +40,12 @@ def get_projects_by_id(db: Session, project_id: UUID) -> Optional[ProjectRespons
         return None
     return ProjectResponse.from_orm(project)
 
+async def get_projects_by_id_async(db: AsyncSession, project_id: UUID) -> Optional[ProjectResponse]:
+    project = await repo_get_project_by_id_async(db, project_id)
+    if not project:
+        return None
+    return ProjectResponse.from_orm(project)
+
 def get_project(db: Session, project_id: UUID, current_user) -> dict:
     """
     Get a project by ID with role-based access control
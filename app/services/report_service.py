@@ -1,16 +1,27 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 from uuid import UUID
+from datetime import date, timedelta
 from sqlalchemy.orm import Session
 
 from app.repositories.report import (
     get_project_task_count_by_status as get_project_task_count_by_status_repo,
-    get_overdue_tasks_in_project as get_overdue_tasks_in_project_repo
+    get_overdue_tasks_in_project as get_overdue_tasks_in_project_repo,
+    get_project_workload as get_project_workload_repo
 )
+from app.repositories.org_rollup import get_organization_summary as get_organization_summary_repo
+from app.repositories.burndown import get_project_burndown as get_project_burndown_repo
+from app.core.exceptions import InvalidDateRangeException
 from app.schemas.response.report_response import (
     TaskCountByStatusResponse,
-    OverdueTasksResponse
+    OverdueTasksResponse,
+    WorkloadReportResponse,
+    BurndownResponse,
+    OrganizationSummaryResponse
 )
 
+# Longest burndown range served in one request
+MAX_BURNDOWN_DAYS = 366
+
 def get_project_task_count_by_status(db: Session, project_id: UUID)-> TaskCountByStatusResponse:
     """
     Get task count by status for a project
@@ -30,4 +41,39 @@ def get_overdue_tasks_in_project(db: Session, project_id: UUID)-> OverdueTasksRe
         project_id=str(project_id),
         overdue_tasks=overdue_tasks,
         total_overdue=len(overdue_tasks)
-    )
\ No newline at end of file
+    )
+
+
+def get_project_workload(db: Session, project_id: UUID) -> WorkloadReportResponse:
+    """
+    Get task counts by status, priority and assignee for a project
+    """
+    return WorkloadReportResponse(**get_project_workload_repo(db, project_id))
+
+
+def get_project_burndown(
+    db: Session,
+    project_id: UUID,
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None
+) -> BurndownResponse:
+    """
+    Get daily status counts of a project (defaults to the last 30 days)
+    """
+    to_date = to_date or date.today()
+    from_date = from_date or to_date - timedelta(days=29)
+    if from_date > to_date or (to_date - from_date).days >= MAX_BURNDOWN_DAYS:
+        raise InvalidDateRangeException()
+    return BurndownResponse(
+        project_id=str(project_id),
+        from_date=from_date,
+        to_date=to_date,
+        points=get_project_burndown_repo(db, project_id, from_date, to_date)
+    )
+
+
+def get_organization_summary(db: Session, organization_id: UUID, days: int = 30) -> OrganizationSummaryResponse:
+    """
+    Get the organization-wide task summary (rollup table only)
+    """
+    return OrganizationSummaryResponse(**get_organization_summary_repo(db, organization_id, days))
\ No newline at end of file
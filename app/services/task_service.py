@@ -1,15 +1,22 @@
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, List, Optional, Dict, Any, Tuple, Iterator
 from uuid import UUID
 from datetime import datetime, timezone
+from enum import Enum
+import csv
+import io
+import json
+from pydantic import TypeAdapter
 
 from app.repositories import task as task_repo
 from app.repositories.project_member import is_project_member, get_project_members
 from app.repositories.project import get_project_by_id
 from app.schemas.request.task_request import TaskCreateRequest, TaskUpdateRequest
-from app.schemas.response.task_response import TaskResponse, TaskListResponse
+from app.schemas.response.task_response import TaskResponse, TaskListResponse, TaskListPageResponse
+from app.core.pagination import split_page
 from app.repositories.project_member import is_project_member
-from app.services.notification_service import create_notification
+from app.services.notification_service import enqueue_notification
 from app.core.exceptions import (
     TaskNotFoundException,
     TaskAccessDeniedException, 
@@ -76,6 +83,14 @@ def get_task_details(db: Session, task_id: UUID, user_id: UUID) -> TaskResponse:
 
     return TaskResponse.from_orm(task)
 
+async def get_task_details_async(db: AsyncSession, task_id: UUID, user_id: UUID) -> TaskResponse:
+    """Get task details (async session)"""
+    task = await task_repo.get_task_by_id_async(db, task_id)
+    if not task:
+        raise TaskNotFoundException()
+
+    return TaskResponse.from_orm(task)
+
 def get_project_task_statistics(db: Session, project_id: UUID) -> dict:
     """Get task statistics for a project"""
     return task_repo._get_project_task_statistics(db, project_id)
@@ -105,22 +120,179 @@ def get_project_tasks(
     )
     
     # Convert to response format with simplified data for list view
-    result = []
-    for task in tasks:
-        task_response = TaskListResponse(
-            id=task.id,
-            title=task.title,
-            status=task.status,
-            priority=task.priority,
-            due_date=task.due_date,
-            assignee_id=task.assignee_id,
-            creator_id=task.creator_id,
-            assignee_name=task.assignee.name if task.assignee else None,
-            creator_name=task.creator.name if task.creator else "Unknown"
+    return [_to_task_list_response(task) for task in tasks]
+
+async def get_project_tasks_async(
+    db: AsyncSession,
+    project_id: UUID,
+    user_id: UUID,
+    status: Optional[str] = None,
+    assignee_id: Optional[UUID] = None,
+    priority: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    cache_ids: bool = True
+) -> List[TaskListResponse]:
+    """Get tasks in project with filters (async session)"""
+    tasks = await task_repo.get_tasks_with_cache_async(
+        db=db,
+        project_id=project_id,
+        assignee_id=assignee_id,
+        status=status,
+        priority=priority,
+        skip=skip,
+        limit=limit,
+        cache_ids=cache_ids
+    )
+    return [_to_task_list_response(task) for task in tasks]
+
+async def get_project_tasks_page_async(
+    db: AsyncSession,
+    project_id: UUID,
+    user_id: UUID,
+    status: Optional[str] = None,
+    assignee_id: Optional[UUID] = None,
+    priority: Optional[str] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    cache_ids: bool = True
+) -> TaskListPageResponse:
+    """Keyset page of project tasks (newest first)"""
+    tasks = await task_repo.get_tasks_with_cache_async(
+        db=db,
+        project_id=project_id,
+        assignee_id=assignee_id,
+        status=status,
+        priority=priority,
+        limit=limit + 1,
+        keyset=True,
+        cursor=cursor,
+        cache_ids=cache_ids
+    )
+    return _to_task_list_page(tasks, limit)
+
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskListResponse])
+
+async def get_project_tasks_payload_async(
+    db: AsyncSession,
+    project_id: UUID,
+    user_id: UUID,
+    status: Optional[str] = None,
+    assignee_id: Optional[UUID] = None,
+    priority: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    keyset: bool = False,
+    cursor: Optional[str] = None
+) -> Tuple[int, str]:
+    """
+    Project task list (or keyset page) as already-serialized JSON plus its item count.
+    A cache hit is two Redis round trips (GET of the list generation, then
+    HGETALL of the payload): no DB query, no model building. A miss queries
+    without the id-list cache, so each listing is cached once.
+    """
+    generation = await task_repo.get_tasks_generation_async(project_id)
+    cache_key = task_repo.task_list_payload_key(
+        project_id, assignee_id, status, priority, skip, limit, keyset, cursor, generation
+    )
+    filters = dict(status=status, assignee_id=assignee_id, priority=priority)
+
+    async def compute():
+        if keyset:
+            page = await get_project_tasks_page_async(
+                db, project_id, user_id, limit=limit, cursor=cursor, cache_ids=False, **filters
+            )
+            return len(page.items), page.model_dump_json()
+        tasks = await get_project_tasks_async(
+            db, project_id, user_id, skip=skip, limit=limit, cache_ids=False, **filters
         )
-        result.append(task_response)
-    
-    return result
+        return len(tasks), _TASK_LIST_ADAPTER.dump_json(tasks).decode()
+
+    return await task_repo.get_or_compute_task_list_payload_async(cache_key, compute)
+
+def _to_task_list_page(tasks, limit: int) -> TaskListPageResponse:
+    """Trim the limit + 1 fetch to a page and build its next cursor"""
+    page, next_cursor = split_page(tasks, limit)
+    return TaskListPageResponse(
+        items=[_to_task_list_response(task) for task in page],
+        next_cursor=next_cursor
+    )
+
+def _to_task_list_response(task) -> TaskListResponse:
+    """Build the simplified list-view response for a task"""
+    return TaskListResponse(
+        id=task.id,
+        title=task.title,
+        status=task.status,
+        priority=task.priority,
+        due_date=task.due_date,
+        assignee_id=task.assignee_id,
+        creator_id=task.creator_id,
+        assignee_name=task.assignee.name if task.assignee else None,
+        creator_name=task.creator.name if task.creator else "Unknown"
+    )
+
+EXPORT_COLUMNS = [
+    "id", "title", "description", "status", "priority", "due_date",
+    "assignee_id", "assignee_name", "creator_id", "creator_name", "created_at", "updated_at"
+]
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+# Rows per fetched batch and per chunk written to the response
+_EXPORT_BATCH_SIZE = 1000
+
+def export_project_tasks(db: Session, project_id: UUID, format: str = "ndjson") -> Iterator[str]:
+    """
+    Stream every task of a project as NDJSON lines or CSV, one chunk per
+    fetched batch, so memory stays constant whatever the project size
+    """
+    rows = task_repo.stream_project_task_rows(db, project_id, batch_size=_EXPORT_BATCH_SIZE)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if format == "csv":
+        writer.writerow(EXPORT_COLUMNS)
+
+    pending = 0
+    for row in rows:
+        values = [_export_value(value) for value in row]
+        if format == "csv":
+            writer.writerow(["" if value is None else value for value in values])
+        else:
+            buffer.write(json.dumps(dict(zip(EXPORT_COLUMNS, values))) + "\n")
+        pending += 1
+        if pending == _EXPORT_BATCH_SIZE:
+            yield _drain(buffer)
+            pending = 0
+    chunk = _drain(buffer)
+    if chunk:
+        yield chunk
+
+def stream_project_tasks_export(
+    open_session: Callable[[], Session], project_id: UUID, format: str = "ndjson"
+) -> Iterator[str]:
+    """
+    export_project_tasks on a session opened and closed by the stream itself,
+    for a response body that outlives the request's dependencies
+    """
+    db = open_session()
+    try:
+        yield from export_project_tasks(db, project_id, format)
+    finally:
+        db.close()
+
+def _export_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _drain(buffer: io.StringIO) -> str:
+    chunk = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+    return chunk
 
 
 
@@ -136,7 +308,6 @@ def update_task(
     if not task:
         raise TaskNotFoundException()
     
-    invalidate_project_report_cache(task.project_id)
     old_status = task.status
     # Validate status transition
     if task_data.status:
@@ -158,8 +329,10 @@ def update_task(
     
     # Update task
     updated_task = task_repo.update_task(db, task_id, update_data)
+    # After the write, so a concurrent report read cannot re-cache old counts
+    invalidate_project_report_cache(updated_task.project_id)
     user_notify= updated_task.assignee_id
-    create_notification(
+    enqueue_notification(
             user_id=user_notify,
             title="Task Status Updated",
             message=f"Task '{updated_task.title}' status changed from {old_status} to {updated_task.status}",
@@ -174,14 +347,15 @@ def delete_task(db: Session, task_id: UUID, user_id: UUID) -> bool:
     task = task_repo.get_task_by_id(db, task_id)
     if not task:
         raise TaskNotFoundException()
-    invalidate_project_report_cache(task.project_id)
     # Check access (only creator or project admin can delete)
     if task.creator_id != user_id:
         if not task_repo.check_user_access_to_task(db, task_id, user_id):
             raise TaskAccessDeniedException()
         # Additional check for project admin role would go here
     
-    return task_repo.delete_task(db, task_id)
+    deleted = task_repo.delete_task(db, task_id)
+    invalidate_project_report_cache(task.project_id)
+    return deleted
 
 def assign_task_to_user(
     db: Session,
@@ -193,8 +367,9 @@ def assign_task_to_user(
         
     # Assign task
     updated_task = task_repo.assign_task(db, task_id, assignee_id)
+    invalidate_project_report_cache(updated_task.project_id)
     if assignee_id != None:
-        create_notification(
+        enqueue_notification(
             user_id=assignee_id,
             title="Task Assigned",
             message=f"You have been assigned to task: {updated_task.title}",
@@ -206,41 +381,23 @@ def assign_task_to_user(
 def get_tasks_by_assignee(db:Session, assignee_id: UUID, status: str = None) -> List[TaskListResponse]:
     """Get tasks assigned to a user"""
     tasks = task_repo.get_tasks_by_assignee(db, assignee_id, status=status)
-    result = []
-    for task in tasks:
-        task_response = TaskListResponse(
-            id=task.id,
-            title=task.title,
-            status=task.status,
-            priority=task.priority,
-            due_date=task.due_date,
-            assignee_id=task.assignee_id,
-            creator_id=task.creator_id,
-            assignee_name=task.assignee.name if task.assignee else None,
-            creator_name=task.creator.name if task.creator else "Unknown"  # ← THÊM field này
-        )
-        result.append(task_response)
-    
-    return result
+    return [_to_task_list_response(task) for task in tasks]
+def get_tasks_by_assignee_page(
+    db: Session, assignee_id: UUID, status: str = None, limit: int = 100, cursor: Optional[str] = None
+) -> TaskListPageResponse:
+    """Keyset page of tasks assigned to a user"""
+    tasks = task_repo.get_tasks_by_assignee(db, assignee_id, status=status, limit=limit + 1, cursor=cursor)
+    return _to_task_list_page(tasks, limit)
 def get_tasks_by_creator(db:Session, creator_id: UUID, status: str = None) -> List[TaskListResponse]:
     """Get tasks created by a user"""
     tasks = task_repo.get_tasks_by_creator(db, creator_id, status=status)
-    result = []
-    for task in tasks:
-        task_response = TaskListResponse(
-            id=task.id,
-            title=task.title,
-            status=task.status,
-            priority=task.priority,
-            due_date=task.due_date,
-            assignee_id=task.assignee_id,
-            creator_id=task.creator_id,
-            assignee_name=task.assignee.name if task.assignee else None,
-            creator_name=task.creator.name if task.creator else "Unknown"  # ← THÊM field này
-        )
-        result.append(task_response)
-    
-    return result
+    return [_to_task_list_response(task) for task in tasks]
+def get_tasks_by_creator_page(
+    db: Session, creator_id: UUID, status: str = None, limit: int = 100, cursor: Optional[str] = None
+) -> TaskListPageResponse:
+    """Keyset page of tasks created by a user"""
+    tasks = task_repo.get_tasks_by_creator(db, creator_id, status=status, limit=limit + 1, cursor=cursor)
+    return _to_task_list_page(tasks, limit)
 
 def _is_valid_status_transition(current_status: str, new_status: str) -> bool:
     """Validate status transition rules"""
@@ -271,6 +428,15 @@ def get_task_by_id(db:Session, task_id: UUID) -> Optional[TaskResponse]:
         return None
     return TaskResponse.from_orm(task)
 
+async def get_task_by_id_async(db: AsyncSession, task_id: UUID) -> Optional[TaskResponse]:
+    """
+    Get task by ID without access control (async session) - for internal use
+    """
+    task = await task_repo.get_task_by_id_async(db, task_id)
+    if not task:
+        return None
+    return TaskResponse.from_orm(task)
+
 def get_task_by_id_with_access_check(db: Session, task_id: UUID, user_id: UUID):
     """
     Get task với access control - for dependencies
@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from app.repositories.user import get_user_by_id as repo_get_user_by_id
+from app.repositories.user import get_user_by_id_async as repo_get_user_by_id_async
 from app.repositories.user import get_user_by_email as repo_get_user_by_email
 from app.core.exceptions import NotFoundException
 from app.schemas.response.user_response import UserResponse
@@ -29,6 +31,15 @@ def get_user_by_id(db: Session, user_id: UUID) -> UserResponse:
         raise NotFoundException()
     return UserResponse.from_orm(user)
 
+async def get_user_by_id_async(db: AsyncSession, user_id: UUID) -> UserResponse:
+    """
+    Lấy user từ id (async session) và chuyển thành UserResponse
+    """
+    user = await repo_get_user_by_id_async(db, user_id)
+    if not user:
+        raise NotFoundException()
+    return UserResponse.from_orm(user)
+
 def get_user_by_email(db: Session, email: str) -> UserResponse:
     """
     Lấy user từ email và chuyển thành UserResponse
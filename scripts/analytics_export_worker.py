@@ -0,0 +1,25 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.services.analytics_export_service import process_snapshot_jobs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the analytics snapshots requested through the API")
+    parser.add_argument("--block-seconds", type=int, default=5, help="How long to wait for a queued snapshot")
+    args = parser.parse_args()
+
+    print("Analytics export worker started")
+    while True:
+        try:
+            snapshot_dir = process_snapshot_jobs(args.block_seconds)
+            if snapshot_dir:
+                print(f"Analytics snapshot written to {snapshot_dir}")
+        except Exception as e:
+            print(f"Error exporting analytics snapshot: {e}")
+            time.sleep(1)
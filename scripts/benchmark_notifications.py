@@ -0,0 +1,70 @@
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.repositories.notification import (
+    redis_client,
+    create_notification,
+    get_notification,
+    get_user_notifications,
+    get_unread_count
+)
+from app.schemas.redis.notification_redis import NotificationRedis
+
+def sequential_read(user_id: str, limit: int):
+    """The former read path: LRANGE, then one GET round trip per notification"""
+    user_key = NotificationRedis.create_user_notifications_key(user_id)
+    ids = redis_client.lrange(user_key, 0, limit - 1)
+    return [get_notification(user_id, nid) for nid in ids]
+
+def time_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def bytes_per_notification(user_id: str, stored: int) -> float:
+    """Redis memory of the user's notification keys, per stored notification"""
+    keys = redis_client.scan_iter(match=f"*{user_id}*")
+    return sum(redis_client.memory_usage(key) or 0 for key in keys) / stored
+
+def benchmark(sizes, repeat: int):
+    """
+    Median latency (ms) of notification reads for users with N notifications.
+    Run against a disposable Redis: it writes and then deletes test keys.
+    Users keep at most notification_max_per_user, so "stored" can be below N;
+    reads and memory are measured over what is stored.
+    """
+    print(f"{'notifications':>13} {'stored':>7} {'sequential GET':>15} {'batched list':>13} {'unread count':>13} {'bytes each':>11}")
+    for size in sizes:
+        user_id = str(uuid4())
+        try:
+            for i in range(size):
+                create_notification(user_id, f"Benchmark {i}", "Benchmark notification", "benchmark")
+            sequential = time_ms(lambda: sequential_read(user_id, size), repeat)
+            batched = time_ms(lambda: get_user_notifications(user_id, 0, size), repeat)
+            unread = time_ms(lambda: get_unread_count(user_id), repeat)
+            stored = redis_client.hlen(NotificationRedis.create_user_entries_key(user_id))
+            memory = bytes_per_notification(user_id, stored)
+            print(f"{size:>13} {stored:>7} {sequential:>15.2f} {batched:>13.2f} {unread:>13.2f} {memory:>11.0f}")
+        finally:
+            keys = list(redis_client.scan_iter(match=f"*{user_id}*"))
+            if keys:
+                redis_client.delete(*keys)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark notification read latency")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Notifications per user")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per measurement (median reported)")
+    args = parser.parse_args()
+
+    benchmark(args.sizes, args.repeat)
@@ -0,0 +1,35 @@
+import argparse
+import sys
+from pathlib import Path
+from uuid import UUID
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.config import settings
+from app.services.analytics_export_service import run_analytics_snapshot, new_snapshot_dir
+
+def export_analytics(output_dir: str, organization_ids=None, batch_size: int = 10000):
+    """
+    Dump tasks, comments, attachments and project members to Parquet, partitioned by organization.
+    """
+    try:
+        written = run_analytics_snapshot(output_dir, organization_ids, batch_size)
+    except Exception as e:
+        print(f"Error exporting analytics snapshot: {e}")
+        return False
+    for table, rows in written.items():
+        print(f"{table}: {rows} rows")
+    print(f"Analytics snapshot written to {output_dir}")
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export analytics tables to partitioned Parquet files")
+    parser.add_argument("--output-dir", default=None, help="Snapshot directory (default: a new timestamped directory under analytics_export_dir)")
+    parser.add_argument("--organization-id", type=UUID, action="append", help="Only these organizations (repeatable)")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows per cursor batch / Parquet row group")
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or new_snapshot_dir(settings.analytics_export_dir)
+    sys.exit(0 if export_analytics(output_dir, args.organization_id, args.batch_size) else 1)
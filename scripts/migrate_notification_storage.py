@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.repositories.notification import redis_client, migrate_user_notifications
+
+def migrate_notification_storage():
+    """
+    Move every user's notifications from one key per notification into the
+    per-user entries hash (one-off, after deploying the compact layout; safe to re-run).
+    """
+    users = 0
+    notifications = 0
+    for user_key in redis_client.scan_iter(match="user_notifications:*", count=1000):
+        user_id = user_key.split(":", 1)[1]
+        notifications += migrate_user_notifications(user_id)
+        users += 1
+    print(f"Migrated notifications of {users} users ({notifications} notifications kept)")
+
+if __name__ == "__main__":
+    migrate_notification_storage()
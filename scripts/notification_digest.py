@@ -0,0 +1,36 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.repositories.notification import flush_notification_digests
+
+def send_notification_digests(batch_size: int = 1000) -> int:
+    """
+    Send the digest of every user with pending digest notifications.
+    """
+    sent = 0
+    while True:
+        batch = flush_notification_digests(batch_size)
+        if not batch:
+            break
+        sent += batch
+    print(f"Sent {sent} notification digests")
+    return sent
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Send periodic notification digests")
+    parser.add_argument("--interval", type=int, default=0, help="Repeat every N seconds (0 = run once)")
+    args = parser.parse_args()
+
+    send_notification_digests()
+    while args.interval:
+        time.sleep(args.interval)
+        try:
+            send_notification_digests()
+        except Exception as e:
+            print(f"Error sending notification digests: {e}")
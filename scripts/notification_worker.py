@@ -0,0 +1,31 @@
+import argparse
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.repositories.notification import ensure_notification_group
+from app.services.notification_service import process_notification_queue
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write notifications queued by the API")
+    parser.add_argument("--consumer", default=f"{socket.gethostname()}-{os.getpid()}", help="Consumer name, unique per worker")
+    parser.add_argument("--batch-size", type=int, default=100, help="Notifications written per round trip")
+    parser.add_argument("--block-ms", type=int, default=5000, help="How long to wait for new entries")
+    args = parser.parse_args()
+
+    ensure_notification_group()
+    print(f"Notification worker {args.consumer} started")
+    while True:
+        try:
+            written = process_notification_queue(args.consumer, args.batch_size, args.block_ms)
+            if written:
+                print(f"Wrote {written} notifications")
+        except Exception as e:
+            print(f"Error processing notification queue: {e}")
+            time.sleep(1)
@@ -0,0 +1,38 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.database import SessionLocal
+from app.repositories.project_task_stats import reconcile_project_task_stats
+
+def reconcile_task_stats():
+    """
+    Rebuild project_task_stats from the tasks table.
+    """
+    db = SessionLocal()
+    try:
+        rows = reconcile_project_task_stats(db)
+        print(f"Reconciled project task stats ({rows} rows)")
+    except Exception as e:
+        db.rollback()
+        print(f"Error reconciling project task stats: {e}")
+        return False
+    finally:
+        db.close()
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile per-project task counters")
+    parser.add_argument("--interval", type=int, default=0, help="Repeat every N seconds (0 = run once, e.g. from cron)")
+    args = parser.parse_args()
+
+    if not args.interval:
+        sys.exit(0 if reconcile_task_stats() else 1)
+    while True:
+        reconcile_task_stats()
+        time.sleep(args.interval)
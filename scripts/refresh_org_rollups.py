@@ -0,0 +1,54 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.database import SessionLocal
+from app.repositories.org_rollup import refresh_dirty_rollups, rebuild_all_rollups
+
+def refresh_org_rollups(full: bool = False, batch_size: int = 100) -> int:
+    """
+    Refresh organization rollups: the dirty projects, or the whole table with full=True.
+    """
+    db = SessionLocal()
+    try:
+        if full:
+            rows = rebuild_all_rollups(db)
+            print(f"Rebuilt organization rollups ({rows} rows)")
+            return rows
+        refreshed = 0
+        while True:
+            batch = refresh_dirty_rollups(db, batch_size)
+            refreshed += batch
+            # Projects changed during their refresh wait for the next run
+            if batch < batch_size:
+                break
+        if refreshed:
+            print(f"Refreshed rollups of {refreshed} projects")
+        return refreshed
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh organization task rollups")
+    parser.add_argument("--full", action="store_true", help="Rebuild the whole rollup table")
+    parser.add_argument("--interval", type=int, default=0, help="Repeat every N seconds (0 = run once)")
+    parser.add_argument("--full-interval", type=int, default=0, help="With --interval, rebuild the whole table every N seconds (0 = never)")
+    args = parser.parse_args()
+
+    refresh_org_rollups(full=args.full)
+    last_full = time.monotonic()
+    while args.interval:
+        time.sleep(args.interval)
+        # Catches up on changes whose dirty mark was lost (e.g. Redis down)
+        full = bool(args.full_interval) and time.monotonic() - last_full >= args.full_interval
+        try:
+            refresh_org_rollups(full=full)
+            if full:
+                last_full = time.monotonic()
+        except Exception as e:
+            print(f"Error refreshing organization rollups: {e}")
@@ -0,0 +1,34 @@
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.database import SessionLocal
+from app.repositories.burndown import take_status_snapshots
+
+def snapshot_burndown(day: date = None):
+    """
+    Record per-project status counts for burndown charts (changed counts only).
+    """
+    db = SessionLocal()
+    try:
+        rows = take_status_snapshots(db, day)
+        print(f"Recorded burndown snapshots ({rows} changed counts)")
+    except Exception as e:
+        db.rollback()
+        print(f"Error recording burndown snapshots: {e}")
+        return False
+    finally:
+        db.close()
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record daily per-project status counts")
+    parser.add_argument("--day", type=date.fromisoformat, default=None, help="Snapshot day (YYYY-MM-DD, default: today)")
+    args = parser.parse_args()
+
+    sys.exit(0 if snapshot_burndown(args.day) else 1)
@@ -0,0 +1,49 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from uuid import UUID
+
+# Add project root to Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from app.config import settings
+from app.database import SessionLocal
+from app.repositories.report import claim_due_warmups, warm_project_reports
+
+def warm_project(project_id: str) -> bool:
+    db = SessionLocal()
+    try:
+        warm_project_reports(db, UUID(project_id))
+        return True
+    except Exception as e:
+        print(f"Error warming reports of project {project_id}: {e}")
+        return False
+    finally:
+        db.close()
+
+def warm_report_cache(pool: ThreadPoolExecutor, batch_size: int = 100) -> int:
+    """
+    Warm the report cache of every project whose debounce delay has passed.
+    """
+    project_ids = claim_due_warmups(batch_size)
+    warmed = sum(pool.map(warm_project, project_ids))
+    if project_ids:
+        print(f"Warmed reports of {warmed}/{len(project_ids)} projects")
+    return warmed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute report caches shortly after task writes")
+    parser.add_argument("--concurrency", type=int, default=settings.report_warm_concurrency, help="Projects warmed in parallel")
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between queue polls")
+    args = parser.parse_args()
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        while True:
+            try:
+                warm_report_cache(pool, batch_size=args.concurrency * 25)
+            except Exception as e:
+                print(f"Error polling report warm queue: {e}")
+            time.sleep(args.interval)
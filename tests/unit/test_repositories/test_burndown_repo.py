@@ -0,0 +1,83 @@
+import pytest
+from datetime import date
+from uuid import uuid4
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.exceptions import InvalidDateRangeException
+from app.models.task import TaskStatusEnum
+from app.repositories import burndown
+from app.repositories.burndown import get_project_burndown, take_status_snapshots
+
+
+def test_take_status_snapshots_writes_only_changed_counts():
+    project_a, project_b = uuid4(), uuid4()
+    db_session = MagicMock()
+    db_session.execute.return_value.all.side_effect = [
+        # Current counters
+        [(project_a, TaskStatusEnum.TODO, 4), (project_a, TaskStatusEnum.DONE, 2), (project_b, TaskStatusEnum.TODO, 1)],
+        # Last recorded counts
+        [(project_a, TaskStatusEnum.TODO, 4), (project_a, TaskStatusEnum.DONE, 1), (project_b, TaskStatusEnum.IN_PROGRESS, 3)],
+    ]
+
+    with patch.object(burndown, "pg_insert") as insert_mock:
+        written = take_status_snapshots(db_session, date(2026, 3, 2))
+
+    assert written == 3
+    rows = insert_mock.return_value.values.call_args.args[0]
+    assert {(row["project_id"], row["status"]): row["task_count"] for row in rows} == {
+        (project_a, TaskStatusEnum.DONE): 2,
+        (project_b, TaskStatusEnum.TODO): 1,
+        (project_b, TaskStatusEnum.IN_PROGRESS): 0,
+    }
+    assert all(row["day"] == date(2026, 3, 2) for row in rows)
+    db_session.commit.assert_called_once()
+
+
+def test_latest_counts_use_distinct_on():
+    sql = str(burndown._latest_counts(date(2026, 3, 2), uuid4()).compile(dialect=postgresql.dialect()))
+
+    assert "DISTINCT ON (project_status_snapshots.project_id, project_status_snapshots.status)" in sql
+    assert "ORDER BY project_status_snapshots.project_id, project_status_snapshots.status, project_status_snapshots.day DESC" in sql
+
+
+def test_take_status_snapshots_no_changes():
+    project_id = uuid4()
+    db_session = MagicMock()
+    db_session.execute.return_value.all.side_effect = [
+        [(project_id, TaskStatusEnum.TODO, 2)],
+        [(project_id, TaskStatusEnum.TODO, 2)],
+    ]
+
+    assert take_status_snapshots(db_session, date(2026, 3, 2)) == 0
+    assert db_session.execute.call_count == 2
+
+
+def test_burndown_carries_counts_forward():
+    db_session = MagicMock()
+    project_id = uuid4()
+    db_session.execute.return_value.all.side_effect = [
+        # Counts in effect on the first day
+        [(project_id, TaskStatusEnum.TODO, 5), (project_id, TaskStatusEnum.DONE, 1)],
+        # Changes inside the range
+        [(date(2026, 3, 3), TaskStatusEnum.TODO, 3), (date(2026, 3, 3), TaskStatusEnum.DONE, 3)],
+    ]
+
+    points = get_project_burndown(db_session, project_id, date(2026, 3, 1), date(2026, 3, 4))
+
+    assert [point["day"] for point in points] == [date(2026, 3, d) for d in range(1, 5)]
+    assert [point["remaining"] for point in points] == [5, 5, 3, 3]
+    assert points[0]["status_counts"] == {"todo": 5, "in-progress": 0, "done": 1}
+    assert points[3]["status_counts"] == {"todo": 3, "in-progress": 0, "done": 3}
+    assert all(point["total"] == 6 for point in points)
+
+
+@pytest.mark.parametrize("from_date, to_date", [
+    (date(2026, 3, 5), date(2026, 3, 1)),
+    (date(2024, 1, 1), date(2026, 1, 1)),
+])
+def test_burndown_rejects_invalid_range(from_date, to_date):
+    from app.services.report_service import get_project_burndown as get_burndown_report
+    with pytest.raises(InvalidDateRangeException):
+        get_burndown_report(MagicMock(), uuid4(), from_date, to_date)
@@ -0,0 +1,403 @@
+import json
+import pytest
+import redis
+from datetime import datetime
+from uuid import uuid4
+from unittest.mock import patch
+
+from app.config import settings
+from app.repositories import notification as notification_repo
+from app.schemas.redis.notification_redis import NotificationRedis
+
+
+def stored_notification(user_id, is_read=False):
+    return NotificationRedis(
+        id=str(uuid4()),
+        user_id=user_id,
+        title="Title",
+        message="Message",
+        type="task_assigned",
+        is_read=is_read,
+        created_at=datetime.utcnow()
+    )
+
+
+@pytest.fixture
+def redis_mock():
+    with patch.object(notification_repo, "redis_client") as client:
+        client.eval.return_value = [1, "stored", 1]
+        yield client
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis that runs the Lua scripts"""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    with patch.object(notification_repo, "redis_client", client):
+        yield client
+
+
+def test_get_user_notifications_reads_in_two_round_trips(redis_mock):
+    user_id = str(uuid4())
+    first, second = stored_notification(user_id), stored_notification(user_id)
+    expired = stored_notification(user_id)
+    expired.created_at = datetime(2000, 1, 1)
+    # An id without an entry (e.g. trimmed by a concurrent write) is skipped
+    ids = [first.id, "missing", expired.id, second.id]
+    redis_mock.lrange.return_value = ids
+    pipe = redis_mock.pipeline.return_value
+    pipe.execute.return_value = [
+        [notification_repo._encode(first), None, notification_repo._encode(expired), notification_repo._encode(second)],
+        [1e12, None, 1e12, None],
+    ]
+
+    result = notification_repo.get_user_notifications(user_id, 0, 4)
+
+    assert [(n.id, n.is_read, n.title) for n in result] == [(first.id, False, "Title"), (second.id, True, "Title")]
+    pipe.hmget.assert_called_once_with(NotificationRedis.create_user_entries_key(user_id), ids)
+    pipe.execute.assert_called_once()
+    redis_mock.get.assert_not_called()
+
+
+def test_entry_round_trip_is_compact():
+    notification = stored_notification(str(uuid4()))
+    notification.related_id = str(uuid4())
+    entry = notification_repo._encode(notification)
+
+    decoded = notification_repo._decode(str(notification.user_id), notification.id, entry, 1e12, notification.created_at.timestamp())
+
+    assert decoded.model_dump(exclude={"created_at"}) == notification.model_dump(exclude={"created_at"})
+    assert abs((decoded.created_at - notification.created_at).total_seconds()) < 0.001
+    assert len(entry) < len(notification.json()) / 2
+
+
+def test_get_user_notifications_empty_list_skips_mget(redis_mock):
+    redis_mock.lrange.return_value = []
+
+    assert notification_repo.get_user_notifications(str(uuid4())) == []
+    redis_mock.pipeline.assert_not_called()
+
+
+def test_create_notification_adds_to_unread_set_atomically(redis_mock):
+    user_id = str(uuid4())
+
+    notification_repo.create_notification(user_id, "Title", "Message", "task_assigned")
+
+    script, numkeys, *args = redis_mock.eval.call_args.args
+    assert numkeys == 3
+    assert args[:3] == [
+        NotificationRedis.create_user_entries_key(user_id),
+        NotificationRedis.create_user_notifications_key(user_id),
+        NotificationRedis.create_user_unread_key(user_id),
+    ]
+    assert "ZADD" in script and "LTRIM" in script
+    assert args[-1] == settings.notification_max_per_user
+    assert "PUBLISH" in script and args[-3] == NotificationRedis.create_user_channel(user_id)
+    redis_mock.setex.assert_not_called()
+
+
+@pytest.mark.parametrize("script_result, expected", [(1, True), (0, False)])
+def test_mark_as_read_uses_script(redis_mock, script_result, expected):
+    redis_mock.eval.return_value = script_result
+
+    assert notification_repo.mark_as_read(str(uuid4()), "n1") is expected
+    assert "ZREM" in redis_mock.eval.call_args.args[0]
+
+
+def test_mark_all_as_read_is_one_transaction(redis_mock):
+    user_id = str(uuid4())
+    pipe = redis_mock.pipeline.return_value
+    pipe.execute.return_value = [7, 1]
+
+    assert notification_repo.mark_all_as_read(user_id) == 7
+    redis_mock.pipeline.assert_called_once_with(transaction=True)
+    pipe.delete.assert_called_once_with(NotificationRedis.create_user_unread_key(user_id))
+    redis_mock.lrange.assert_not_called()
+
+
+def test_mark_many_as_read_counts_only_unread(redis_mock):
+    user_id = str(uuid4())
+    pipe = redis_mock.pipeline.return_value
+    pipe.execute.return_value = [[1e12, None, 1.0], 2]
+
+    assert notification_repo.mark_many_as_read(user_id, ["a", "b", "c"]) == 1
+    pipe.zrem.assert_called_once_with(NotificationRedis.create_user_unread_key(user_id), "a", "b", "c")
+
+
+def test_mark_type_as_read_runs_one_script(redis_mock):
+    user_id = str(uuid4())
+    redis_mock.eval.return_value = 3
+
+    assert notification_repo.mark_type_as_read(user_id, "task_assigned") == 3
+    args = redis_mock.eval.call_args.args
+    assert args[1:4] == (
+        2, NotificationRedis.create_user_unread_key(user_id), NotificationRedis.create_user_entries_key(user_id)
+    )
+    assert args[5] == "task_assigned"
+
+
+def test_pages_stay_full_after_deletes(fake_redis):
+    user_id = str(uuid4())
+    created = [
+        notification_repo.create_notification(user_id, "Title", f"Message {i}", "task_assigned")
+        for i in range(10)
+    ]
+    for notification in created[5:]:
+        assert notification_repo.delete_notification(user_id, notification.id) is True
+
+    first_page = notification_repo.get_user_notifications(user_id, 0, 5)
+
+    assert [n.id for n in first_page] == [n.id for n in reversed(created[:5])]
+    assert notification_repo.get_user_notifications(user_id, 5, 5) == []
+    assert fake_redis.llen(NotificationRedis.create_user_notifications_key(user_id)) == 5
+    assert notification_repo.get_unread_count(user_id) == 5
+
+
+def test_unread_count_is_one_zcount_of_unexpired_entries(redis_mock):
+    user_id = str(uuid4())
+    redis_mock.zcount.return_value = 4
+
+    assert notification_repo.get_unread_count(user_id) == 4
+    key, low, high = redis_mock.zcount.call_args.args
+    assert key == NotificationRedis.create_user_unread_key(user_id)
+    assert low.startswith("(") and high == "+inf"
+    redis_mock.lrange.assert_not_called()
+
+
+def test_migrate_user_notifications(redis_mock):
+    user_id = str(uuid4())
+    unread, read = stored_notification(user_id), stored_notification(user_id, is_read=True)
+    migrated = stored_notification(user_id)
+    ids = [migrated.id, unread.id, read.id, "gone"]
+    tx = redis_mock.pipeline.return_value.__enter__.return_value
+    tx.lrange.return_value = ids
+    redis_mock.pipeline.return_value.execute.return_value = [
+        0, [None, None, None, None],
+        [notification_repo._encode(migrated), None, None, None],
+        [None, unread.json(), read.json(), None],
+        -2, 100, 100, -2,
+    ]
+
+    assert notification_repo.migrate_user_notifications(user_id) == 3
+    entries_key, = tx.hset.call_args.args
+    assert list(tx.hset.call_args.kwargs["mapping"]) == [unread.id, read.id]
+    tx.hdel.assert_called_once_with(entries_key, "gone")
+    tx.rpush.assert_called_once_with(NotificationRedis.create_user_notifications_key(user_id), *ids[:3])
+    key, mapping = tx.zadd.call_args.args
+    assert key == NotificationRedis.create_user_unread_key(user_id)
+    assert list(mapping) == [unread.id]
+    assert NotificationRedis.create_key(user_id, unread.id) in tx.delete.call_args.args
+
+
+def test_migration_keeps_a_read_made_meanwhile(fake_redis):
+    user_id = str(uuid4())
+    first, second = stored_notification(user_id), stored_notification(user_id)
+    user_key = NotificationRedis.create_user_notifications_key(user_id)
+    unread_key = NotificationRedis.create_user_unread_key(user_id)
+    fake_redis.rpush(user_key, first.id, second.id)
+    fake_redis.zadd(unread_key, {first.id: 1, second.id: 2})
+    for notification in (first, second):
+        fake_redis.setex(NotificationRedis.create_key(user_id, notification.id), 100, notification.json())
+    pipeline = fake_redis.pipeline
+
+    def read_then_mark(transaction=True):
+        pipe = pipeline(transaction=transaction)
+        if not transaction and fake_redis.zscore(unread_key, first.id) is not None:
+            execute = pipe.execute
+
+            def mark_as_read():
+                result = execute()
+                # mark_as_read lands between the reads and the transaction
+                fake_redis.zrem(unread_key, first.id)
+                return result
+            pipe.execute = mark_as_read
+        return pipe
+
+    with patch.object(fake_redis, "pipeline", side_effect=read_then_mark):
+        assert notification_repo.migrate_user_notifications(user_id) == 2
+
+    assert fake_redis.lrange(user_key, 0, -1) == [first.id, second.id]
+    assert fake_redis.zrange(unread_key, 0, -1) == [second.id]
+
+
+def queued_event(user_id):
+    fields = {
+        "id": str(uuid4()),
+        "user_id": user_id,
+        "title": "Title",
+        "message": "Message",
+        "type": "task_assigned",
+        "created_at": datetime.utcnow().isoformat(),
+    }
+    return str(uuid4()), fields
+
+
+def test_enqueue_notification_is_one_xadd(redis_mock):
+    user_id = str(uuid4())
+
+    notification_id = notification_repo.enqueue_notification(user_id, "Title", "Message", "task_assigned", "t1")
+
+    key, fields = redis_mock.xadd.call_args.args
+    assert key == notification_repo.NOTIFICATION_QUEUE_KEY
+    assert fields["id"] == notification_id
+    assert fields["related_id"] == "t1"
+    assert redis_mock.xadd.call_args.kwargs["approximate"] is True
+    redis_mock.eval.assert_not_called()
+
+
+def test_write_notification_events_acks_only_written(redis_mock):
+    user_id = str(uuid4())
+    ok, failed = queued_event(user_id), queued_event(user_id)
+    pipe = redis_mock.pipeline.return_value
+    pipe.execute.return_value = [1, redis.ResponseError("OOM")]
+
+    assert notification_repo.write_notification_events([ok, failed]) == 1
+    assert pipe.eval.call_count == 2
+    assert pipe.eval.call_args_list[0].args[5:8] == (
+        settings.notification_ttl, notification_repo._encode(NotificationRedis(**ok[1])), ok[1]["id"]
+    )
+    redis_mock.xack.assert_called_once_with(
+        notification_repo.NOTIFICATION_QUEUE_KEY, notification_repo.NOTIFICATION_QUEUE_GROUP, ok[0]
+    )
+
+
+def test_malformed_event_is_dead_lettered_without_failing_the_batch(fake_redis):
+    user_id = str(uuid4())
+    ok, malformed = queued_event(user_id), queued_event(user_id)
+    del malformed[1]["title"]
+    queue, group = notification_repo.NOTIFICATION_QUEUE_KEY, notification_repo.NOTIFICATION_QUEUE_GROUP
+    notification_repo.ensure_notification_group()
+    for _, fields in (ok, malformed):
+        fake_redis.xadd(queue, fields)
+    events = notification_repo.read_notification_events("worker-1", 10, 100)
+
+    assert notification_repo.write_notification_events(events) == 1
+
+    assert [n.id for n in notification_repo.get_user_notifications(user_id)] == [ok[1]["id"]]
+    assert fake_redis.xpending(queue, group)["pending"] == 0
+    [(_, dead)] = fake_redis.xrange(notification_repo.NOTIFICATION_DEAD_LETTER_KEY)
+    assert dead["id"] == malformed[1]["id"]
+
+
+def test_claim_stale_events_dead_letters_exhausted_entries(redis_mock):
+    user_id = str(uuid4())
+    retry, exhausted = queued_event(user_id), queued_event(user_id)
+    redis_mock.xpending_range.return_value = [
+        {"message_id": retry[0], "times_delivered": 1},
+        {"message_id": exhausted[0], "times_delivered": settings.notification_worker_max_attempts},
+    ]
+    redis_mock.xclaim.return_value = [retry, exhausted]
+
+    assert notification_repo.claim_stale_notification_events("worker-1", 10) == [retry]
+    pipe = redis_mock.pipeline.return_value
+    assert pipe.xadd.call_args.args[0] == notification_repo.NOTIFICATION_DEAD_LETTER_KEY
+    assert pipe.xack.call_args.args[2:] == (exhausted[0],)
+
+
+def test_ensure_notification_group_ignores_existing_group(redis_mock):
+    redis_mock.xgroup_create.side_effect = redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+
+    notification_repo.ensure_notification_group()
+
+
+def comment_on(user_id, task_id, message="Message"):
+    return notification_repo.create_notification(user_id, "New Comment Added", message, "comment_added", task_id)
+
+
+def test_same_group_merges_into_one_entry(fake_redis):
+    user_id, task_id = str(uuid4()), str(uuid4())
+
+    first = comment_on(user_id, task_id, "first")
+    second = comment_on(user_id, task_id, "second")
+
+    assert (second.id, second.count) == (first.id, 2)
+    [stored] = notification_repo.get_user_notifications(user_id)
+    assert (stored.id, stored.count, stored.message) == (first.id, 2, "second")
+    assert fake_redis.llen(NotificationRedis.create_user_notifications_key(user_id)) == 1
+
+
+def test_merged_entry_moves_to_top_and_is_unread_again(fake_redis):
+    user_id, busy_task, other_task = str(uuid4()), str(uuid4()), str(uuid4())
+    first = comment_on(user_id, busy_task)
+    notification_repo.mark_as_read(user_id, first.id)
+    other = comment_on(user_id, other_task)
+
+    comment_on(user_id, busy_task)
+
+    assert [n.id for n in notification_repo.get_user_notifications(user_id)] == [first.id, other.id]
+    assert notification_repo.get_notification(user_id, first.id).is_read is False
+    assert notification_repo.get_unread_count(user_id) == 2
+
+
+def test_replayed_queue_events_are_not_written_twice(fake_redis):
+    user_id, task_id = str(uuid4()), str(uuid4())
+    creator, merged = queued_event(user_id), queued_event(user_id)
+    for _, fields in (creator, merged):
+        fields.update(type="comment_added", related_id=task_id)
+
+    with patch.object(notification_repo, "NOTIFICATION_QUEUE_KEY", "test:outbox"):
+        notification_repo.write_notification_events([creator, merged])
+        notification_repo.write_notification_events([creator, merged])
+
+    [stored] = notification_repo.get_user_notifications(user_id)
+    assert (stored.id, stored.count) == (creator[1]["id"], 2)
+
+
+def test_new_entry_once_the_window_expires(fake_redis):
+    user_id, task_id = str(uuid4()), str(uuid4())
+    first = comment_on(user_id, task_id)
+    group_key = NotificationRedis.create_group_key(user_id, "comment_added", task_id)
+    assert 0 < fake_redis.ttl(group_key) <= settings.notification_coalesce_window_seconds
+
+    fake_redis.delete(group_key)
+    second = comment_on(user_id, task_id)
+
+    assert second.id != first.id and second.count == 1
+    assert [n.count for n in notification_repo.get_user_notifications(user_id)] == [1, 1]
+
+
+def test_coalescing_disabled_by_zero_window(fake_redis):
+    user_id, task_id = str(uuid4()), str(uuid4())
+
+    with patch.object(settings, "notification_coalesce_window_seconds", 0):
+        first, second = comment_on(user_id, task_id), comment_on(user_id, task_id)
+
+    assert first.id != second.id
+    assert len(notification_repo.get_user_notifications(user_id)) == 2
+
+
+def test_merged_entry_count_is_decoded():
+    notification = stored_notification(str(uuid4()))
+    notification.count = 12
+
+    entry = notification_repo._encode(notification)
+    decoded = notification_repo._decode(str(notification.user_id), notification.id, entry, None, notification.created_at.timestamp())
+
+    assert decoded.count == 12
+
+
+def test_digest_type_is_counted_instead_of_queued(redis_mock):
+    user_id = str(uuid4())
+
+    with patch.object(settings, "notification_digest_types", "comment_added, task_assigned"):
+        assert notification_repo.enqueue_notification(user_id, "Title", "Message", "comment_added") is None
+
+    redis_mock.xadd.assert_not_called()
+    pipe = redis_mock.pipeline.return_value
+    pipe.hincrby.assert_called_once_with(NotificationRedis.create_user_digest_key(user_id), "comment_added", 1)
+    pipe.sadd.assert_called_once_with(notification_repo.NOTIFICATION_DIGEST_PENDING_KEY, user_id)
+
+
+def test_flush_notification_digests_sends_one_per_user(redis_mock):
+    user_id = str(uuid4())
+    redis_mock.spop.return_value = [user_id]
+    redis_mock.pipeline.return_value.execute.return_value = [{"comment_added": "5", "task_assigned": "1"}, 1]
+
+    assert notification_repo.flush_notification_digests() == 1
+    args = redis_mock.eval.call_args.args
+    assert args[1] == 3
+    title, message, type_ = json.loads(args[6])[:3]
+    assert (title, type_) == ("Notification digest", notification_repo.DIGEST_NOTIFICATION_TYPE)
+    assert message == "6 new notifications: 5 comment_added, 1 task_assigned"
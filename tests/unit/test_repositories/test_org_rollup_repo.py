@@ -0,0 +1,138 @@
+import pytest
+from datetime import date, timedelta
+from uuid import uuid4
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
+from app.repositories import org_rollup
+from app.repositories.org_rollup import (
+    ROLLUP_DIRTY_KEY, get_organization_summary, rebuild_all_rollups, refresh_dirty_rollups,
+    refresh_project_rollup
+)
+
+
+def test_get_organization_summary():
+    project_a, project_b = uuid4(), uuid4()
+    today = date.today()
+    db_session = MagicMock()
+    # One row per grouping set member: (project, status), (priority), (recent day)
+    db_session.execute.return_value.all.return_value = [
+        (project_a, TaskStatusEnum.TODO, None, None, 2),
+        (project_a, TaskStatusEnum.DONE, None, None, 3),
+        (project_b, TaskStatusEnum.DONE, None, None, 5),
+        (None, None, TaskPriorityEnum.LOW, None, 3),
+        (None, None, TaskPriorityEnum.HIGH, None, 7),
+        (None, None, None, today, 2),
+        (None, None, None, today - timedelta(days=1), 3),
+        (None, None, None, None, 5),
+    ]
+
+    result = get_organization_summary(db_session, uuid4(), days=7)
+
+    assert result["total_tasks"] == 10
+    assert result["status_counts"] == {"todo": 2, "in-progress": 0, "done": 8}
+    assert result["priority_counts"] == {"low": 3, "medium": 0, "high": 7}
+    assert {p["project_id"]: p["total"] for p in result["projects"]} == {
+        str(project_a): 5, str(project_b): 5
+    }
+    assert len(result["created_per_day"]) == 7
+    assert result["created_per_day"][str(today)] == 2
+    assert sum(result["created_per_day"].values()) == 5
+    db_session.execute.assert_called_once()
+    sql = str(db_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+    assert "GROUP BY GROUPING SETS" in sql and "sum(" in sql
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis that runs the Lua scripts"""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    with patch.object(org_rollup, "redis_client", client):
+        yield client
+
+
+def test_task_change_marks_project_dirty_on_commit(fake_redis):
+    project_id = uuid4()
+    task = Task()
+    set_committed_value(task, "project_id", project_id)
+    session = MagicMock()
+    session.info = {}
+
+    with patch.object(org_rollup, "object_session", return_value=session):
+        org_rollup._queue_rollup_refresh(None, MagicMock(), task)
+    org_rollup._flush_dirty_rollups(session)
+
+    assert fake_redis.hgetall(ROLLUP_DIRTY_KEY) == {str(project_id): "1"}
+    assert "rollup_dirty_projects" not in session.info
+
+
+def test_rollback_discards_dirty_projects():
+    session = MagicMock()
+    session.info = {"rollup_dirty_projects": {uuid4()}}
+
+    org_rollup._discard_dirty_rollups(session)
+    with patch.object(org_rollup, "redis_client") as redis_mock:
+        org_rollup._flush_dirty_rollups(session)
+
+    redis_mock.pipeline.assert_not_called()
+
+
+def test_refresh_dirty_rollups_keeps_projects_on_failure(fake_redis):
+    project_ids = [uuid4(), uuid4()]
+    org_rollup.mark_rollup_dirty(*project_ids)
+    db_session = MagicMock()
+    db_session.commit.side_effect = RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        refresh_dirty_rollups(db_session)
+
+    db_session.rollback.assert_called_once()
+    assert set(fake_redis.hkeys(ROLLUP_DIRTY_KEY)) == {str(project_id) for project_id in project_ids}
+
+
+def test_refresh_dirty_rollups_clears_projects_once_committed(fake_redis):
+    unchanged, changed = uuid4(), uuid4()
+    org_rollup.mark_rollup_dirty(unchanged, changed)
+    db_session = MagicMock()
+    # A task of `changed` is written while the batch refreshes
+    db_session.commit.side_effect = lambda: org_rollup.mark_rollup_dirty(changed)
+
+    assert refresh_dirty_rollups(db_session) == 2
+
+    assert fake_redis.hgetall(ROLLUP_DIRTY_KEY) == {str(changed): "2"}
+
+
+def test_refresh_dirty_rollups_empty_set(fake_redis):
+    db_session = MagicMock()
+
+    assert refresh_dirty_rollups(db_session) == 0
+
+    db_session.execute.assert_not_called()
+
+
+def _locks(stmt) -> list:
+    return [column.name for column in stmt.selected_columns]
+
+
+def test_refresh_project_rollup_locks_before_writing():
+    db_session = MagicMock()
+
+    refresh_project_rollup(db_session, uuid4())
+
+    lock = db_session.execute.call_args_list[0].args[0]
+    assert _locks(lock) == ["pg_advisory_xact_lock_shared", "pg_advisory_xact_lock"]
+
+
+def test_rebuild_all_rollups_locks_the_table_exclusively():
+    db_session = MagicMock()
+
+    rebuild_all_rollups(db_session)
+
+    lock = db_session.execute.call_args_list[0].args[0]
+    assert _locks(lock) == ["pg_advisory_xact_lock"]
+    db_session.commit.assert_called_once()
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.task import Task
+from app.repositories import overdue_index
+from app.repositories.overdue_index import get_overdue_task_ids, overdue_index_key
+
+
+def persisted_task(status="todo", due_date=None, project_id=None):
+    task = Task()
+    set_committed_value(task, "id", uuid4())
+    set_committed_value(task, "project_id", project_id or uuid4())
+    set_committed_value(task, "status", status)
+    set_committed_value(task, "due_date", due_date)
+    return task
+
+
+@pytest.fixture
+def redis_mock():
+    with patch.object(overdue_index, "redis_client") as client:
+        yield client
+
+
+@pytest.fixture
+def session():
+    session = MagicMock()
+    session.info = {}
+    with patch.object(overdue_index, "object_session", return_value=session):
+        yield session
+
+
+def test_overdue_ids_are_a_range_query(redis_mock):
+    project_id = uuid4()
+    now = datetime(2026, 1, 10)
+    pipe = redis_mock.pipeline.return_value
+    pipe.execute.return_value = [float("inf"), ["a", "b"]]
+    db_session = MagicMock()
+
+    assert get_overdue_task_ids(db_session, project_id, now) == ["a", "b"]
+    key, low, high = pipe.zrangebyscore.call_args.args
+    assert key == overdue_index_key(project_id)
+    assert (low, high) == ("-inf", f"({overdue_index._score(now)}")
+    db_session.execute.assert_not_called()
+
+
+def test_missing_index_is_rebuilt_from_primary(redis_mock):
+    now = datetime(2026, 1, 10)
+    late, later, future = uuid4(), uuid4(), uuid4()
+    pipe = redis_mock.pipeline.return_value
+    pipe.execute.return_value = [None, []]
+    replica, primary = MagicMock(), MagicMock()
+    primary.execute.return_value.all.return_value = [
+        (later, now - timedelta(days=1)),
+        (future, now + timedelta(days=1)),
+        (late, now - timedelta(days=5)),
+    ]
+
+    with patch.object(overdue_index, "SessionLocal", return_value=primary):
+        assert get_overdue_task_ids(replica, uuid4(), now) == [str(late), str(later)]
+    replica.execute.assert_not_called()
+    primary.close.assert_called_once()
+    mapping = pipe.zadd.call_args.args[1]
+    assert set(mapping) == {str(late), str(later), str(future), overdue_index._BUILT_MARKER}
+    # Entries written by commits during the rebuild are neither deleted nor overwritten
+    assert pipe.zadd.call_args.kwargs == {"nx": True}
+    pipe.delete.assert_not_called()
+    pipe.expire.assert_called_once()
+
+
+def test_redis_down_falls_back_to_database(redis_mock):
+    now = datetime(2026, 1, 10)
+    task_id = uuid4()
+    redis_mock.pipeline.return_value.execute.side_effect = redis.RedisError()
+    db_session = MagicMock()
+    db_session.execute.return_value.all.return_value = [(task_id, now - timedelta(days=1))]
+
+    assert get_overdue_task_ids(db_session, uuid4(), now) == [str(task_id)]
+
+
+def test_open_task_is_indexed_on_commit(redis_mock, session):
+    task = persisted_task(due_date=datetime(2026, 1, 1))
+
+    overdue_index._index_inserted_task(None, MagicMock(), task)
+    redis_mock.pipeline.assert_not_called()
+    overdue_index._flush_index_changes(session)
+
+    redis_mock.pipeline.return_value.zadd.assert_called_once_with(
+        overdue_index_key(task.project_id), {str(task.id): overdue_index._score(task.due_date)}
+    )
+
+
+def test_task_without_due_date_is_not_indexed(session):
+    overdue_index._index_inserted_task(None, MagicMock(), persisted_task())
+
+    assert "overdue_index_changes" not in session.info
+
+
+def test_completed_task_is_removed(redis_mock, session):
+    task = persisted_task(due_date=datetime(2026, 1, 1))
+    task.status = "done"
+
+    overdue_index._reindex_updated_task(None, MagicMock(), task)
+    overdue_index._flush_index_changes(session)
+
+    redis_mock.pipeline.return_value.zrem.assert_called_once_with(
+        overdue_index_key(task.project_id), str(task.id)
+    )
+
+
+def test_unrelated_update_is_ignored(session):
+    task = persisted_task(due_date=datetime(2026, 1, 1))
+    task.title = "Renamed"
+
+    overdue_index._reindex_updated_task(None, MagicMock(), task)
+
+    assert "overdue_index_changes" not in session.info
+
+
+def test_rollback_discards_changes(redis_mock, session):
+    overdue_index._unindex_deleted_task(None, MagicMock(), persisted_task())
+
+    overdue_index._discard_index_changes(session)
+    overdue_index._flush_index_changes(session)
+
+    redis_mock.pipeline.assert_not_called()
@@ -0,0 +1,79 @@
+import pytest
+from uuid import uuid4
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
+from app.repositories import project_task_stats as stats_repo
+from app.repositories.project_task_stats import get_project_task_stats
+
+
+def persisted_task(project_id=None, status="todo", priority="medium"):
+    task = Task()
+    set_committed_value(task, "project_id", project_id or uuid4())
+    set_committed_value(task, "status", status)
+    set_committed_value(task, "priority", priority)
+    return task
+
+
+@pytest.fixture
+def apply_delta():
+    with patch.object(stats_repo, "_lock_shared"):
+        with patch.object(stats_repo, "_apply_delta") as delta_mock:
+            yield delta_mock
+
+
+def test_get_project_task_stats():
+    db_session = MagicMock()
+    db_session.execute.return_value.all.return_value = [
+        (TaskStatusEnum.TODO, TaskPriorityEnum.HIGH, 2),
+        (TaskStatusEnum.TODO, TaskPriorityEnum.LOW, 1),
+        (TaskStatusEnum.DONE, TaskPriorityEnum.HIGH, 4),
+    ]
+
+    result = get_project_task_stats(db_session, uuid4())
+
+    assert result["status"] == {"todo": 3, "in-progress": 0, "done": 4}
+    assert result["priority"] == {"low": 1, "medium": 0, "high": 6}
+    assert result["total"] == 7
+    db_session.execute.assert_called_once()
+
+
+def test_insert_increments_counter(apply_delta):
+    task = persisted_task()
+
+    stats_repo._count_inserted_task(None, MagicMock(), task)
+
+    apply_delta.assert_called_once()
+    assert apply_delta.call_args.args[1:] == (task.project_id, "todo", "medium", 1)
+
+
+def test_delete_decrements_counter(apply_delta):
+    task = persisted_task(status="done")
+
+    stats_repo._count_deleted_task(None, MagicMock(), task)
+
+    assert apply_delta.call_args.args[1:] == (task.project_id, "done", "medium", -1)
+
+
+def test_status_change_moves_count(apply_delta):
+    task = persisted_task(status="todo")
+    task.status = "in-progress"
+
+    stats_repo._count_updated_task(None, MagicMock(), task)
+
+    moves = [call.args[1:] for call in apply_delta.call_args_list]
+    assert moves == [
+        (task.project_id, "todo", "medium", -1),
+        (task.project_id, "in-progress", "medium", 1),
+    ]
+
+
+def test_update_without_counted_change_is_ignored(apply_delta):
+    task = persisted_task()
+    task.title = "Renamed"
+
+    stats_repo._count_updated_task(None, MagicMock(), task)
+
+    apply_delta.assert_not_called()
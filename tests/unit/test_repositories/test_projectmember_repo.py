@@ -14,8 +14,19 @@ from app.models.project_member import project_members
 from app.models.user import User
 from app.models.project import Project
 
+@pytest.fixture(autouse=True)
+def mock_redis():
+    with patch("app.repositories.project_member.redis_client") as mock:
+        mock.smismember.return_value = [0, 0]
+        mock.get.return_value = None
+        with patch("app.repositories.project_member._warm_members") as warm_mock:
+            with patch("app.repositories.project_member._change_member") as change_mock:
+                mock.warm_members = warm_mock
+                mock.change_member = change_mock
+                yield mock
+
 class TestProjectMemberRepository:
-    def test_add_project_member(self):
+    def test_add_project_member(self, mock_redis):
         project_id = uuid4()
         user_id = uuid4()
 
@@ -35,6 +46,8 @@ class TestProjectMemberRepository:
         assert mock_user in mock_project.users
         db_session.commit.assert_called_once()
         db_session.refresh.assert_called_once_with(mock_user)
+        mock_redis.change_member.assert_called_once()
+        assert mock_redis.change_member.call_args.kwargs["args"][:2] == ["add", str(user_id)]
 
     def test_remove_project_member(self):
         project_id = uuid4()
@@ -82,29 +95,38 @@ class TestProjectMemberRepository:
         assert isinstance(result, list)
         assert len(result) == 0
 
-    def test_is_project_member(self, db_session):
+    def test_is_project_member(self, mock_redis):
         project_id = uuid4()
         user_id = uuid4()
+        db_session = MagicMock()
+        mock_redis.smismember.return_value = [1, 1]
 
-        mock_pm = MagicMock()
+        result = is_project_member(db_session, project_id, user_id)
 
-        query_mock = MagicMock()
-        filter_mock = MagicMock()
-        db_session.query = MagicMock(return_value=query_mock)
-        query_mock.filter.return_value = filter_mock
-        filter_mock.first.return_value = mock_pm
+        assert result is True
+        db_session.query.assert_not_called()
 
-        result = is_project_member(db_session, project_id, user_id)
+    def test_is_project_member_cached_not_member(self, mock_redis):
+        db_session = MagicMock()
+        mock_redis.smismember.return_value = [0, 1]
+
+        result = is_project_member(db_session, uuid4(), uuid4())
 
         assert result is False
+        db_session.query.assert_not_called()
 
-    def test_is_project_member_not_member(self, db_session):
+    def test_is_project_member_not_member(self, mock_redis):
         project_id = uuid4()
         user_id = uuid4()
-        
-        with patch.object(db_session, "query") as mock_query:
-            mock_query.return_value.filter.return_value.first.return_value = None
-            
-            result = is_project_member(db_session, project_id, user_id)
-        
+        other_member_id = uuid4()
+        db_session = MagicMock()
+        db_session.query.return_value.scalar.return_value = False
+        db_session.query.return_value.filter.return_value.all.return_value = [(other_member_id,)]
+
+        result = is_project_member(db_session, project_id, user_id)
+
         assert result is False
+        mock_redis.warm_members.assert_called_once()
+        warm_args = mock_redis.warm_members.call_args.kwargs["args"]
+        assert str(other_member_id) in warm_args
+        assert str(user_id) not in warm_args
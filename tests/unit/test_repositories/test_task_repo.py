@@ -15,7 +15,8 @@ from app.repositories.task import (
     get_tasks_by_assignee,
     get_tasks_by_creator,
     check_user_access_to_task,
-    invalidate_task_cache
+    invalidate_task_cache,
+    stream_project_task_rows
 )
 from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
 
@@ -108,7 +109,7 @@ class TestTaskRepository:
         assert result is not None
         assert result.id == task_id
         assert result.title == new_title
-        mock_redis.delete.assert_called()
+        mock_redis.pipeline.return_value.incr.assert_any_call(f"tasks:project:{project_id}:gen")
 
     def test_delete_task(self, db_session, mock_redis):
         task_id = uuid4()
@@ -220,5 +221,31 @@ class TestTaskRepository:
         
         invalidate_task_cache(project_id=project_id, task_id=task_id)
         
-        mock_redis.scan.assert_called()
-        mock_redis.delete.assert_called()
+        pipe = mock_redis.pipeline.return_value
+        pipe.incr.assert_any_call(f"tasks:project:{project_id}:gen")
+        pipe.incr.assert_any_call("tasks:all:gen")
+        pipe.execute.assert_called_once()
+        mock_redis.scan.assert_not_called()
+        mock_redis.delete.assert_not_called()
+
+    def test_cache_key_uses_project_generation(self, db_session, mock_redis):
+        project_id = uuid4()
+        mock_redis.get.side_effect = lambda key: "7" if key == f"tasks:project:{project_id}:gen" else None
+
+        get_tasks_with_cache(db_session, project_id=project_id, skip=0, limit=10)
+
+        cache_key = mock_redis.setex.call_args.args[0]
+        assert cache_key == f"tasks:project:{project_id}:gen:7:skip:0:limit:10"
+
+
+def test_stream_project_task_rows_uses_server_side_cursor():
+    db_session = MagicMock()
+    rows = [("row-1",), ("row-2",)]
+    db_session.execute.return_value = iter(rows)
+
+    assert list(stream_project_task_rows(db_session, uuid4(), batch_size=50)) == rows
+
+    stmt = db_session.execute.call_args.args[0]
+    assert stmt.get_execution_options()["yield_per"] == 50
+    assert "assignee_name" in stmt.selected_columns.keys()
+    assert "creator_name" in stmt.selected_columns.keys()
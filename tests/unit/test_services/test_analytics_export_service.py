@@ -0,0 +1,132 @@
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+from unittest.mock import MagicMock, patch
+
+from app.core.exceptions import AnalyticsExportUnavailableException
+from app.models.task import TaskStatusEnum, TaskPriorityEnum
+from app.repositories import analytics_export
+from app.repositories.analytics_export import ANALYTICS_SNAPSHOT_LOCK_KEY, EXPORT_QUERIES, iter_export_batches
+from app.services import analytics_export_service
+from app.services.analytics_export_service import EXPORT_SCHEMAS, export_analytics_snapshot
+
+
+@pytest.fixture
+def fake_redis():
+    """In-memory Redis that runs the Lua scripts"""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    with patch.object(analytics_export, "redis_client", client):
+        yield client
+
+
+def task_row():
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return (
+        uuid4(), uuid4(), "Title", None, TaskStatusEnum.DONE, TaskPriorityEnum.LOW,
+        None, None, uuid4(), created, created
+    )
+
+
+def test_export_schemas_match_queries():
+    for table, query in EXPORT_QUERIES.items():
+        assert list(query(uuid4()).selected_columns.keys()) == [name for name, _ in EXPORT_SCHEMAS[table]]
+
+
+def test_iter_export_batches_uses_server_side_cursor():
+    db_session = MagicMock()
+    db_session.execute.return_value.partitions.return_value = iter([["a", "b"], ["c"]])
+
+    assert list(iter_export_batches(db_session, "comments", uuid4(), batch_size=2)) == [["a", "b"], ["c"]]
+    stmt = db_session.execute.call_args.args[0]
+    assert stmt.get_execution_options()["yield_per"] == 2
+
+
+def test_to_columns_converts_ids_and_enums():
+    row = task_row()
+
+    columns = analytics_export_service._to_columns("tasks", [row])
+
+    assert columns["id"] == [str(row[0])]
+    assert columns["status"] == ["done"]
+    assert columns["priority"] == ["low"]
+    assert columns["assignee_id"] == [None]
+    assert columns["created_at"] == [row[9]]
+
+
+def test_export_without_pyarrow_is_reported():
+    with patch.dict("sys.modules", {"pyarrow": None, "pyarrow.parquet": None}):
+        with pytest.raises(AnalyticsExportUnavailableException):
+            export_analytics_snapshot(MagicMock(), "/tmp/unused")
+
+
+def test_export_writes_parquet_partitioned_by_organization(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    organization_id = uuid4()
+    rows = [task_row() for _ in range(3)]
+
+    def batches(db, table, org_id, batch_size):
+        if table == "tasks":
+            yield rows[:2]
+            yield rows[2:]
+
+    with patch.object(analytics_export_service, "iter_export_batches", side_effect=batches):
+        written = export_analytics_snapshot(MagicMock(), str(tmp_path), [organization_id])
+
+    assert written == {"tasks": 3, "comments": 0, "attachments": 0, "project_members": 0}
+    path = tmp_path / "tasks" / f"organization_id={organization_id}" / "part-0.parquet"
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_rows == 3
+    assert parquet_file.metadata.num_row_groups == 2
+    assert not (tmp_path / "comments").exists()
+
+
+def test_snapshot_runs_outside_the_request_pools(fake_redis):
+    from sqlalchemy.pool import NullPool
+    from app.database import engine, export_engine
+
+    assert isinstance(export_engine.pool, NullPool)
+    assert export_engine is not engine
+
+    export_db = MagicMock()
+
+    def export(db, *args):
+        # Held for the whole export
+        assert fake_redis.exists(ANALYTICS_SNAPSHOT_LOCK_KEY)
+        return {"tasks": 0}
+
+    with patch.object(analytics_export_service, "ExportSessionLocal", return_value=export_db):
+        with patch.object(analytics_export_service, "export_analytics_snapshot", side_effect=export) as export:
+            assert analytics_export_service.run_analytics_snapshot("/tmp/unused") == {"tasks": 0}
+
+    assert export.call_args.args[0] is export_db
+    export_db.close.assert_called_once()
+    assert not fake_redis.exists(ANALYTICS_SNAPSHOT_LOCK_KEY)
+
+
+def test_snapshot_request_is_queued_once_per_organization(fake_redis):
+    organization_id, other_id = uuid4(), uuid4()
+
+    with patch.object(analytics_export_service, "_load_pyarrow"):
+        first = analytics_export_service.start_analytics_snapshot(organization_id)
+        again = analytics_export_service.start_analytics_snapshot(organization_id)
+        analytics_export_service.start_analytics_snapshot(other_id)
+
+    assert again.snapshot_dir == first.snapshot_dir
+    assert fake_redis.llen(analytics_export.ANALYTICS_SNAPSHOT_QUEUE_KEY) == 2
+
+
+def test_worker_runs_queued_snapshot_for_its_organization(fake_redis):
+    organization_id = uuid4()
+    with patch.object(analytics_export_service, "_load_pyarrow"):
+        queued = analytics_export_service.start_analytics_snapshot(organization_id)
+
+    with patch.object(analytics_export_service, "run_analytics_snapshot") as run:
+        assert analytics_export_service.process_snapshot_jobs(timeout=1) == queued.snapshot_dir
+
+    run.assert_called_once_with(queued.snapshot_dir, [organization_id])
+    # Picked up, so the next request queues a new snapshot
+    with patch.object(analytics_export_service, "_load_pyarrow"):
+        analytics_export_service.start_analytics_snapshot(organization_id)
+    assert fake_redis.llen(analytics_export.ANALYTICS_SNAPSHOT_QUEUE_KEY) == 1
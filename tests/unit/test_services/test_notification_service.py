@@ -42,6 +42,9 @@ def mock_redis():
             mock_client.exists.return_value = True
             mock_client.keys.return_value = []
             mock_client.lrange.return_value = []
+            mock_client.zcount.return_value = 0
+            mock_client.eval.return_value = [1, str(uuid4()), 1]
+            mock_client.pipeline.return_value.execute.return_value = [0, 0]
             yield mock_client
 
 
@@ -179,3 +182,39 @@ def test_get_unread_count():
         result = get_unread_count(user_id)
 
     assert result == expected_count
+
+
+@pytest.mark.parametrize("ids, type_, repo_function", [
+    (["a", "b"], None, "repo_mark_many_as_read"),
+    ([], None, "repo_mark_many_as_read"),
+    (None, "task_assigned", "repo_mark_type_as_read"),
+    (None, None, "repo_mark_all_as_read"),
+])
+def test_mark_notifications_as_read_dispatch(ids, type_, repo_function):
+    user_id = uuid4()
+
+    with patch.object(notification_service, repo_function, return_value=2) as repo_mock:
+        result = notification_service.mark_notifications_as_read(user_id, ids, type_)
+
+    assert result == 2
+    repo_mock.assert_called_once()
+    assert repo_mock.call_args.args[0] == str(user_id)
+
+
+def test_enqueue_notification_without_recipient_is_skipped():
+    with patch.object(notification_service, "repo_enqueue_notification") as enqueue_mock:
+        assert notification_service.enqueue_notification(None, "Title", "Message", "task_assigned") is None
+
+    enqueue_mock.assert_not_called()
+
+
+def test_process_notification_queue_retries_stale_entries_first():
+    stale = [("1-0", {"id": "n1"})]
+
+    with patch.object(notification_service, "repo_claim_stale_notification_events", return_value=stale):
+        with patch.object(notification_service, "repo_read_notification_events") as read_mock:
+            with patch.object(notification_service, "repo_write_notification_events", return_value=1) as write_mock:
+                assert notification_service.process_notification_queue("worker-1") == 1
+
+    read_mock.assert_not_called()
+    write_mock.assert_called_once_with(stale)
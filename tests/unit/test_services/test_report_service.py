@@ -1,10 +1,12 @@
 import pytest
 from uuid import uuid4
 import json
+import time
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 
-from app.schemas.response.report_response import TaskCountByStatusResponse, OverdueTasksResponse
+from app.models.task import TaskStatusEnum, TaskPriorityEnum
+from app.schemas.response.report_response import TaskCountByStatusResponse, OverdueTasksResponse, WorkloadReportResponse
 
 def create_mock_project(project_id=None):
     if not project_id:
@@ -55,9 +57,12 @@ def mock_redis():
     redis_mock = MagicMock()
     redis_mock.get.return_value = None
     redis_mock.set.return_value = True
+    # Built, empty overdue index
+    redis_mock.pipeline.return_value.execute.return_value = [float("inf"), []]
     with patch("app.database.redis_client", redis_mock):
         with patch("app.repositories.report.redis_client", redis_mock):
-            yield redis_mock
+            with patch("app.repositories.overdue_index.redis_client", redis_mock):
+                yield redis_mock
 
 def test_get_project_task_count_by_status(mock_db_session):
     project_id = uuid4()
@@ -112,34 +117,109 @@ def test_get_overdue_tasks_in_project_empty(mock_db_session):
     assert result.overdue_tasks == empty_tasks
     assert result.total_overdue == 0
 
-def test_get_project_task_count_cache(mock_db_session, mock_redis):
+def test_get_project_task_count_reads_counters(mock_db_session, mock_redis):
     project_id = uuid4()
-    status_counts = create_mock_task_status_counts(project_id)
-    cache_key = f"report:project:{project_id}:task_counts"
-    mock_redis.get.return_value = json.dumps(status_counts)
+    stats = {
+        "status": {"todo": 5, "in-progress": 3, "done": 0},
+        "priority": {"low": 0, "medium": 8, "high": 0},
+        "total": 8
+    }
     from app.services.report_service import get_project_task_count_by_status
-    repo_mock = MagicMock(return_value=None)
-    with patch('app.repositories.report.get_project_task_count_by_status', repo_mock):
+    with patch('app.repositories.report.get_project_task_stats', return_value=stats) as stats_mock:
         result = get_project_task_count_by_status(mock_db_session, project_id)
-    mock_redis.get.assert_called_once()
-    actual_key = mock_redis.get.call_args[0][0]
-    assert actual_key.startswith(f"report:project:{project_id}")
-    repo_mock.assert_not_called()
+    stats_mock.assert_called_once_with(mock_db_session, project_id)
+    mock_redis.hgetall.assert_not_called()
+    mock_db_session.query.assert_not_called()
     assert isinstance(result, TaskCountByStatusResponse)
-    assert result.status_counts == status_counts
+    assert result.status_counts == {"todo": 5, "in-progress": 3, "in_progress": 0, "done": 0}
 
-def test_get_overdue_tasks_cache(mock_db_session, mock_redis):
+def test_get_overdue_tasks_reads_index(mock_db_session, mock_redis):
     project_id = uuid4()
-    overdue_tasks = create_mock_overdue_tasks(project_id)
-    cache_key = f"report:project:{project_id}:overdue_tasks"
-    mock_redis.get.return_value = json.dumps(overdue_tasks)
+    task = MagicMock(
+        id=uuid4(), title="Late", description=None, status="todo", priority="high",
+        due_date=datetime.utcnow() - timedelta(days=3, hours=1), assignee_id=None
+    )
+    mock_redis.pipeline.return_value.execute.return_value = [float("inf"), [str(task.id)]]
+    mock_db_session.query.return_value.filter.return_value.order_by.return_value.all.return_value = [task]
     from app.services.report_service import get_overdue_tasks_in_project
-    repo_mock = MagicMock(return_value=None)
-    with patch('app.repositories.report.get_overdue_tasks_in_project', repo_mock):
-        result = get_overdue_tasks_in_project(mock_db_session, project_id)
-    mock_redis.get.assert_called_once()
-    actual_key = mock_redis.get.call_args[0][0]
-    assert actual_key.startswith(f"report:project:{project_id}")
-    repo_mock.assert_not_called()
+    result = get_overdue_tasks_in_project(mock_db_session, project_id)
+    pipe = mock_redis.pipeline.return_value
+    assert pipe.zrangebyscore.call_args.args[0] == f"tasks:project:{project_id}:open_due"
+    mock_redis.hgetall.assert_not_called()
+    mock_db_session.execute.assert_not_called()
     assert isinstance(result, OverdueTasksResponse)
-    assert result.overdue_tasks == overdue_tasks
+    assert result.total_overdue == 1
+    assert result.overdue_tasks[0]["id"] == str(task.id)
+    assert result.overdue_tasks[0]["days_overdue"] == 3
+
+def test_get_project_workload_single_grouping_sets_query(mock_db_session, mock_redis):
+    project_id = uuid4()
+    alice = uuid4()
+    mock_redis.hgetall.return_value = {}
+    mock_db_session.execute.return_value.all.return_value = [
+        (0b011, TaskStatusEnum.TODO, None, None, 3),
+        (0b011, TaskStatusEnum.DONE, None, None, 1),
+        (0b101, None, TaskPriorityEnum.HIGH, None, 4),
+        (0b110, None, None, alice, 2),
+        (0b110, None, None, None, 2),
+        (0b010, TaskStatusEnum.TODO, None, alice, 1),
+        (0b010, TaskStatusEnum.DONE, None, alice, 1),
+        (0b010, TaskStatusEnum.TODO, None, None, 2),
+    ]
+    from app.services.report_service import get_project_workload
+    result = get_project_workload(mock_db_session, project_id)
+    mock_db_session.execute.assert_called_once()
+    assert isinstance(result, WorkloadReportResponse)
+    assert result.total_tasks == 4
+    assert result.by_status == {"todo": 3, "in-progress": 0, "done": 1}
+    assert result.by_priority == {"low": 0, "medium": 0, "high": 4}
+    assert result.by_assignee == {str(alice): 2, "unassigned": 2}
+    assert result.by_status_and_assignee == {
+        str(alice): {"todo": 1, "in-progress": 0, "done": 1},
+        "unassigned": {"todo": 2, "in-progress": 0, "done": 0}
+    }
+    pipe = mock_redis.pipeline.return_value
+    assert pipe.hset.call_args.args[0] == f"report:project:{project_id}:workload"
+
+def test_get_project_workload_cache(mock_db_session, mock_redis):
+    project_id = uuid4()
+    workload = {
+        "project_id": str(project_id),
+        "total_tasks": 0,
+        "by_status": {},
+        "by_priority": {},
+        "by_assignee": {},
+        "by_status_and_assignee": {}
+    }
+    mock_redis.hgetall.return_value = {"data": json.dumps(workload), "_stale_at": "9999999999"}
+    from app.services.report_service import get_project_workload
+    result = get_project_workload(mock_db_session, project_id)
+    mock_db_session.execute.assert_not_called()
+    assert result.project_id == str(project_id)
+
+def test_invalidate_schedules_debounced_warmup(mock_redis):
+    from app.repositories.report import invalidate_project_report_cache, REPORT_WARM_QUEUE_KEY
+    project_id = uuid4()
+    before = time.time()
+    invalidate_project_report_cache(project_id)
+    mock_redis.delete.assert_any_call(f"report:project:{project_id}:workload")
+    key, mapping = mock_redis.zadd.call_args.args
+    assert key == REPORT_WARM_QUEUE_KEY
+    assert mapping[str(project_id)] >= before + 5
+
+def test_claim_due_warmups_skips_projects_claimed_elsewhere(mock_redis):
+    from app.repositories.report import claim_due_warmups
+    mock_redis.zrangebyscore.return_value = ["p1", "p2", "p3"]
+    mock_redis.pipeline.return_value.execute.return_value = [1, 0, 1]
+    assert claim_due_warmups(10) == ["p1", "p3"]
+    assert mock_redis.zrangebyscore.call_args.kwargs == {"start": 0, "num": 10}
+
+def test_warm_project_reports_recomputes_missing_workload(mock_db_session, mock_redis):
+    from app.repositories.report import warm_project_reports
+    project_id = uuid4()
+    mock_redis.hgetall.return_value = {}
+    mock_db_session.execute.return_value.all.return_value = []
+    warm_project_reports(mock_db_session, project_id)
+    mock_db_session.execute.assert_called_once()
+    pipe = mock_redis.pipeline.return_value
+    assert pipe.hset.call_args.args[0] == f"report:project:{project_id}:workload"
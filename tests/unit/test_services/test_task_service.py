@@ -1,12 +1,15 @@
 import pytest
 from uuid import uuid4, UUID
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch, ANY
+from unittest.mock import MagicMock, AsyncMock, patch, ANY
 import json
 
 from app.services.task_service import (
     create_task, get_task_details, update_task, delete_task,
-    get_project_tasks, assign_task_to_user
+    get_project_tasks, assign_task_to_user,
+    get_project_tasks_async, get_task_details_async,
+    get_project_tasks_page_async, get_tasks_by_creator_page,
+    get_project_tasks_payload_async, export_project_tasks, stream_project_tasks_export
 )
 from app.core.exceptions import (
     TaskNotFoundException, TaskAccessDeniedException,
@@ -15,7 +18,8 @@ from app.core.exceptions import (
 )
 from app.models.task import Task, TaskStatusEnum, TaskPriorityEnum
 from app.schemas.request.task_request import TaskCreateRequest, TaskUpdateRequest
-from app.schemas.response.task_response import TaskResponse, TaskListResponse
+from app.schemas.response.task_response import TaskResponse, TaskListResponse, TaskListPageResponse
+from app.core.pagination import decode_cursor
 
 @pytest.fixture(autouse=True)
 def mock_redis():
@@ -339,3 +343,130 @@ def test_assign_task_to_user_success(mock_redis):
     assert result.id == task_id
     assert result.assignee_id == new_assignee_id
     assert mock_redis.delete.called
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_async():
+    db_session = AsyncMock()
+    project_id = uuid4()
+    user_id = uuid4()
+    mock_tasks = [create_mock_task_model(project_id, user_id, user_id) for _ in range(2)]
+    with patch("app.repositories.task.get_tasks_with_cache_async", AsyncMock(return_value=mock_tasks)) as repo_mock:
+        result = await get_project_tasks_async(db_session, project_id, user_id, status="todo")
+    repo_mock.assert_awaited_once()
+    assert len(result) == 2
+    assert all(isinstance(item, TaskListResponse) for item in result)
+    assert result[0].creator_name == "Creator User"
+    assert result[0].assignee_name == "Assignee User"
+
+@pytest.mark.asyncio
+async def test_get_task_details_async_not_found():
+    db_session = AsyncMock()
+    with patch("app.repositories.task.get_task_by_id_async", AsyncMock(return_value=None)):
+        with pytest.raises(TaskNotFoundException):
+            await get_task_details_async(db_session, uuid4(), uuid4())
+
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_page_async_returns_next_cursor():
+    db_session = AsyncMock()
+    project_id = uuid4()
+    mock_tasks = [create_mock_task_model(project_id) for _ in range(3)]
+    with patch("app.repositories.task.get_tasks_with_cache_async", AsyncMock(return_value=mock_tasks)) as repo_mock:
+        result = await get_project_tasks_page_async(db_session, project_id, uuid4(), limit=2)
+    assert repo_mock.await_args.kwargs["limit"] == 3
+    assert repo_mock.await_args.kwargs["keyset"] is True
+    assert isinstance(result, TaskListPageResponse)
+    assert len(result.items) == 2
+    assert decode_cursor(result.next_cursor) == (mock_tasks[1].created_at, mock_tasks[1].id)
+
+def test_get_tasks_by_creator_page_last_page():
+    db_session = MagicMock()
+    creator_id = uuid4()
+    mock_tasks = [create_mock_task_model(creator_id=creator_id)]
+    with patch("app.repositories.task.get_tasks_by_creator", return_value=mock_tasks):
+        result = get_tasks_by_creator_page(db_session, creator_id, limit=2, cursor=None)
+    assert len(result.items) == 1
+    assert result.next_cursor is None
+
+
+def mock_async_redis(entry=None):
+    redis_mock = MagicMock()
+    redis_mock.hgetall = AsyncMock(return_value=entry or {})
+    redis_mock.set = AsyncMock(return_value=True)
+    redis_mock.eval = AsyncMock(return_value=1)
+    redis_mock.pipeline.return_value.execute = AsyncMock(return_value=[])
+    return redis_mock
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_payload_async_cache_hit():
+    db_session = AsyncMock()
+    redis_mock = mock_async_redis({"count": "1", "payload": "[{}]", "_stale_at": str(datetime.now().timestamp() + 60)})
+    with patch("app.repositories.task.get_tasks_generation_async", AsyncMock(return_value="3")):
+        with patch("app.repositories.task.async_redis_client", redis_mock):
+            with patch("app.repositories.task.get_tasks_with_cache_async") as repo_mock:
+                result = await get_project_tasks_payload_async(db_session, uuid4(), uuid4())
+    assert result == (1, "[{}]")
+    assert ":gen:3:" in redis_mock.hgetall.await_args.args[0]
+    repo_mock.assert_not_called()
+    db_session.execute.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_project_tasks_payload_async_cache_miss():
+    db_session = AsyncMock()
+    project_id = uuid4()
+    mock_tasks = [create_mock_task_model(project_id) for _ in range(2)]
+    redis_mock = mock_async_redis()
+    with patch("app.repositories.task.get_tasks_generation_async", AsyncMock(return_value="0")):
+        with patch("app.repositories.task.async_redis_client", redis_mock):
+            with patch("app.repositories.task.get_tasks_with_cache_async", AsyncMock(return_value=mock_tasks)) as repo_mock:
+                count, payload = await get_project_tasks_payload_async(db_session, project_id, uuid4())
+    assert count == 2
+    # The payload is the only cache entry written for the listing
+    assert repo_mock.await_args.kwargs["cache_ids"] is False
+    redis_mock.setex.assert_not_called()
+    assert [item["id"] for item in json.loads(payload)] == [str(task.id) for task in mock_tasks]
+    stored = redis_mock.pipeline.return_value.hset.call_args.kwargs["mapping"]
+    assert stored["count"] == "2"
+    assert stored["payload"] == payload
+def export_row(title, assignee_name=None):
+    created = datetime(2026, 1, 1, 12, 0)
+    return (
+        uuid4(), title, None, TaskStatusEnum.TODO, TaskPriorityEnum.HIGH, None,
+        uuid4() if assignee_name else None, assignee_name, uuid4(), "Creator", created, created
+    )
+
+def test_export_project_tasks_ndjson():
+    rows = [export_row("First", "Alice"), export_row("Second")]
+    with patch("app.repositories.task.stream_project_task_rows", return_value=iter(rows)) as stream_mock:
+        chunks = list(export_project_tasks(MagicMock(), uuid4(), "ndjson"))
+    assert stream_mock.call_args.kwargs["batch_size"] > 0
+    lines = "".join(chunks).splitlines()
+    first, second = [json.loads(line) for line in lines]
+    assert first["title"] == "First"
+    assert first["status"] == "todo"
+    assert first["assignee_name"] == "Alice"
+    assert first["created_at"] == "2026-01-01T12:00:00"
+    assert second["assignee_id"] is None
+
+def test_streamed_export_owns_its_session():
+    db_session = MagicMock()
+    open_session = MagicMock(return_value=db_session)
+    with patch("app.repositories.task.stream_project_task_rows", return_value=iter([export_row("First")])):
+        stream = stream_project_tasks_export(open_session, uuid4(), "ndjson")
+        # Opened only once the body is iterated
+        open_session.assert_not_called()
+        chunks = list(stream)
+    assert json.loads(chunks[0])["title"] == "First"
+    open_session.assert_called_once()
+    db_session.close.assert_called_once()
+
+def test_export_project_tasks_csv_is_chunked_by_batch():
+    rows = [export_row(f"Task {i}") for i in range(5)]
+    with patch("app.repositories.task.stream_project_task_rows", return_value=iter(rows)):
+        with patch("app.services.task_service._EXPORT_BATCH_SIZE", 2):
+            chunks = list(export_project_tasks(MagicMock(), uuid4(), "csv"))
+    assert len(chunks) == 3
+    lines = "".join(chunks).splitlines()
+    assert lines[0].startswith("id,title,description,status")
+    assert len(lines) == 6
+    assert ",Task 0,,todo,high,," in lines[1]
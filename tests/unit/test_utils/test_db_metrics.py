@@ -0,0 +1,54 @@
+from uuid import uuid4
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.core.db_metrics import (
+    CheckoutWaitHistogram,
+    instrumented_pool_class,
+    get_checkout_histogram,
+    get_pool_status,
+)
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = CheckoutWaitHistogram()
+    histogram.observe(0.5)
+    histogram.observe(7)
+    histogram.observe(10000)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot["count"] == 3
+    assert snapshot["buckets"]["le_1"] == 1
+    assert snapshot["buckets"]["le_10"] == 2
+    assert snapshot["buckets"]["le_5000"] == 2
+    assert snapshot["buckets"]["le_inf"] == 3
+    assert snapshot["max_ms"] == 10000
+
+
+def test_histogram_records_timeouts():
+    histogram = CheckoutWaitHistogram()
+    histogram.record_timeout()
+    assert histogram.snapshot()["timeouts"] == 1
+
+
+def test_instrumented_pool_reports_checkouts():
+    pool_name = f"test-{uuid4()}"
+    engine = create_engine(
+        "sqlite://",
+        poolclass=instrumented_pool_class(QueuePool, pool_name),
+        pool_size=2,
+        max_overflow=0,
+    )
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        status = get_pool_status(engine, pool_name)
+        assert status["checked_out"] == 1
+        assert status["size"] == 2
+
+    status = get_pool_status(engine, pool_name)
+    assert status["checked_out"] == 0
+    assert status["checkout_wait_ms"]["count"] == 1
+    assert get_checkout_histogram(pool_name).snapshot()["count"] == 1
+    engine.dispose()
@@ -0,0 +1,96 @@
+from uuid import uuid4
+from unittest.mock import MagicMock, patch
+
+from app import database
+from app.core.security import create_access_token
+
+
+def make_request(user_id=None):
+    request = MagicMock()
+    headers = {}
+    if user_id:
+        headers["Authorization"] = f"Bearer {create_access_token({'sub': str(user_id)})}"
+    request.headers = headers
+    return request
+
+
+def open_read_session(request, primary_db=None):
+    generator = database.get_read_db(request, primary_db or MagicMock())
+    session = next(generator)
+    generator.close()
+    return session
+
+
+def test_get_read_db_reuses_the_request_session_without_replicas():
+    primary, request_db = MagicMock(), MagicMock()
+    with patch("app.database.SessionLocal", primary):
+        with patch("app.database.ReplicaSessionLocals", []):
+            session = open_read_session(make_request(uuid4()), request_db)
+    assert session is request_db
+    primary.assert_not_called()
+    request_db.close.assert_not_called()
+
+
+def test_get_read_db_uses_replica_when_user_has_no_recent_write():
+    primary, replica = MagicMock(), MagicMock()
+    with patch("app.database.SessionLocal", primary):
+        with patch("app.database.ReplicaSessionLocals", [replica]):
+            with patch("app.database.has_recent_write", return_value=False):
+                session = open_read_session(make_request(uuid4()))
+    assert session is replica.return_value
+    primary.assert_not_called()
+
+
+def test_get_read_db_sticks_to_primary_after_write():
+    primary, replica, request_db = MagicMock(), MagicMock(), MagicMock()
+    with patch("app.database.SessionLocal", primary):
+        with patch("app.database.ReplicaSessionLocals", [replica]):
+            with patch("app.database.has_recent_write", return_value=True):
+                session = open_read_session(make_request(uuid4()), request_db)
+    assert session is request_db
+    primary.assert_not_called()
+    replica.assert_not_called()
+
+
+def test_read_route_dependencies_share_the_read_session():
+    from fastapi.dependencies.utils import get_dependant
+    from app.dependencies.auth import get_current_user_read
+    from app.dependencies.task import require_task_access_read
+
+    def sessions(call):
+        dependant = get_dependant(path="/", call=call)
+        return {dep.call for dep in dependant.dependencies if dep.call in (database.get_db, database.get_read_db)}
+
+    assert sessions(get_current_user_read) == {database.get_read_db}
+    assert sessions(require_task_access_read) == {database.get_read_db}
+
+
+def test_commit_with_writes_marks_user_sticky():
+    user_id = str(uuid4())
+    session = MagicMock()
+    session.info = {"user_id": user_id}
+    with patch("app.database.mark_recent_write") as mark_mock:
+        database._track_session_writes(session, None)
+        database._stick_writer_to_primary(session)
+    mark_mock.assert_called_once_with(user_id)
+
+
+def test_commit_without_writes_does_not_mark_user():
+    session = MagicMock()
+    session.info = {"user_id": str(uuid4())}
+    with patch("app.database.mark_recent_write") as mark_mock:
+        database._stick_writer_to_primary(session)
+    mark_mock.assert_not_called()
+
+
+def test_report_routes_check_access_on_the_read_session():
+    from app.dependencies.organization import require_organization_manager_read
+    from app.dependencies.project import require_project_management_permission_read
+    from app.routers import reports
+
+    dependencies = {
+        route.name: {dep.call for dep in route.dependant.dependencies} for route in reports.reports_router.routes
+    }
+
+    assert require_project_management_permission_read in dependencies["get_overdue_tasks"]
+    assert require_organization_manager_read in dependencies["get_organization_task_summary"]
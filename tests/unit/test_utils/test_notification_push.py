@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.notification_push import NotificationHub
+from app.schemas.redis.notification_redis import NotificationRedis
+
+USER_ID = "6f1c1c3e-2a9b-4a61-9d0e-7f4b8c2d1e00"
+
+
+def make_hub():
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock()
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.close = AsyncMock()
+    pubsub.get_message = AsyncMock(return_value=None)
+    client = MagicMock()
+    client.pubsub.return_value = pubsub
+    return NotificationHub(client), pubsub
+
+
+@pytest.mark.asyncio
+async def test_one_channel_subscription_per_user():
+    hub, pubsub = make_hub()
+
+    first = await hub.subscribe(USER_ID)
+    second = await hub.subscribe(USER_ID)
+    await hub.unsubscribe(USER_ID, first)
+    pubsub.unsubscribe.assert_not_called()
+    await hub.unsubscribe(USER_ID, second)
+
+    channel = NotificationRedis.create_user_channel(USER_ID)
+    pubsub.subscribe.assert_awaited_once_with(channel)
+    pubsub.unsubscribe.assert_awaited_once_with(channel)
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_published_notification_reaches_every_stream_of_the_user():
+    hub, pubsub = make_hub()
+    channel = NotificationRedis.create_user_channel(USER_ID)
+    pubsub.get_message.side_effect = [{"type": "message", "channel": channel, "data": "{}"}] + [None] * 100
+
+    first = await hub.subscribe(USER_ID)
+    second = await hub.subscribe(USER_ID)
+
+    assert await asyncio.wait_for(first.get(), 1) == "{}"
+    assert await asyncio.wait_for(second.get(), 1) == "{}"
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_push():
+    hub, _ = make_hub()
+    with patch("app.core.notification_push.settings.notification_stream_queue_size", 1):
+        queue = await hub.subscribe(USER_ID)
+
+    hub.dispatch(NotificationRedis.create_user_channel(USER_ID), "first")
+    hub.dispatch(NotificationRedis.create_user_channel(USER_ID), "second")
+
+    assert queue.qsize() == 1 and queue.get_nowait() == "first"
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_subscribes_before_reading_unread_count():
+    from app.routers import notifications as notifications_router
+
+    calls = []
+    hub = MagicMock()
+    hub.subscribe = AsyncMock(side_effect=lambda user_id: calls.append("subscribe") or asyncio.Queue())
+    hub.unsubscribe = AsyncMock()
+
+    def unread_count(user_id):
+        calls.append("count")
+        return 3
+
+    user = MagicMock(id=USER_ID)
+    with patch.object(notifications_router, "notification_hub", hub):
+        with patch.object(notifications_router, "get_unread_count", side_effect=unread_count):
+            response = await notifications_router.stream_notifications(current_user=user, db=AsyncMock())
+            events = response.body_iterator
+            first = await events.__anext__()
+            await events.aclose()
+
+    assert calls == ["subscribe", "count"]
+    assert first == 'event: unread_count\ndata: {"unread_count": 3}\n\n'
+    hub.unsubscribe.assert_awaited_once()
@@ -0,0 +1,81 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import Column, DateTime, Uuid, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from app.core.exceptions import InvalidCursorException
+from app.core.pagination import (
+    encode_cursor, decode_cursor, keyset_order, keyset_filter, split_page
+)
+from app.repositories.task import _generate_tasks_cache_key
+
+Base = declarative_base()
+
+
+class Row(Base):
+    __tablename__ = "rows"
+    id = Column(Uuid, primary_key=True)
+    created_at = Column(DateTime)
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc)
+    row_id = uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", ""])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor)
+
+
+def test_split_page():
+    rows = [SimpleNamespace(id=uuid4(), created_at=datetime.now(timezone.utc)) for _ in range(3)]
+
+    page, next_cursor = split_page(rows, 2)
+    assert page == rows[:2]
+    assert decode_cursor(next_cursor) == (rows[1].created_at, rows[1].id)
+
+    page, next_cursor = split_page(rows, 3)
+    assert page == rows
+    assert next_cursor is None
+
+
+def test_keyset_pages_are_stable_with_equal_timestamps():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    same_time = datetime(2026, 1, 1)
+    ids = [uuid4() for _ in range(5)]
+    with Session(engine) as db:
+        db.add_all([Row(id=row_id, created_at=same_time) for row_id in ids])
+        db.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            stmt = select(Row).order_by(*keyset_order(Row)).limit(3)
+            if cursor:
+                stmt = stmt.where(keyset_filter(Row, cursor))
+            page, cursor = split_page(db.execute(stmt).scalars().all(), 2)
+            seen.extend(row.id for row in page)
+            if cursor is None:
+                break
+
+    assert seen == sorted(ids, key=lambda row_id: row_id.hex, reverse=True)
+
+
+def test_keyset_cache_key_differs_from_offset_key():
+    project_id = uuid4()
+    offset_key = _generate_tasks_cache_key(project_id, None, None, None, 0, 10)
+    first_page_key = _generate_tasks_cache_key(project_id, None, None, None, 0, 10, True, None)
+    next_page_key = _generate_tasks_cache_key(project_id, None, None, None, 0, 10, True, "abc")
+
+    assert offset_key.endswith("skip:0:limit:10")
+    assert first_page_key.endswith("after:start:limit:10")
+    assert next_page_key.endswith("after:abc:limit:10")
+    assert first_page_key.startswith(f"tasks:project:{project_id}:")
@@ -0,0 +1,97 @@
+import pytest
+from uuid import uuid4
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from app.core import principal_cache
+from app.core.security import create_access_token
+from app.dependencies.auth import get_current_user
+from app.schemas.response.user_response import UserResponse
+
+
+def create_principal(user_id=None):
+    return UserResponse(
+        id=user_id or uuid4(),
+        name="Cached User",
+        email="cached@example.com",
+        role="member",
+        organization_id=uuid4(),
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow()
+    )
+
+
+@pytest.fixture(autouse=True)
+def mock_redis():
+    redis_mock = MagicMock()
+    redis_mock.get.return_value = None
+    with patch("app.core.principal_cache.redis_client", redis_mock):
+        principal_cache._local_cache.clear()
+        yield redis_mock
+        principal_cache._local_cache.clear()
+
+
+def test_get_cached_principal_miss(mock_redis):
+    assert principal_cache.get_cached_principal(uuid4()) is None
+    mock_redis.get.assert_called_once()
+
+
+def test_cache_principal_then_local_hit(mock_redis):
+    principal = create_principal()
+    principal_cache.cache_principal(principal)
+
+    result = principal_cache.get_cached_principal(principal.id)
+
+    assert result == principal
+    mock_redis.setex.assert_called_once()
+    mock_redis.get.assert_not_called()
+
+
+def test_get_cached_principal_from_redis(mock_redis):
+    principal = create_principal()
+    mock_redis.get.return_value = principal.model_dump_json()
+
+    result = principal_cache.get_cached_principal(principal.id)
+    again = principal_cache.get_cached_principal(principal.id)
+
+    assert result.id == principal.id
+    assert again.id == principal.id
+    mock_redis.get.assert_called_once()
+
+
+def test_invalidate_principal(mock_redis):
+    principal = create_principal()
+    principal_cache.cache_principal(principal)
+
+    principal_cache.invalidate_principal(principal.id)
+
+    assert principal_cache._local_cache.get(f"principal:{principal.id}") is None
+    mock_redis.delete.assert_called_once_with(f"principal:{principal.id}")
+
+
+def test_committed_user_update_invalidates_principal():
+    user_id = uuid4()
+    session = MagicMock()
+    session.info = {}
+    target = MagicMock()
+    target.id = user_id
+    with patch("app.core.principal_cache.object_session", return_value=session):
+        with patch("app.core.principal_cache.invalidate_principal") as invalidate_mock:
+            principal_cache._queue_principal_invalidation(None, None, target)
+            invalidate_mock.assert_not_called()
+            principal_cache._invalidate_stale_principals(session)
+    invalidate_mock.assert_called_once_with(str(user_id))
+
+
+def test_get_current_user_uses_cached_principal():
+    principal = create_principal()
+    principal_cache.cache_principal(principal)
+    token = create_access_token({"sub": str(principal.id)})
+    db_session = MagicMock()
+
+    with patch("app.dependencies.auth.get_user_by_id") as service_mock:
+        result = get_current_user(token=token, db=db_session)
+
+    assert result.id == principal.id
+    service_mock.assert_not_called()
+    db_session.query.assert_not_called()
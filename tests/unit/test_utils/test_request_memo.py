@@ -0,0 +1,90 @@
+from uuid import uuid4
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.core.request_memo import bind_request_memo, memo_get, memo_discard
+from app.repositories import task as task_repo
+from app.services import task_service
+
+
+def make_request():
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+def bound_session(request=None):
+    db = MagicMock()
+    db.info = {}
+    bind_request_memo(db, request or make_request())
+    return db
+
+
+def test_memo_get_loads_once_per_request():
+    db = bound_session()
+    loader = MagicMock(return_value="entity")
+
+    assert memo_get(db, ("task", 1), loader) == "entity"
+    assert memo_get(db, ("task", 1), loader) == "entity"
+    loader.assert_called_once()
+
+
+def test_memo_is_shared_by_sessions_of_the_same_request():
+    request = make_request()
+    primary, replica = bound_session(request), bound_session(request)
+    loader = MagicMock(return_value="entity")
+
+    memo_get(primary, ("project", 1), loader)
+    memo_get(replica, ("project", 1), loader)
+
+    loader.assert_called_once()
+    assert primary.info["db_stats"] is replica.info["db_stats"]
+
+
+def test_memo_get_without_request_always_loads():
+    db = MagicMock()
+    db.info = {}
+    loader = MagicMock(return_value="entity")
+
+    memo_get(db, ("task", 1), loader)
+    memo_get(db, ("task", 1), loader)
+
+    assert loader.call_count == 2
+
+
+def test_memo_discard_forces_reload():
+    db = bound_session()
+    loader = MagicMock(return_value="entity")
+
+    memo_get(db, ("task", 1), loader)
+    memo_discard(db, ("task", 1))
+    memo_get(db, ("task", 1), loader)
+
+    assert loader.call_count == 2
+
+
+def test_task_loaded_once_in_dependency_chain():
+    task_id, user_id = uuid4(), uuid4()
+    db = bound_session()
+    task = MagicMock(id=task_id, project_id=uuid4())
+    db.query.return_value.options.return_value.filter.return_value.first.return_value = task
+
+    with patch("app.repositories.project_member.is_project_member", return_value=True):
+        # Dependency loads the task, then the service checks access on it again
+        loaded = task_repo.get_task_by_id(db, task_id)
+        has_access = task_service.check_task_access(db, task_id, user_id)
+
+    assert loaded is task
+    assert has_access is True
+    db.query.assert_called_once()
+
+
+def test_orm_statements_are_counted():
+    request = make_request()
+    engine = create_engine("sqlite://")
+    with Session(engine) as db:
+        bind_request_memo(db, request)
+        db.execute(select(1))
+        db.execute(select(2))
+    assert request.state.db_stats.queries == 2
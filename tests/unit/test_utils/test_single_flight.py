@@ -0,0 +1,147 @@
+import asyncio
+import threading
+import time
+import pytest
+import redis
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core import single_flight
+from app.core.single_flight import get_or_compute, get_or_compute_async
+
+
+def entry(value, stale_in=60):
+    return {"data": value, "_stale_at": str(time.time() + stale_in)}
+
+
+def make_redis(cached=None, lock_free=True):
+    redis_mock = MagicMock()
+    redis_mock.hgetall.return_value = cached or {}
+    redis_mock.set.return_value = lock_free
+    return redis_mock
+
+
+def test_fresh_entry_skips_compute():
+    redis_mock = make_redis(entry("cached"))
+    compute = MagicMock()
+
+    assert get_or_compute(redis_mock, "k", compute, 60) == {"data": "cached"}
+    compute.assert_not_called()
+    redis_mock.set.assert_not_called()
+
+
+def test_miss_computes_under_lock_and_stores():
+    redis_mock = make_redis()
+    compute = MagicMock(return_value={"data": "fresh"})
+
+    assert get_or_compute(redis_mock, "k", compute, 60) == {"data": "fresh"}
+    compute.assert_called_once()
+    redis_mock.set.assert_called_once()
+    assert redis_mock.set.call_args.args[0] == "k:lock"
+    assert redis_mock.pipeline.return_value.hset.call_args.kwargs["mapping"]["data"] == "fresh"
+    redis_mock.eval.assert_called_once()
+
+
+def test_lock_holder_of_stale_entry_gets_refreshed_value():
+    redis_mock = make_redis(entry("old", stale_in=-1))
+    compute = MagicMock(return_value={"data": "new"})
+
+    assert get_or_compute(redis_mock, "k", compute, 60) == {"data": "new"}
+    compute.assert_called_once()
+
+
+def test_stale_entry_is_served_without_refresh_when_locked():
+    redis_mock = make_redis(entry("old", stale_in=-1), lock_free=False)
+    compute = MagicMock()
+
+    assert get_or_compute(redis_mock, "k", compute, 60) == {"data": "old"}
+    compute.assert_not_called()
+
+
+def test_waits_for_other_process_holding_the_lock():
+    redis_mock = make_redis(lock_free=False)
+    redis_mock.hgetall.side_effect = [{}, {}, entry("filled")]
+    compute = MagicMock()
+
+    with patch.object(single_flight, "_WAIT_STEP", 0):
+        assert get_or_compute(redis_mock, "k", compute, 60) == {"data": "filled"}
+    compute.assert_not_called()
+
+
+@pytest.mark.parametrize("failing", ["set", "eval", "pipeline"])
+def test_redis_errors_after_the_read_fall_back_to_computed_value(failing):
+    redis_mock = make_redis()
+    getattr(redis_mock, failing).side_effect = redis.ConnectionError("down")
+    compute = MagicMock(return_value={"data": "fresh"})
+
+    assert get_or_compute(redis_mock, "k", compute, 60) == {"data": "fresh"}
+
+
+def test_redis_error_while_waiting_for_lock_holder_computes():
+    redis_mock = make_redis(lock_free=False)
+    redis_mock.hgetall.side_effect = [{}, redis.ConnectionError("down")]
+    compute = MagicMock(return_value={"data": "fresh"})
+
+    with patch.object(single_flight, "_WAIT_STEP", 0):
+        assert get_or_compute(redis_mock, "k", compute, 60) == {"data": "fresh"}
+
+
+def test_follower_computes_when_leader_outlasts_lock_timeout():
+    redis_mock = make_redis()
+    release = threading.Event()
+
+    def slow_compute():
+        release.wait(2)
+        return {"data": "leader"}
+
+    leader = threading.Thread(target=lambda: get_or_compute(redis_mock, "slow", slow_compute, 60))
+    leader.start()
+    time.sleep(0.05)
+    try:
+        with patch.object(single_flight.settings, "cache_lock_timeout_ms", 50):
+            assert get_or_compute(redis_mock, "slow", lambda: {"data": "own"}, 60) == {"data": "own"}
+    finally:
+        release.set()
+        leader.join()
+
+
+def test_concurrent_misses_in_process_compute_once():
+    redis_mock = make_redis()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"data": "fresh"}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_or_compute(redis_mock, "k", compute, 60)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"data": "fresh"}] * 5
+
+
+@pytest.mark.asyncio
+async def test_concurrent_async_misses_compute_once():
+    redis_mock = MagicMock()
+    redis_mock.hgetall = AsyncMock(return_value={})
+    redis_mock.set = AsyncMock(return_value=True)
+    redis_mock.eval = AsyncMock(return_value=1)
+    redis_mock.pipeline.return_value.execute = AsyncMock(return_value=[])
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"data": "fresh"}
+
+    results = await asyncio.gather(*[get_or_compute_async(redis_mock, "k", compute, 60) for _ in range(5)])
+
+    assert len(calls) == 1
+    assert results == [{"data": "fresh"}] * 5